@@ -0,0 +1,641 @@
+"""
+Benchmarks Module
+Micro-benchmarks for the pipeline's hot spots, run against the bundled corpus.
+
+Usage:
+    python src/benchmarks.py {scanner,noise,matcher,memory,embeddings,anchors,corpus,reduction,writers,final,columnar,sqlite,refine,all} [input_dir]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import re
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Iterable
+
+import numpy as np
+import spacy
+from sklearn.cluster import KMeans
+
+if __name__ == "__main__" and __package__ is None:
+    # Add the parent directory to sys.path to allow relative imports
+    file_path = Path(__file__).resolve()
+    sys.path.append(str(file_path.parent.parent))
+    __package__ = file_path.parent.name
+
+from .file_reader import get_all_job_descriptions
+from .preprocessor import preprocess_text
+from .extractor import CandidateTerm, KeywordExtractor, merge_candidates, scan_signals
+from . import filters
+from .filters import filter_candidates, noise_rules
+from .nlp_models import DEFAULT_MODEL
+from .term_store import TermStore
+from .clean_keywords import clean_candidates, clean_keywords
+from .refine_engine import MASTER_SKILLS_FILE, load_rules, run_refine_chain
+from .output_writer import (
+    aggregate_candidates,
+    write_by_company,
+    write_json,
+    write_json_stream,
+    write_manual_review_template,
+    write_filtered_candidates,
+    write_raw_candidates,
+    write_summary_stats,
+)
+from .sqlite_sink import companies_mentioning, write_sqlite
+from .columnar_export import read_candidate_table, require_pyarrow, write_candidate_table
+from .clusterer import DEFAULT_REDUCED_DIMENSIONS, REDUCTION_METHODS, TermClusterer
+
+
+DEFAULT_INPUT = Path(__file__).parent.parent / "job descriptions"
+
+
+def time_best(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Best-of-N wall time of fn() in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def load_corpus_texts(input_dir: str | Path = DEFAULT_INPUT) -> list[str]:
+    """Read and preprocess every job description in input_dir."""
+    return [preprocess_text(jd.content) for jd in get_all_job_descriptions(input_dir)]
+
+
+def print_comparison(title: str, rows: Iterable[tuple[str, str]]) -> None:
+    """Print a small aligned two-column report."""
+    print(title)
+    print("-" * 50)
+    for label, value in rows:
+        print(f"  {label:<28} {value}")
+    print()
+
+
+def bench_signal_scanner(texts: list[str], repeat: int = 5) -> None:
+    """Compare the per-signal re.findall passes with the single-pass scanner."""
+    extractor = KeywordExtractor()
+
+    def multi_pass():
+        return [
+            (
+                extractor.extract_camelcase(text),
+                extractor.extract_allcaps(text),
+                extractor.extract_special_patterns(text),
+                extractor.extract_single_tech_words(text),
+            )
+            for text in texts
+        ]
+
+    def single_pass():
+        return [scan_signals(text) for text in texts]
+
+    # Both must find exactly the same terms
+    for (camel, caps, special, single), scanned in zip(multi_pass(), single_pass()):
+        assert scanned == {
+            "camelcase": camel,
+            "allcaps": caps,
+            "special_pattern": special,
+            "single_word": single,
+        }
+
+    total_chars = sum(len(text) for text in texts)
+    multi_time = time_best(multi_pass, repeat)
+    single_time = time_best(single_pass, repeat)
+
+    print_comparison(
+        f"REGEX SIGNALS ({len(texts)} docs, {total_chars:,} chars)",
+        [
+            ("extract_* methods", f"{total_chars / multi_time:,.0f} chars/sec"),
+            ("scan_signals", f"{total_chars / single_time:,.0f} chars/sec"),
+            ("speedup", f"{multi_time / single_time:.2f}x"),
+        ]
+    )
+
+
+def bench_noise_rules(texts: list[str], repeat: int = 5) -> None:
+    """Time the noise rule table over the regex-signal terms found in the corpus."""
+    terms = sorted({term for text in texts for found in scan_signals(text).values() for term in found})
+
+    def evaluate():
+        return [noise_rules.first_match(term) for term in terms]
+
+    elapsed = time_best(evaluate, repeat)
+    print_comparison(
+        f"NOISE RULES ({len(terms):,} terms, {len(noise_rules.rules)} rules)",
+        [
+            ("first_match", f"{len(terms) / elapsed:,.0f} terms/sec"),
+            ("flagged as noise", f"{sum(name is not None for name in evaluate()):,}"),
+        ]
+    )
+
+    noise_rules.reset_stats()
+    noise_rules.collect_stats = True
+    try:
+        evaluate()
+    finally:
+        noise_rules.collect_stats = False
+    print("\n".join(noise_rules.stats_report()))
+    print()
+
+
+def bench_term_matcher(texts: list[str], repeat: int = 5) -> None:
+    """Compare the old suffix/prefix/phrase loops in is_likely_tech_term with the automata."""
+    terms = sorted({term for text in texts for found in scan_signals(text).values() for term in found})
+    phrase_patterns = [
+        re.compile(pattern) for pattern in [
+            r"machine\s+learning", r"deep\s+learning", r"neural\s+network", r"data\s+structure",
+            r"distributed\s+system", r"version\s+control", r"object[- ]oriented",
+            r"functional\s+programming", r"micro\s*service", r"event[- ]driven", r"test[- ]driven",
+            r"continuous\s+(integration|delivery|deployment)", r"ci[/\s]*cd", r"rest\s*api",
+            r"web\s+service", r"cloud\s+(native|computing)", r"container\s*ization", r"code\s+review",
+        ]
+    ]
+    suffixes = sorted(filters.TECH_SUFFIXES.patterns)
+    prefixes = sorted(filters.TECH_PREFIXES.patterns)
+
+    def loops(term: str) -> bool:
+        term_lower = term.lower().strip()
+        return (
+            any(term_lower.endswith(suffix) and len(term) > len(suffix) for suffix in suffixes)
+            or any(term_lower.startswith(prefix) for prefix in prefixes)
+            or any(pattern.search(term_lower) for pattern in phrase_patterns)
+        )
+
+    def automata(term: str) -> bool:
+        term_lower = term.lower().strip()
+        return (
+            any(len(term) > len(suffix) for suffix in filters.TECH_SUFFIXES.suffixes_of(term_lower))
+            or filters.TECH_PREFIXES.starts_with_any(term_lower)
+            or filters.TECH_PHRASES.contains_any(" ".join(term_lower.split()))
+        )
+
+    assert [loops(term) for term in terms] == [automata(term) for term in terms]
+
+    loop_time = time_best(lambda: [loops(term) for term in terms], repeat)
+    automaton_time = time_best(lambda: [automata(term) for term in terms], repeat)
+    filter_time = time_best(lambda: [filters.is_likely_tech_term(term) for term in terms], repeat)
+
+    print_comparison(
+        f"TECH SUFFIX/PREFIX/PHRASE LOOKUPS ({len(terms):,} terms)",
+        [
+            ("loops + re.search", f"{loop_time / len(terms) * 1e6:.2f} us/term"),
+            ("TermMatcher", f"{automaton_time / len(terms) * 1e6:.2f} us/term"),
+            ("speedup", f"{loop_time / automaton_time:.2f}x"),
+            ("is_likely_tech_term (total)", f"{filter_time / len(terms) * 1e6:.2f} us/term"),
+        ]
+    )
+
+
+def traced_size(build: Callable[[], object]) -> tuple[object, int]:
+    """Run build() and return its result with the traced memory it still holds, in bytes."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = build()
+        return result, tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+
+
+def traced_peak(run: Callable[[], object]) -> int:
+    """Peak traced memory allocated while run() executes, in bytes."""
+    tracemalloc.start()
+    try:
+        run()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_writers(input_dir: str | Path) -> None:
+    """Compare peak memory of writing the raw candidates as one document versus streaming them."""
+    extractor = KeywordExtractor()
+    store = TermStore()
+    for jd in get_all_job_descriptions(input_dir):
+        store.add(extractor.extract_candidates(preprocess_text(jd.content), jd.company))
+    views = list(store.values())
+
+    def records():
+        return (
+            {
+                "term": c.term,
+                "count": c.count,
+                "num_sources": len(c.sources),
+                "sources": sorted(c.sources),
+                "signals": sorted(c.signals),
+                "original_forms": sorted(c.original_forms)
+            }
+            for c in views
+        )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "candidates.json"
+        built_peak = traced_peak(lambda: write_json({"metadata": {}, "candidates": list(records())}, path))
+        built = path.read_bytes()
+        streamed_peak = traced_peak(
+            lambda: write_json_stream(lambda: {"metadata": {}, "candidates": records()}, path)
+        )
+        assert path.read_bytes() == built
+
+    print_comparison(
+        f"JSON WRITERS ({len(views):,} candidates, {len(built) / 1e6:.1f} MB of JSON)",
+        [
+            ("build + json.dump", f"{built_peak / 1e6:.2f} MB peak"),
+            ("write_json_stream", f"{streamed_peak / 1e6:.2f} MB peak"),
+            ("reduction", f"{built_peak / streamed_peak:.1f}x"),
+        ]
+    )
+
+
+def bench_final_outputs(input_dir: str | Path, repeat: int = 5) -> None:
+    """Compare step 6 with per-writer sorting and company maps versus shared aggregates and concurrent writers."""
+    extractor = KeywordExtractor()
+    job_descriptions = get_all_job_descriptions(input_dir)
+    store = TermStore()
+    for jd in job_descriptions:
+        store.add(extractor.extract_candidates(preprocess_text(jd.content), jd.company))
+    candidates = dict(store.items())
+    matrix = store.matrix()
+
+    def sequential():
+        with tempfile.TemporaryDirectory() as tmp:
+            write_manual_review_template(candidates, Path(tmp))
+            write_by_company(candidates, Path(tmp), matrix)
+            write_summary_stats(candidates, len(job_descriptions), Path(tmp), matrix)
+
+    def shared():
+        with tempfile.TemporaryDirectory() as tmp, ThreadPoolExecutor(max_workers=3) as pool:
+            aggregates = aggregate_candidates(candidates, matrix)
+            futures = [
+                pool.submit(write_manual_review_template, candidates, Path(tmp), True, aggregates),
+                pool.submit(write_by_company, candidates, Path(tmp), matrix, True, aggregates),
+                pool.submit(write_summary_stats, candidates, len(job_descriptions), Path(tmp), matrix, True, aggregates),
+            ]
+            for future in futures:
+                future.result()
+
+    sequential_time = time_best(sequential, repeat)
+    shared_time = time_best(shared, repeat)
+    aggregate_time = time_best(lambda: aggregate_candidates(candidates, matrix), repeat)
+    print_comparison(
+        f"FINAL OUTPUTS ({len(candidates):,} candidates)",
+        [
+            ("per-writer aggregation", f"{sequential_time * 1000:,.1f} ms"),
+            ("shared + concurrent", f"{shared_time * 1000:,.1f} ms"),
+            ("  of which aggregation", f"{aggregate_time * 1000:,.1f} ms"),
+            ("speedup", f"{sequential_time / shared_time:.2f}x"),
+        ]
+    )
+
+
+def bench_columnar(input_dir: str | Path, repeat: int = 5) -> None:
+    """Compare loading the raw candidates from JSON with the Arrow and Parquet exports."""
+    try:
+        require_pyarrow()
+    except ImportError as e:
+        print(f"Skipping columnar benchmark: {e}")
+        return
+
+    extractor = KeywordExtractor()
+    job_descriptions = get_all_job_descriptions(input_dir)
+    store = TermStore()
+    for jd in job_descriptions:
+        store.add(extractor.extract_candidates(preprocess_text(jd.content), jd.company))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        write_raw_candidates(store, tmp, len(job_descriptions), txt=False)
+        json_path = tmp / "1_raw_candidates.json"
+        paths = {fmt: write_candidate_table(store, tmp / "1_raw_candidates", fmt) for fmt in ("arrow", "parquet")}
+
+        def load_json():
+            with open(json_path, "r", encoding="utf-8") as f:
+                return json.load(f)["candidates"]
+
+        def count_total_json():
+            return sum(c["count"] for c in load_json())
+
+        rows = [("json load", f"{time_best(load_json, repeat) * 1000:,.1f} ms "
+                              f"({json_path.stat().st_size / 1e6:.1f} MB)")]
+        for fmt, path in paths.items():
+            load_time = time_best(lambda: read_candidate_table(path), repeat)
+            rows.append((f"{fmt} load", f"{load_time * 1000:,.1f} ms ({path.stat().st_size / 1e6:.1f} MB)"))
+
+        # Summing one column: JSON has to parse everything, the columnar files read one column
+        rows.append(("json count sum", f"{time_best(count_total_json, repeat) * 1000:,.1f} ms"))
+        for fmt, path in paths.items():
+            column_time = time_best(
+                lambda: read_candidate_table(path, ["count"]).column("count").to_numpy().sum(), repeat
+            )
+            rows.append((f"{fmt} count sum", f"{column_time * 1000:,.1f} ms"))
+
+    print_comparison(f"CANDIDATE TABLE LOAD ({len(store):,} candidates)", rows)
+
+
+def bench_sqlite(input_dir: str | Path, repeat: int = 5, terms: tuple[str, ...] = ("python", "docker")) -> None:
+    """Compare answering "which companies mention all of these terms?" from JSON and from the SQLite sink."""
+    extractor = KeywordExtractor()
+    store = TermStore()
+    for jd in get_all_job_descriptions(input_dir):
+        store.add(extractor.extract_candidates(preprocess_text(jd.content), jd.company))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        write_raw_candidates(store, tmp, store.num_documents, txt=False)
+        json_path = tmp / "1_raw_candidates.json"
+        load_time = time_best(lambda: write_sqlite(store, tmp / "candidates.db", store.matrix()), 1)
+
+        def from_json():
+            with open(json_path, "r", encoding="utf-8") as f:
+                candidates = json.load(f)["candidates"]
+            company_sets = [set(c["sources"]) for c in candidates if c["term"].lower() in terms]
+            return sorted(set.intersection(*company_sets)) if len(company_sets) == len(terms) else []
+
+        connection = sqlite3.connect(tmp / "candidates.db")
+        try:
+            assert from_json() == companies_mentioning(connection, terms)
+            json_time = time_best(from_json, repeat)
+            sqlite_time = time_best(lambda: companies_mentioning(connection, terms), repeat)
+        finally:
+            connection.close()
+
+    print_comparison(
+        f"COMPANIES MENTIONING {' AND '.join(terms).upper()} ({len(store):,} terms)",
+        [
+            ("json load + scan", f"{json_time * 1000:,.2f} ms"),
+            ("sqlite query", f"{sqlite_time * 1000:,.2f} ms"),
+            ("speedup", f"{json_time / sqlite_time:,.0f}x"),
+            ("sqlite bulk load", f"{load_time * 1000:,.1f} ms (once per run)"),
+        ]
+    )
+
+
+def bench_refine(input_dir: str | Path, repeat: int = 5) -> None:
+    """Compare the file-to-file clean -> refine handoff with the in-memory chain."""
+    extractor = KeywordExtractor()
+    store = TermStore()
+    company_names = set()
+    for jd in get_all_job_descriptions(input_dir):
+        company_names.add(jd.company)
+        store.add(extractor.extract_candidates(preprocess_text(jd.content), jd.company))
+    filtered, removed = filter_candidates(store, company_names)
+    rules = load_rules("v3")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+
+        def via_files():
+            # As the scripts ran: text report -> 7_cleaned -> refined dictionary
+            write_filtered_candidates(filtered, removed, tmp, 2)
+            clean_keywords(tmp / "2_filtered_candidates.txt", tmp / "7_cleaned_tech_dictionary.json")
+            with open(tmp / "7_cleaned_tech_dictionary.json", "r", encoding="utf-8") as f:
+                keywords = json.load(f)["keywords"]
+            write_json(rules.dictionary(rules.refine(keywords)), tmp / f"disk_{MASTER_SKILLS_FILE}")
+
+        def in_memory():
+            run_refine_chain(clean_candidates(filtered), tmp)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            via_files_time = time_best(via_files, repeat)
+            in_memory_time = time_best(in_memory, repeat)
+        assert (tmp / MASTER_SKILLS_FILE).read_bytes() == (tmp / f"disk_{MASTER_SKILLS_FILE}").read_bytes()
+
+    print_comparison(
+        f"CLEAN -> REFINE ({len(filtered):,} filtered candidates)",
+        [
+            ("report files + re-parse", f"{via_files_time * 1000:,.1f} ms"),
+            ("in memory", f"{in_memory_time * 1000:,.1f} ms"),
+            ("speedup", f"{via_files_time / in_memory_time:.1f}x"),
+        ]
+    )
+
+
+def bench_term_store(input_dir: str | Path) -> None:
+    """Compare the memory held by the merged dict of CandidateTerms with a TermStore."""
+    extractor = KeywordExtractor()
+    job_descriptions = get_all_job_descriptions(input_dir)
+    documents = [
+        extractor.extract_candidates(preprocess_text(jd.content), jd.company)
+        for jd in job_descriptions
+    ]
+
+    def build_store(keep_documents: bool = False):
+        store = TermStore(keep_documents)
+        for candidates in documents:
+            store.add(candidates)
+        return store
+
+    merged, dict_bytes = traced_size(lambda: merge_candidates(documents))
+    store, store_bytes = traced_size(build_store)
+    _, documents_bytes = traced_size(lambda: build_store(keep_documents=True))
+    assert list(merged) == list(store)
+
+    print_comparison(
+        f"MERGED TERMS ({len(store):,} terms, {len(store.companies)} companies, {len(documents)} docs)",
+        [
+            ("dict[str, CandidateTerm]", f"{dict_bytes / 1e6:.2f} MB"),
+            ("TermStore", f"{store_bytes / 1e6:.2f} MB"),
+            ("TermStore (keep_documents)", f"{documents_bytes / 1e6:.2f} MB"),
+            ("reduction", f"{dict_bytes / store_bytes:.1f}x"),
+        ]
+    )
+
+
+def synthetic_documents(
+    num_companies: int, terms_per_document: int = 40, vocabulary: int = 50000, seed: int = 42
+) -> list[dict[str, CandidateTerm]]:
+    """One document per company, with Zipf-distributed terms (a few common, a long tail of rare ones)."""
+    rng = np.random.default_rng(seed)
+    documents = []
+    for i in range(num_companies):
+        company = f"company_{i:06d}"
+        ranks = np.minimum(rng.zipf(1.2, terms_per_document), vocabulary)
+        documents.append({
+            f"term_{rank}": CandidateTerm(f"term_{rank}", {f"term_{rank}"}, {company}, 1, {"noun_chunk"})
+            for rank in ranks.tolist()
+        })
+    return documents
+
+
+def bench_term_store_many_companies(num_companies: int = 20000, repeat: int = 3) -> None:
+    """Compare company sources held as ID arrays with the bitmasks they replaced, on a synthetic corpus."""
+    documents = synthetic_documents(num_companies)
+
+    def build_store():
+        store = TermStore()
+        for candidates in documents:
+            store.add(candidates)
+        return store
+
+    store, store_bytes = traced_size(build_store)
+    build_time = time_best(build_store, repeat)
+    id_bytes = sum(sys.getsizeof(record.sources) for record in store.records)
+    mask_bytes = sum(sys.getsizeof(sum(1 << id_ for id_ in record.sources)) for record in store.records)
+
+    print_comparison(
+        f"MANY COMPANIES ({len(store):,} terms, {len(store.companies):,} companies, synthetic)",
+        [
+            ("TermStore", f"{store_bytes / 1e6:.2f} MB, built in {build_time:.2f}s"),
+            ("sources as ID arrays", f"{id_bytes / 1e6:.2f} MB"),
+            ("sources as bitmasks", f"{mask_bytes / 1e6:.2f} MB"),
+            ("reduction", f"{mask_bytes / id_bytes:.1f}x"),
+        ]
+    )
+
+
+def bench_embeddings(texts: list[str], repeat: int = 5, num_terms: int = 3000) -> None:
+    """Compare per-term doc.vector lookups with the batched get_embeddings."""
+    terms = sorted({term for text in texts for found in scan_signals(text).values() for term in found})[:num_terms]
+    clusterer = TermClusterer()
+
+    def per_term():
+        return np.array([clusterer.nlp(term).vector for term in terms])
+
+    def batched():
+        return clusterer.get_embeddings(terms)[0]
+
+    # Same float32 values, bit for bit
+    assert np.array_equal(per_term(), batched())
+
+    per_term_time = time_best(per_term, repeat)
+    batched_time = time_best(batched, repeat)
+    print_comparison(
+        f"EMBEDDINGS ({len(terms):,} terms)",
+        [
+            ("nlp(term).vector", f"{len(terms) / per_term_time:,.0f} terms/sec"),
+            ("get_embeddings", f"{len(terms) / batched_time:,.0f} terms/sec"),
+            ("speedup", f"{per_term_time / batched_time:.2f}x"),
+        ]
+    )
+
+
+def bench_anchor_seeding(texts: list[str], repeat: int = 5, num_clusters: int = 8) -> None:
+    """Compare k-means with ten k-means++ inits against one anchor-seeded init."""
+    terms = sorted({term for text in texts for found in scan_signals(text).values() for term in found})
+    clusterer = TermClusterer()
+    matrix, valid = clusterer.get_embeddings(terms)
+    embeddings = matrix[valid]
+    seeds = clusterer._anchor_seeds(embeddings, num_clusters)
+
+    def random_init():
+        return KMeans(n_clusters=num_clusters, random_state=42, n_init=10).fit(embeddings)
+
+    def anchor_init():
+        return KMeans(n_clusters=num_clusters, random_state=42, init=seeds, n_init=1).fit(embeddings)
+
+    random_model = random_init()
+    anchor_model = anchor_init()
+    random_time = time_best(random_init, repeat)
+    anchor_time = time_best(anchor_init, repeat)
+    print_comparison(
+        f"ANCHOR SEEDING ({len(embeddings):,} terms, k={num_clusters})",
+        [
+            ("k-means++ x10", f"{random_time * 1000:,.0f} ms, inertia {random_model.inertia_:,.1f}"),
+            ("anchor-seeded x1", f"{anchor_time * 1000:,.0f} ms, {anchor_model.n_iter_} iterations, "
+                                 f"inertia {anchor_model.inertia_:,.1f}"),
+            ("speedup", f"{random_time / anchor_time:.2f}x"),
+        ]
+    )
+
+
+def bench_corpus_embeddings(input_dir: str | Path, repeat: int = 5, num_clusters: int = 8) -> None:
+    """Compare spaCy word vectors with PPMI + SVD corpus embeddings on the filtered terms."""
+    extractor = KeywordExtractor()
+    job_descriptions = get_all_job_descriptions(input_dir)
+    store = TermStore(keep_documents=True)
+    for jd in job_descriptions:
+        store.add(extractor.extract_candidates(preprocess_text(jd.content), jd.company))
+    filtered, _ = filter_candidates(store, {jd.company for jd in job_descriptions})
+    matrix = store.matrix().rows(list(filtered))
+    terms = [candidate.term for candidate in filtered.values()]
+
+    # What a fresh process pays before it can embed anything
+    load_time = time_best(lambda: spacy.load(DEFAULT_MODEL), 1)
+    spacy_clusterer = TermClusterer()
+    corpus_clusterer = TermClusterer(embedding_source="corpus")
+    fit_time = time_best(lambda: corpus_clusterer.fit_corpus_embeddings(matrix, terms), repeat)
+
+    rows = []
+    for name, clusterer, setup_time in (("spacy", spacy_clusterer, load_time), ("corpus", corpus_clusterer, fit_time)):
+        _, valid = clusterer.get_embeddings(terms)
+        cluster_time = time_best(lambda: clusterer.cluster_terms(filtered, num_clusters), repeat)
+        rows.append((f"{name} setup", f"{setup_time:.2f}s ({'model load' if name == 'spacy' else 'PPMI + SVD fit'})"))
+        rows.append((f"{name} coverage", f"{int(valid.sum()):,}/{len(terms):,} terms"))
+        rows.append((f"{name} clustering", f"{len(terms) / cluster_time:,.0f} terms/sec"))
+
+    print_comparison(f"CORPUS EMBEDDINGS ({len(terms):,} terms, {len(job_descriptions)} docs, k={num_clusters})", rows)
+
+
+def bench_reduction(
+    texts: list[str],
+    repeat: int = 5,
+    dimensions: int = DEFAULT_REDUCED_DIMENSIONS
+) -> None:
+    """Compare clustering (k-selection included) on raw and reduced embeddings."""
+    terms = sorted({term for text in texts for found in scan_signals(text).values() for term in found})
+    candidates = {term.lower(): CandidateTerm(term=term) for term in terms}
+
+    rows = []
+    baseline_time = None
+    for method in (None, *REDUCTION_METHODS):
+        clusterer = TermClusterer(reduction=method, reduced_dimensions=dimensions)
+        result = clusterer.cluster_terms(candidates)
+        cluster_time = time_best(lambda: clusterer.cluster_terms(candidates), repeat)
+        baseline_time = baseline_time or cluster_time
+
+        name = method or "none"
+        reduced = result.reduction
+        if reduced is not None:
+            variance = "n/a" if reduced.explained_variance is None else f"{reduced.explained_variance:.3f}"
+            rows.append((f"{name} dims", f"{reduced.dimensions[0]} -> {reduced.dimensions[1]}, "
+                                         f"explained variance {variance}"))
+        unreduced = result.unreduced_silhouette_score
+        rows.append((f"{name} silhouette", f"{result.silhouette_score} (k={result.num_clusters}"
+                                           f"{'' if unreduced is None else f', {unreduced} unreduced'})"))
+        rows.append((f"{name} time", f"{cluster_time:.2f}s ({baseline_time / cluster_time:.2f}x)"))
+
+    print_comparison(f"REDUCTION ({len(candidates):,} terms, {dimensions} dims)", rows)
+
+
+BENCHMARKS = {
+    "scanner": lambda args: bench_signal_scanner(load_corpus_texts(args.input_dir), args.repeat),
+    "noise": lambda args: bench_noise_rules(load_corpus_texts(args.input_dir), args.repeat),
+    "matcher": lambda args: bench_term_matcher(load_corpus_texts(args.input_dir), args.repeat),
+    "memory": lambda args: (bench_term_store(args.input_dir), bench_term_store_many_companies(repeat=args.repeat)),
+    "embeddings": lambda args: bench_embeddings(load_corpus_texts(args.input_dir), args.repeat),
+    "anchors": lambda args: bench_anchor_seeding(load_corpus_texts(args.input_dir), args.repeat),
+    "corpus": lambda args: bench_corpus_embeddings(args.input_dir, args.repeat),
+    "reduction": lambda args: bench_reduction(load_corpus_texts(args.input_dir), args.repeat),
+    "writers": lambda args: bench_writers(args.input_dir),
+    "final": lambda args: bench_final_outputs(args.input_dir, args.repeat),
+    "columnar": lambda args: bench_columnar(args.input_dir, args.repeat),
+    "sqlite": lambda args: bench_sqlite(args.input_dir, args.repeat),
+    "refine": lambda args: bench_refine(args.input_dir, args.repeat),
+}
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Run keyword-extractor micro-benchmarks.")
+    parser.add_argument("benchmark", choices=[*BENCHMARKS, "all"])
+    parser.add_argument("input_dir", nargs="?", type=Path, default=DEFAULT_INPUT)
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per variant (best is reported)")
+    args = parser.parse_args()
+
+    names = list(BENCHMARKS) if args.benchmark == "all" else [args.benchmark]
+    for name in names:
+        BENCHMARKS[name](args)
+
+
+if __name__ == "__main__":
+    main()
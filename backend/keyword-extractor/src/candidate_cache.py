@@ -0,0 +1,154 @@
+"""
+Candidate Cache Module
+Handles the on-disk cache of per-document extraction results.
+"""
+
+import hashlib
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from spacy.util import get_package_version
+
+from .file_reader import JobDescription
+from .extractor import CandidateTerm, EXTRACTOR_VERSION
+from .nlp_models import DEFAULT_MODEL
+
+
+def cache_config(model_name: str = DEFAULT_MODEL) -> dict:
+    """Everything besides document content that affects extraction output."""
+    return {
+        "extractor_version": EXTRACTOR_VERSION,
+        "model": model_name,
+        "model_version": get_package_version(model_name),
+    }
+
+
+class CandidateCache:
+    """
+    Content-addressed cache of extract_candidates results.
+
+    Entries are keyed by a hash of the document content plus the extractor
+    config, so editing a file, bumping EXTRACTOR_VERSION or upgrading the
+    spaCy model all invalidate it. Companies come from filenames, not
+    content, so they're stored separately from the entry and re-attached
+    on load.
+    """
+
+    def __init__(self, cache_dir: str | Path, config: dict | None = None):
+        self.cache_dir = Path(cache_dir)
+        self.config_json = json.dumps(config or cache_config(), sort_keys=True)
+        self.hits = 0
+        self.misses = 0
+
+    def key_for(self, content: str) -> str:
+        """Cache key for a document's raw content."""
+        digest = hashlib.sha256()
+        digest.update(self.config_json.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(content.encode("utf-8"))
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def contains(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def load(self, key: str, company: str) -> dict[str, CandidateTerm]:
+        """Load a cached entry, attributing every term to company."""
+        with open(self._path(key), "r", encoding="utf-8") as f:
+            records = json.load(f)
+
+        return {
+            record["key"]: CandidateTerm(
+                term=record["term"],
+                original_forms=set(record["original_forms"]),
+                sources={company},
+                count=record["count"],
+                signals=set(record["signals"])
+            )
+            for record in records
+        }
+
+    def store(self, key: str, candidates: dict[str, CandidateTerm]) -> None:
+        """Write an entry, keeping the dict's insertion order."""
+        records = [
+            {
+                "key": key_,
+                "term": c.term,
+                "count": c.count,
+                "signals": sorted(c.signals),
+                "original_forms": sorted(c.original_forms)
+            }
+            for key_, c in candidates.items()
+        ]
+
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file first so an interrupted run can't leave a truncated entry
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(records, f, ensure_ascii=False, separators=(",", ":"))
+        tmp_path.replace(path)
+
+    def extract_with_cache(
+        self,
+        job_descriptions: Iterable[JobDescription],
+        extract: Callable[[list[JobDescription]], Iterable[dict[str, CandidateTerm]]],
+        window: int = 256
+    ) -> Iterator[dict[str, CandidateTerm]]:
+        """
+        Get per-document candidates, only running extract on cache misses.
+
+        Documents are looked up window at a time, so job_descriptions can be
+        a stream and only one window of content is held in memory. Results
+        are yielded in input order, so merging is unaffected by the cache.
+        Hits and misses are counted as windows are looked up (see self.hits
+        / self.misses).
+
+        Args:
+            job_descriptions: Documents to process
+            extract: Extraction function, called once per window with its misses
+            window: Number of documents looked up at a time
+
+        Yields:
+            Per-document candidate dictionaries
+        """
+        self.hits = 0
+        self.misses = 0
+        documents = iter(job_descriptions)
+
+        while window_jds := list(islice(documents, window)):
+            keys = [self.key_for(jd.content) for jd in window_jds]
+            is_hit = [self.contains(key) for key in keys]
+            misses = [jd for jd, hit in zip(window_jds, is_hit) if not hit]
+            self.hits += len(window_jds) - len(misses)
+            self.misses += len(misses)
+
+            extracted = iter(extract(misses)) if misses else iter(())
+            yield from self._iter_results(window_jds, keys, is_hit, extracted, extract)
+
+    def _iter_results(
+        self,
+        job_descriptions: list[JobDescription],
+        keys: list[str],
+        is_hit: list[bool],
+        extracted: Iterator[dict[str, CandidateTerm]],
+        extract: Callable[[list[JobDescription]], Iterable[dict[str, CandidateTerm]]]
+    ) -> Iterator[dict[str, CandidateTerm]]:
+        """Interleave cached entries with freshly extracted (and now cached) ones."""
+        for jd, key, hit in zip(job_descriptions, keys, is_hit):
+            if hit:
+                try:
+                    candidates = self.load(key, jd.company)
+                except (OSError, ValueError, KeyError) as e:
+                    print(f"Warning: Ignoring unreadable cache entry for {jd.filename}: {e}")
+                    candidates = next(iter(extract([jd])))
+                    self.store(key, candidates)
+            else:
+                candidates = next(extracted)
+                self.store(key, candidates)
+
+            yield candidates
@@ -1,68 +1,132 @@
-
 import json
 import re
+import sys
 from pathlib import Path
-
-def clean_keywords(input_file: Path, output_file: Path):
-    """
-    Reads a text file of keyword candidates, filters out noise,
-    and writes a clean JSON dictionary. Normalization is skipped.
-    """
-    print(f"Reading candidates from: {input_file}")
+from typing import Iterable, Mapping, Optional, Sequence
+
+if __name__ == "__main__" and __package__ is None:
+    # Add the parent directory to sys.path to allow relative imports
+    file_path = Path(__file__).resolve()
+    sys.path.append(str(file_path.parent.parent))
+    __package__ = file_path.parent.name
+
+from .extractor import CandidateTerm
+
+CLEANED_DESCRIPTION = "A cleaned dictionary of technical keywords extracted from job descriptions. Noise has been filtered, but keywords have not been normalized."
+
+# Blocklist for noise, company names, non-tech terms, and ambiguous acronyms
+# Compiled once, lowercased; keywords keep their casing and are compared lowercased
+BLOCKLIST = frozenset(term.lower() for term in {
+    "ad", "it", "os", "ts", "qa", "ux", "ui", "go", "ai",
+    "b2b", "saas", "ecommerce", "b2c",
+    "phd-level", "remotehunter", "ridecontroller", "leapxpert", "metlife",
+    "frostlocker", "capcenter", "golfforever", "myfundedfutures", "truecode",
+    "techcrunch", "liveramp", "seatgeek", "nerdwallet", "worldcoin", "foxg1",
+    "time100", "semianalysis", "iaxaI",
+    "code reviews", "peer code reviews", "conduct code reviews", "thoughtful code reviews",
+    "no use ai", "use ai",
+    # Company names spotted in the list
+    "remhunter", "ridecontroller", "leapxpert", "metlife", "frostlocker",
+    "capcenter", "golfforever", "myfundedfutures", "truecode", "techcrunch",
+    "liveramp", "spark capital", "seatgeek", "nerdwallet", "viegure",
+    "mywellatdell", "workhelio", "meeboss", "sigma360", "sofi", "stackadapter",
+    "shipbob", "truecar", "liveperson", "uipath", "bookwithmatrix", "leaderfactor",
+    "ivorycloud", "smartmark", "truneighbor", "venturebeat", "duckduckgo",
+    "biomerieux", "ebay inc.", "itradenetwork"
+})
+
+# A candidate line of the .txt report: "term (N occurrences, M sources)"
+CANDIDATE_LINE = re.compile(r"^(.*?)\s*\(\d+ occurrences, \d+ sources\)")
+
+
+def read_candidates_report(input_file: Path) -> list[str]:
+    """Recover the candidate terms from a 2_filtered_candidates.txt report."""
     with open(input_file, 'r') as f:
         lines = f.readlines()
 
-    candidate_regex = re.compile(r"^(.*?)\s*\(\d+ occurrences, \d+ sources\)")
-
     raw_keywords = []
     for line in lines:
-        match = candidate_regex.match(line)
+        match = CANDIDATE_LINE.match(line)
         if match:
             raw_keywords.append(match.group(1).strip())
+    return raw_keywords
 
-    print(f"Extracted {len(raw_keywords)} raw keywords.")
 
-    # --- Filtering ---
-
-    # Blocklist for noise, company names, non-tech terms, and ambiguous acronyms
-    # Keeping case sensitivity for now to avoid merging, but blocklist is lowercase
-    blocklist = {
-        "ad", "it", "os", "ts", "qa", "ux", "ui", "go", "ai",
-        "b2b", "saas", "ecommerce", "b2c",
-        "phd-level", "remotehunter", "ridecontroller", "leapxpert", "metlife",
-        "frostlocker", "capcenter", "golfforever", "myfundedfutures", "truecode",
-        "techcrunch", "liveramp", "seatgeek", "nerdwallet", "worldcoin", "foxg1",
-        "time100", "semianalysis", "iaxaI",
-        "code reviews", "peer code reviews", "conduct code reviews", "thoughtful code reviews",
-        "no use ai", "use ai",
-        # Company names spotted in the list
-        "remhunter", "ridecontroller", "leapxpert", "metlife", "frostlocker",
-        "capcenter", "golfforever", "myfundedfutures", "truecode", "techcrunch",
-        "liveramp", "spark capital", "seatgeek", "nerdwallet", "viegure",
-        "mywellatdell", "workhelio", "meeboss", "sigma360", "sofi", "stackadapter",
-        "shipbob", "truecar", "liveperson", "uipath", "bookwithmatrix", "leaderfactor",
-        "ivorycloud", "smartmark", "truneighbor", "venturebeat", "duckduckgo",
-        "biomerieux", "ebay inc.", "itradenetwork"
-    }
+def read_candidates_json(input_file: Path) -> list[str]:
+    """Read the candidate terms from a 2_filtered_candidates .json (indented or compact) or .ndjson file."""
+    with open(input_file, 'r', encoding='utf-8') as f:
+        if input_file.suffix == ".ndjson":
+            next(f, None)  # Metadata header
+            return [json.loads(line)["term"] for line in f if line.strip()]
+        return [candidate["term"] for candidate in json.load(f)["candidates"]]
+
+
+def load_candidate_keywords(input_file: Path) -> list[str]:
+    """Candidate terms from a filtered candidates file: structured JSON, or the legacy .txt report."""
+    if input_file.suffix == ".txt":
+        return read_candidates_report(input_file)
+    return read_candidates_json(input_file)
+
+
+def candidate_keywords(
+    filtered: Mapping[str, CandidateTerm],
+    sorted_candidates: Optional[Sequence[CandidateTerm]] = None
+) -> list[str]:
+    """
+    Candidate terms straight from filter_candidates' output, in the order the
+    filtered candidates files list them (so de-duplication keeps the same spellings).
+
+    Args:
+        filtered: Filtered candidates
+        sorted_candidates: filtered already in output order (CandidateAggregates.sorted_candidates)
+    """
+    if sorted_candidates is None:
+        sorted_candidates = sorted(filtered.values(), key=lambda x: (len(x.sources), x.count), reverse=True)
+    return [c.term.strip() for c in sorted_candidates]
+
+
+def clean_candidates(
+    filtered: Mapping[str, CandidateTerm],
+    sorted_candidates: Optional[Sequence[CandidateTerm]] = None
+) -> list[str]:
+    """Pipeline stage: clean the filtered candidates in memory (see clean_keyword_list)."""
+    return clean_keyword_list(candidate_keywords(filtered, sorted_candidates))
 
-    # --- Final Processing ---
 
+def clean_keyword_list(raw_keywords: Iterable[str]) -> list[str]:
+    """
+    Drops blocklisted keywords and case-insensitive duplicates (the first
+    spelling wins), returning the rest sorted case-insensitively.
+    """
     # Apply blocklist (case-insensitive) and remove duplicates
     # We keep the original casing from the file
     seen_keywords = set()
     cleaned_keywords = []
     for kw in raw_keywords:
-        if kw.lower() not in blocklist and kw.lower() not in seen_keywords:
+        lowered = kw.lower()
+        if lowered not in BLOCKLIST and lowered not in seen_keywords:
             cleaned_keywords.append(kw)
-            seen_keywords.add(kw.lower())
+            seen_keywords.add(lowered)
+
+    return sorted(cleaned_keywords, key=str.lower)
 
 
+def clean_keywords(input_file: Path, output_file: Path):
+    """
+    Reads a filtered candidates file (JSON, or the legacy text report),
+    filters out noise, and writes a clean JSON dictionary. Normalization is skipped.
+    """
+    print(f"Reading candidates from: {input_file}")
+    raw_keywords = load_candidate_keywords(input_file)
+    print(f"Extracted {len(raw_keywords)} raw keywords.")
+
+    cleaned_keywords = clean_keyword_list(raw_keywords)
     print(f"Kept {len(cleaned_keywords)} keywords after cleaning and de-duplication.")
 
     output_data = {
-        "description": "A cleaned dictionary of technical keywords extracted from job descriptions. Noise has been filtered, but keywords have not been normalized.",
+        "description": CLEANED_DESCRIPTION,
         "count": len(cleaned_keywords),
-        "keywords": sorted(cleaned_keywords, key=str.lower)
+        "keywords": cleaned_keywords
     }
 
     print(f"Writing cleaned dictionary to: {output_file}")
@@ -71,10 +135,11 @@ def clean_keywords(input_file: Path, output_file: Path):
 
     print("Cleaning complete.")
 
+
 def main():
     """CLI entry point."""
     base_dir = Path(__file__).parent.parent
-    input_file = base_dir / "output" / "2_filtered_candidates.txt"
+    input_file = Path(sys.argv[1]) if len(sys.argv) > 1 else base_dir / "output" / "2_filtered_candidates.json"
     output_file = base_dir / "output" / "7_cleaned_tech_dictionary.json"
 
     if not input_file.exists():
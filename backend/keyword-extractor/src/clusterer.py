@@ -3,15 +3,31 @@ Clusterer Module
 Handles term clustering using word embeddings.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+import hashlib
+import os
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Optional
 
 import numpy as np
-import spacy
-from sklearn.cluster import KMeans
+from spacy.attrs import NAMES as ATTR_NAMES, ORTH
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.decomposition import PCA
+from sklearn.random_projection import SparseRandomProjection
 from sklearn.metrics import silhouette_score
+from sklearn.metrics.pairwise import euclidean_distances
+from threadpoolctl import threadpool_limits
 
 from .extractor import CandidateTerm
+from .nlp_models import get_model
+from .embedding_cache import EmbeddingCache
+from .corpus_embeddings import CorpusEmbedder
+from .term_matrix import TermMatrix
+from .similarity_index import SimilarityIndex
+from .output_manifest import atomic_path
 
 
 @dataclass
@@ -23,6 +39,172 @@ class Cluster:
     centroid_nearest: str  # Term closest to cluster centroid
 
 
+@dataclass
+class SweepPoint:
+    """Score and wall time of one k tried while selecting k."""
+    k: int
+    score: Optional[float]  # None if the fit collapsed into a single cluster
+    seconds: float
+
+
+@dataclass
+class KSelection:
+    """Outcome of a k-selection sweep."""
+    k: int
+    score: float
+    mode: str
+    seconds: float
+    points: list[SweepPoint] = field(default_factory=list)
+
+
+@dataclass
+class KSelectionConfig:
+    """How find_optimal_k searches for the number of clusters."""
+    silhouette_sample: Optional[int] = None  # Score on a random sample of this many terms (None = all)
+    minibatch: bool = False  # Fit MiniBatchKMeans instead of KMeans
+    warm_start: bool = False  # Seed each k with the previous k's centroids (sweeps sequentially)
+    workers: int = 1  # Sweep points fitted concurrently (without warm_start)
+
+
+# Named k-selection modes; "exhaustive" is the original full sweep
+K_SELECTION_MODES = {
+    "exhaustive": KSelectionConfig(),
+    "fast": KSelectionConfig(silhouette_sample=2000, minibatch=True, warm_start=True),
+    "fast-parallel": KSelectionConfig(silhouette_sample=2000, minibatch=True, workers=0),
+}
+
+
+# Refit once this fraction of the fitted vocabulary has been added or removed
+DEFAULT_DRIFT_THRESHOLD = 0.2
+
+# Optional reduction of the embeddings before k-selection and k-means
+REDUCTION_METHODS = ("pca", "random-projection")
+DEFAULT_REDUCED_DIMENSIONS = 50
+
+
+@dataclass
+class Reduction:
+    """A fitted linear dimensionality reduction: reduced = (x - mean) @ components.T."""
+    method: str
+    mean: np.ndarray  # (original dims,)
+    components: np.ndarray  # (reduced dims, original dims)
+    explained_variance: Optional[float] = None  # Share of the variance kept (PCA only)
+    seconds: float = 0.0
+
+    @property
+    def dimensions(self) -> tuple[int, int]:
+        """(original, reduced) dimensions."""
+        return self.components.shape[1], self.components.shape[0]
+
+    def apply(self, matrix: np.ndarray) -> np.ndarray:
+        return ((matrix - self.mean) @ self.components.T).astype(np.float32)
+
+
+def term_set_hash(terms: Iterable[str]) -> str:
+    """Order-independent hash of a set of terms."""
+    digest = hashlib.sha256()
+    for term in sorted(set(terms)):
+        digest.update(term.encode("utf-8") + b"\n")
+    return digest.hexdigest()
+
+
+@dataclass
+class ClusterModel:
+    """
+    Fitted k-means state, saved between runs so new terms can be assigned
+    to existing centroids instead of refitting.
+
+    terms/labels are the latest assignment; fitted_terms is the vocabulary
+    the centroids were fitted on, which drift is measured against.
+    """
+    terms: list[str]
+    labels: np.ndarray
+    centroids: np.ndarray
+    fitted_terms: list[str]
+    silhouette_score: float
+    embedding: str = ""  # TermClusterer.embedding_id of the space the centroids live in
+    reduction_key: str = ""  # TermClusterer.reduction_key the model was fitted with
+    seeding: str = ""  # TermClusterer.seeding_key the centroids were initialised with
+    reduction: Optional[Reduction] = None  # Projection the centroids live in (None = raw embeddings)
+
+    @property
+    def k(self) -> int:
+        return len(self.centroids)
+
+    @property
+    def term_set_hash(self) -> str:
+        return term_set_hash(self.terms)
+
+    def drift(self, terms: Iterable[str]) -> float:
+        """Terms added or removed since the fit, as a fraction of the fitted vocabulary."""
+        fitted = set(self.fitted_terms)
+        return len(fitted.symmetric_difference(terms)) / max(len(fitted), 1)
+
+    def save(self, path: str | Path) -> None:
+        """Write the model to an .npz file (via a temp file, so a crash never leaves a truncated model)."""
+        with atomic_path(Path(path)) as temp_path, open(temp_path, "wb") as f:
+            self._savez(f)
+
+    def _savez(self, f) -> None:
+        np.savez(
+            f,
+            terms=np.array(self.terms, dtype=str),
+            labels=self.labels,
+            centroids=self.centroids,
+            fitted_terms=np.array(self.fitted_terms, dtype=str),
+            silhouette_score=np.float64(self.silhouette_score),
+            embedding=np.array(self.embedding),
+            reduction_key=np.array(self.reduction_key),
+            seeding=np.array(self.seeding),
+            reduction_method=np.array(self.reduction.method if self.reduction else ""),
+            reduction_mean=self.reduction.mean if self.reduction else np.zeros(0, dtype=np.float32),
+            reduction_components=(
+                self.reduction.components if self.reduction else np.zeros((0, 0), dtype=np.float32)
+            ),
+            reduction_explained_variance=np.float64(
+                np.nan if self.reduction is None or self.reduction.explained_variance is None
+                else self.reduction.explained_variance
+            ),
+            term_set_hash=np.array(self.term_set_hash)
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> Optional["ClusterModel"]:
+        """Read a model written by save() (None, with a warning, if it's missing or unreadable)."""
+        try:
+            return cls._load(path)
+        except (OSError, ValueError, zipfile.BadZipFile, KeyError) as e:
+            print(f"Warning: Ignoring unreadable cluster model {path} ({e}); refitting")
+            return None
+
+    @classmethod
+    def _load(cls, path: str | Path) -> "ClusterModel":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                terms=data["terms"].tolist(),
+                labels=data["labels"],
+                centroids=data["centroids"],
+                fitted_terms=data["fitted_terms"].tolist(),
+                silhouette_score=float(data["silhouette_score"]),
+                embedding=str(data["embedding"]) if "embedding" in data.files else "",
+                reduction_key=str(data["reduction_key"]) if "reduction_key" in data.files else "",
+                seeding=str(data["seeding"]) if "seeding" in data.files else "",
+                reduction=cls._load_reduction(data)
+            )
+
+    @staticmethod
+    def _load_reduction(data) -> Optional[Reduction]:
+        if "reduction_method" not in data.files or not str(data["reduction_method"]):
+            return None
+        explained_variance = float(data["reduction_explained_variance"])
+        return Reduction(
+            method=str(data["reduction_method"]),
+            mean=data["reduction_mean"],
+            components=data["reduction_components"],
+            explained_variance=None if np.isnan(explained_variance) else explained_variance
+        )
+
+
 @dataclass
 class ClusteringResult:
     """Result of clustering operation."""
@@ -31,7 +213,18 @@ class ClusteringResult:
     num_clusters: int
     silhouette_score: float
     algorithm: str = "k-means"
+    k_selection: Optional[KSelection] = None  # Set when k was chosen automatically
+    model: Optional[ClusterModel] = None  # Fitted state to pass to the next run
+    drift: Optional[float] = None  # Drift from the previous model (None = there wasn't one)
+    incremental: bool = False  # True if new terms were assigned to the previous model's centroids
+    iterations: Optional[int] = None  # Lloyd iterations of the final k-means fit (None = no fit)
+    reduction: Optional[Reduction] = None  # Projection applied before clustering
+    unreduced_silhouette_score: Optional[float] = None  # Same labels scored on the raw embeddings
+    seconds: float = 0.0  # Wall time from reduction through the final silhouette score
+
 
+# Where term vectors come from: the spaCy model's word vectors, or PPMI + SVD over the corpus
+EMBEDDING_SOURCES = ("spacy", "corpus")
 
 # Known anchor terms for suggesting cluster labels
 ANCHOR_TERMS = {
@@ -51,17 +244,155 @@ ANCHOR_TERMS = {
                 "numpy", "spark", "hadoop", "kafka", "airflow", "dbt"],
 }
 
+# Minimum cosine similarity between a cluster centroid and an anchor centroid for it to take that label
+ANCHOR_LABEL_MIN_SIMILARITY = 0.5
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Rows scaled to unit length (all-zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms > 0, norms, 1)
+
 
 class TermClusterer:
     """Clusters terms using word embeddings and k-means."""
 
-    def __init__(self):
-        try:
-            self.nlp = spacy.load("en_core_web_md")
-        except OSError:
-            print("Downloading spaCy model en_core_web_md...")
-            spacy.cli.download("en_core_web_md")
-            self.nlp = spacy.load("en_core_web_md")
+    def __init__(
+        self,
+        embedding_cache: Optional[EmbeddingCache] = None,
+        k_selection: str = "exhaustive",
+        anchor_seeding: bool = False,
+        embedding_source: str = "spacy",
+        reduction: Optional[str] = None,
+        reduced_dimensions: int = DEFAULT_REDUCED_DIMENSIONS
+    ):
+        """
+        Args:
+            embedding_cache: Persistent term -> vector cache (None = embed every term each run)
+            k_selection: How to pick k when it isn't given (a K_SELECTION_MODES key)
+            anchor_seeding: Seed k-means with ANCHOR_TERMS category centroids (one init instead
+                of ten, for the final fit and every k tried) and label clusters by embedding
+                similarity to them
+            embedding_source: "spacy" for the model's word vectors, or "corpus" for vectors
+                learned from the corpus (call fit_corpus_embeddings() before clustering)
+            reduction: Reduce embeddings with "pca" or "random-projection" before
+                clustering (None = cluster the raw embeddings)
+            reduced_dimensions: Target dimension of the reduction
+        """
+        # Embeddings only need the tokenizer and word vectors, so use a
+        # tokenizer-only view of the model the extractor already loaded
+        self.nlp = get_model(components=())
+        self.embedding_cache = embedding_cache
+        self.k_selection_mode = k_selection
+        self.k_selection = K_SELECTION_MODES[k_selection]
+        # Nearest-neighbour index over the last clustered (or explicitly indexed) terms
+        self.similarity_index: Optional[SimilarityIndex] = None
+        self.anchor_seeding = anchor_seeding
+        self._anchor_centroids: Optional[tuple[list[str], np.ndarray]] = None
+        if embedding_source not in EMBEDDING_SOURCES:
+            raise ValueError(f"Unknown embedding source: {embedding_source}")
+        self.corpus_embedder = CorpusEmbedder() if embedding_source == "corpus" else None
+        if reduction is not None and reduction not in REDUCTION_METHODS:
+            raise ValueError(f"Unknown reduction method: {reduction}")
+        self.reduction = reduction
+        self.reduced_dimensions = reduced_dimensions
+        # Projection of the current cluster_terms() call, which anchor centroids also go through
+        self._reduction: Optional[Reduction] = None
+
+    @property
+    def reduction_key(self) -> str:
+        """Identifies the configured reduction, so saved centroids are only reused with the same one."""
+        return f"{self.reduction}-{self.reduced_dimensions}" if self.reduction else ""
+
+    @property
+    def seeding_key(self) -> str:
+        """Identifies how k-means is initialised, so saved centroids are only reused with the same seeding."""
+        return "anchor" if self.anchor_seeding else "k-means++"
+
+    def fit_reduction(self, embeddings: np.ndarray) -> Optional[Reduction]:
+        """
+        Fit the configured dimensionality reduction to an embedding matrix.
+
+        Args:
+            embeddings: (terms, dim) embedding matrix
+
+        Returns:
+            Fitted float32 Reduction, or None if no reduction is configured
+            or the embeddings are already that small
+        """
+        dimensions = min(self.reduced_dimensions, *embeddings.shape)
+        if self.reduction is None or dimensions >= embeddings.shape[1]:
+            return None
+
+        start = time.perf_counter()
+        embeddings = embeddings.astype(np.float32)
+        if self.reduction == "pca":
+            pca = PCA(n_components=dimensions, svd_solver="randomized", random_state=42).fit(embeddings)
+            mean = pca.mean_
+            components = pca.components_
+            explained_variance = float(pca.explained_variance_ratio_.sum())
+        else:
+            projection = SparseRandomProjection(n_components=dimensions, random_state=42).fit(embeddings)
+            mean = np.zeros(embeddings.shape[1], dtype=np.float32)
+            components = projection.components_.toarray()
+            explained_variance = None
+
+        return Reduction(
+            method=self.reduction,
+            mean=np.asarray(mean, dtype=np.float32),
+            components=np.asarray(components, dtype=np.float32),
+            explained_variance=explained_variance,
+            seconds=time.perf_counter() - start
+        )
+
+    def _project(self, matrix: np.ndarray) -> np.ndarray:
+        """Matrix in the current clustering space."""
+        return matrix if self._reduction is None else self._reduction.apply(matrix)
+
+    @property
+    def embedding_id(self) -> str:
+        """Identifies the embedding space, so saved centroids and indexes aren't mixed across spaces."""
+        if self.corpus_embedder is not None:
+            return f"corpus:{self.corpus_embedder.fingerprint}"
+        return f"spacy:{self.nlp.name}"
+
+    def fit_corpus_embeddings(
+        self,
+        matrix: TermMatrix,
+        terms: Optional[list[str]] = None,
+        previous: Optional[CorpusEmbedder] = None,
+        drift_threshold: float = DEFAULT_DRIFT_THRESHOLD
+    ) -> bool:
+        """
+        Learn corpus embeddings from a term x document matrix, or reuse an earlier fit.
+
+        Reusing keeps the embedding space (and so embedding_id) stable across
+        runs, which is what lets the previous cluster model and similarity
+        index be reused as well.
+
+        Args:
+            matrix: Term x document counts of the terms to embed
+            terms: Term of each matrix row (default: the row keys)
+            previous: Embedder saved by an earlier run, reused (with new terms
+                folded in) if it has the same settings and hasn't drifted
+            drift_threshold: Refit when previous's drift exceeds this
+
+        Returns:
+            True if previous was reused, False if the embeddings were refitted
+        """
+        terms = list(matrix.term_keys) if terms is None else terms
+        reused = (
+            previous is not None
+            and previous.same_settings(self.corpus_embedder)
+            and previous.drift(terms) <= drift_threshold
+        )
+        if reused:
+            previous.fold_in(matrix, terms)
+            self.corpus_embedder = previous
+        else:
+            self.corpus_embedder.fit(matrix, terms)
+        self._anchor_centroids = None
+        return reused
 
     def get_embedding(self, term: str) -> Optional[np.ndarray]:
         """
@@ -75,33 +406,213 @@ class TermClusterer:
             return doc.vector
         return None
 
-    def find_optimal_k(self, embeddings: np.ndarray, max_k: int = 15) -> int:
+    def _embed(self, terms: list[str]) -> np.ndarray:
         """
-        Find optimal number of clusters using silhouette score.
+        Compute doc.vector for many terms at once.
+
+        Terms are only tokenized; their tokens' rows in the model's vector
+        table are gathered and averaged with NumPy. Token vectors are added
+        one position at a time, so sums are accumulated in the same order
+        (and give the same float32 result) as Doc.vector.
         """
-        n_samples = len(embeddings)
-        if n_samples < 3:
-            return 2
+        vectors = self.nlp.vocab.vectors
+        if not terms:
+            return np.zeros((0, self.nlp.vocab.vectors_length), dtype=np.float32)
+        if vectors.size == 0 or vectors.mode != "default":
+            # No static vector table (or floret subword vectors) - let spaCy work it out
+            return np.array([self.nlp(term).vector for term in terms], dtype=np.float32)
+
+        docs = [self.nlp(term) for term in terms]
+        lengths = np.fromiter((len(doc) for doc in docs), dtype=np.int64, count=len(docs))
+        offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+        # Token.vector looks the token's key up as a lexeme, then uses that lexeme's key
+        attr_name = ATTR_NAMES[vectors.attr].lower()
+        token_keys = np.fromiter(
+            (getattr(token, attr_name) for doc in docs for token in doc), dtype=np.uint64, count=int(lengths.sum())
+        )
+        unique_keys, token_index = np.unique(token_keys, return_inverse=True)
+        if vectors.attr != ORTH:
+            unique_keys = np.array(
+                [getattr(self.nlp.vocab[int(key)], attr_name) for key in unique_keys], dtype=np.uint64
+            )
+        token_rows = vectors.find(keys=unique_keys)[token_index]
+
+        table = vectors.data
+        sums = np.zeros((len(docs), table.shape[1]), dtype=np.float32)
+        for position in range(int(lengths.max(initial=0))):
+            docs_at = np.flatnonzero(lengths > position)
+            rows = token_rows[offsets[docs_at] + position]
+            token_vectors = table[np.maximum(rows, 0)]
+            token_vectors[rows < 0] = 0
+            sums[docs_at] += token_vectors
+
+        return sums / np.maximum(lengths, 1).astype(np.float32)[:, None]
+
+    def get_embeddings(self, terms: list[str]) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get embeddings for many terms in one batch.
+
+        Uses the embedding cache when there is one, so only unseen terms
+        are embedded.
 
+        Args:
+            terms: Terms to embed
+
+        Returns:
+            (matrix, valid_mask): one row per term, equal to its doc.vector,
+            and which rows are valid (not all zeros)
+        """
+        if self.corpus_embedder is not None:
+            matrix = self.corpus_embedder.embed(terms)
+        elif self.embedding_cache is None:
+            matrix = self._embed(terms)
+        else:
+            matrix = self.embedding_cache.get_matrix(terms, self._embed)
+        return matrix, matrix.any(axis=1)
+
+    def build_similarity_index(self, terms: list[str]) -> SimilarityIndex:
+        """
+        Embed terms and index them for similar-term queries.
+
+        Args:
+            terms: Terms to index (those without an embedding are skipped)
+
+        Returns:
+            The new index, also kept as self.similarity_index
+        """
+        matrix, _ = self.get_embeddings(terms)
+        self.similarity_index = SimilarityIndex.from_vectors(terms, matrix, self.embedding_id)
+        return self.similarity_index
+
+    def similar_terms(self, term: str, k: int = 10) -> list[tuple[str, float]]:
+        """
+        Find the indexed terms most similar to a term.
+
+        The term doesn't have to be indexed itself; unindexed terms are
+        embedded on the fly.
+
+        Args:
+            term: Query term
+            k: Number of results
+
+        Returns:
+            Up to k (term, cosine similarity) pairs, most similar first
+            (empty if the term has no embedding)
+
+        Raises:
+            ValueError: If no index has been built yet
+        """
+        if self.similarity_index is None:
+            raise ValueError("No similarity index - run cluster_terms() or build_similarity_index() first")
+        if term in self.similarity_index:
+            return self.similarity_index.most_similar(term, k)
+        matrix, _ = self.get_embeddings([term])
+        return self.similarity_index.query(matrix[0], k)
+
+    def _fit_k(
+        self,
+        embeddings: np.ndarray,
+        k: int,
+        init: Optional[np.ndarray] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Fit one sweep point; returns (labels, centroids)."""
+        if init is None and self.anchor_seeding:
+            init = self._anchor_seeds(embeddings, k)
+        if self.k_selection.minibatch:
+            model = MiniBatchKMeans(
+                n_clusters=k, random_state=42, batch_size=1024,
+                init="k-means++" if init is None else init, n_init=3 if init is None else 1
+            )
+        else:
+            model = KMeans(
+                n_clusters=k, random_state=42,
+                init="k-means++" if init is None else init, n_init=10 if init is None else 1
+            )
+        labels = model.fit_predict(embeddings)
+        return labels, model.cluster_centers_
+
+    def _score(self, embeddings: np.ndarray, labels: np.ndarray) -> Optional[float]:
+        """Silhouette score of a labelling (sampled if configured), None for a single cluster."""
+        if len(set(labels)) <= 1:
+            return None
+        sample_size = self.k_selection.silhouette_sample
+        if sample_size is not None and sample_size < len(embeddings):
+            return float(silhouette_score(embeddings, labels, sample_size=sample_size, random_state=42))
+        return float(silhouette_score(embeddings, labels))
+
+    def _sweep_point(self, embeddings: np.ndarray, k: int) -> SweepPoint:
+        start = time.perf_counter()
+        labels, _ = self._fit_k(embeddings, k)
+        return SweepPoint(k, self._score(embeddings, labels), time.perf_counter() - start)
+
+    def _warm_sweep(self, embeddings: np.ndarray, ks: range) -> list[SweepPoint]:
+        """Sweep k upwards, seeding each fit with the previous centroids plus the worst-served point."""
+        points = []
+        centroids = None
+        for k in ks:
+            start = time.perf_counter()
+            init = None
+            if centroids is not None:
+                farthest = euclidean_distances(embeddings, centroids, squared=True).min(axis=1).argmax()
+                init = np.vstack([centroids, embeddings[farthest]])
+            labels, centroids = self._fit_k(embeddings, k, init)
+            points.append(SweepPoint(k, self._score(embeddings, labels), time.perf_counter() - start))
+        return points
+
+    def select_k(self, embeddings: np.ndarray, max_k: int = 15) -> KSelection:
+        """
+        Pick the number of clusters by silhouette score, timing every k tried.
+
+        Args:
+            embeddings: Term embedding matrix
+            max_k: Largest k to try
+
+        Returns:
+            KSelection with the chosen k, its score and per-k timings
+        """
+        start = time.perf_counter()
+        n_samples = len(embeddings)
         max_k = min(max_k, n_samples - 1)
-        if max_k < 2:
-            return 2
+        ks = range(2, max_k + 1)
+
+        if n_samples < 3 or max_k < 2:
+            points = []
+        elif self.k_selection.warm_start:
+            points = self._warm_sweep(embeddings, ks)
+        elif self.k_selection.workers != 1:
+            if self.anchor_seeding:
+                # Embed the anchors once up front rather than racing to in every worker
+                self.anchor_centroids()
+            # The heavy lifting in KMeans and silhouette_score releases the GIL, so threads are enough.
+            # Each sweep point runs single-threaded: the limit is process-wide, and letting every
+            # worker start its own OpenMP/BLAS pool would oversubscribe the cores workers times over.
+            workers = self.k_selection.workers or os.cpu_count() or 1
+            with threadpool_limits(limits=1), ThreadPoolExecutor(max_workers=workers) as pool:
+                points = list(pool.map(lambda k: self._sweep_point(embeddings, k), ks))
+        else:
+            points = [self._sweep_point(embeddings, k) for k in ks]
 
         best_k = 2
         best_score = -1
+        for point in points:
+            if point.score is not None and point.score > best_score:
+                best_score = point.score
+                best_k = point.k
+
+        return KSelection(
+            k=best_k,
+            score=best_score,
+            mode=self.k_selection_mode,
+            seconds=time.perf_counter() - start,
+            points=points
+        )
 
-        for k in range(2, max_k + 1):
-            kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-            labels = kmeans.fit_predict(embeddings)
-
-            # Calculate silhouette score
-            if len(set(labels)) > 1:  # Need at least 2 clusters
-                score = silhouette_score(embeddings, labels)
-                if score > best_score:
-                    best_score = score
-                    best_k = k
-
-        return best_k
+    def find_optimal_k(self, embeddings: np.ndarray, max_k: int = 15) -> int:
+        """
+        Find optimal number of clusters using silhouette score.
+        """
+        return self.select_k(embeddings, max_k).k
 
     def suggest_cluster_label(self, terms: list[str]) -> str:
         """
@@ -128,17 +639,103 @@ class TermClusterer:
         # If no anchor match, use the most common/central term
         return f"Cluster ({terms[0]})"
 
+    def anchor_centroids(self) -> tuple[list[str], np.ndarray]:
+        """
+        Mean embedding of each ANCHOR_TERMS category, computed once per clusterer.
+
+        Returns:
+            (categories, centroid matrix) for the categories with at least one embedded anchor
+        """
+        if self._anchor_centroids is None:
+            categories = []
+            rows = []
+            for category, anchors in ANCHOR_TERMS.items():
+                # Bypasses the embedding cache - anchors are few, and this keeps its stats to the run's terms
+                matrix = self._embed(anchors) if self.corpus_embedder is None else self.corpus_embedder.embed(anchors)
+                valid = matrix.any(axis=1)
+                if valid.any():
+                    categories.append(category)
+                    rows.append(matrix[valid].mean(axis=0))
+            dim = self.corpus_embedder.vectors.shape[1] if self.corpus_embedder else self.nlp.vocab.vectors_length
+            self._anchor_centroids = (categories, np.array(rows, dtype=np.float32).reshape(len(rows), dim))
+        return self._anchor_centroids
+
+    def _anchor_seeds(self, embeddings: np.ndarray, k: int) -> np.ndarray:
+        """
+        Initial centroids for k-means: the anchor centroids that most terms are
+        closest to, topped up with the terms farthest from every seed so far.
+        """
+        _, anchors = self.anchor_centroids()
+        anchors = self._project(anchors) if len(anchors) else anchors
+        if len(anchors) and anchors.shape[1] == embeddings.shape[1]:
+            nearest = (normalize_rows(embeddings) @ normalize_rows(anchors).T).argmax(axis=1)
+            support = np.bincount(nearest, minlength=len(anchors))
+            seeds = anchors[np.argsort(-support, kind="stable")[:k]]
+        else:
+            seeds = embeddings.mean(axis=0, keepdims=True)
+
+        while len(seeds) < k:
+            farthest = euclidean_distances(embeddings, seeds, squared=True).min(axis=1).argmax()
+            seeds = np.vstack([seeds, embeddings[farthest]])
+        return seeds.astype(embeddings.dtype)
+
+    def anchor_labels(self, centroids: np.ndarray) -> list[Optional[str]]:
+        """
+        Label cluster centroids with the most similar anchor category.
+
+        One matrix product scores every centroid against every category, so
+        clusters get a label even when none of their terms is a literal anchor.
+
+        Args:
+            centroids: (clusters, dim) centroid matrix
+
+        Returns:
+            Readable category label per centroid, or None where no category
+            reaches ANCHOR_LABEL_MIN_SIMILARITY
+        """
+        categories, anchors = self.anchor_centroids()
+        anchors = self._project(anchors) if categories else anchors
+        if not categories or anchors.shape[1] != centroids.shape[1]:
+            return [None] * len(centroids)
+        similarity = normalize_rows(centroids) @ normalize_rows(anchors).T
+        best = similarity.argmax(axis=1)
+        return [
+            categories[category].replace("_", " ").title() if similarity[row, category] >= ANCHOR_LABEL_MIN_SIMILARITY
+            else None
+            for row, category in enumerate(best)
+        ]
+
+    def _assign(self, previous: ClusterModel, terms: list[str], embeddings: np.ndarray) -> np.ndarray:
+        """Labels from a previous model: known terms keep theirs, new ones go to the nearest centroid."""
+        known = dict(zip(previous.terms, previous.labels.tolist()))
+        labels = np.array([known.get(term, -1) for term in terms], dtype=np.int64)
+        new = np.flatnonzero(labels < 0)
+        if len(new):
+            distances = euclidean_distances(embeddings[new], previous.centroids, squared=True)
+            labels[new] = distances.argmin(axis=1)
+        return labels
+
     def cluster_terms(
         self,
         candidates: dict[str, CandidateTerm],
-        num_clusters: Optional[int] = None
+        num_clusters: Optional[int] = None,
+        previous: Optional[ClusterModel] = None,
+        drift_threshold: float = DEFAULT_DRIFT_THRESHOLD
     ) -> ClusteringResult:
         """
         Cluster candidate terms using k-means on word embeddings.
 
+        With a previous model, terms are assigned to its centroids rather
+        than refitting, as long as the vocabulary hasn't drifted past the
+        threshold (and k, the embedding space and the reduction still match).
+        With a reduction configured, k-selection and k-means run on the
+        reduced embeddings.
+
         Args:
             candidates: Dictionary of filtered candidate terms
             num_clusters: Optional fixed number of clusters (auto-detect if None)
+            previous: Model from an earlier run to assign new terms against
+            drift_threshold: Refit when the previous model's drift exceeds this
 
         Returns:
             ClusteringResult with clusters and metadata
@@ -148,16 +745,17 @@ class TermClusterer:
         embeddings = []
         unclusterable = []
 
-        for key, candidate in candidates.items():
-            term = candidate.term
-            embedding = self.get_embedding(term)
-
-            if embedding is not None:
+        terms = [candidate.term for candidate in candidates.values()]
+        matrix, valid = self.get_embeddings(terms)
+        for term, vector, is_valid in zip(terms, matrix, valid):
+            if is_valid:
                 terms_with_embeddings.append(term)
-                embeddings.append(embedding)
+                embeddings.append(vector)
             else:
                 unclusterable.append(term)
 
+        self.similarity_index = SimilarityIndex.from_vectors(terms, matrix, self.embedding_id)
+
         if len(embeddings) < 2:
             return ClusteringResult(
                 clusters=[],
@@ -168,28 +766,75 @@ class TermClusterer:
 
         embeddings_array = np.array(embeddings)
 
-        # Determine optimal k if not specified
-        if num_clusters is None:
-            num_clusters = self.find_optimal_k(embeddings_array)
-
-        # Run k-means
-        kmeans = KMeans(n_clusters=num_clusters, random_state=42, n_init=10)
-        labels = kmeans.fit_predict(embeddings_array)
+        drift = None
+        incremental = False
+        if previous is not None:
+            drift = previous.drift(terms_with_embeddings)
+            previous_dim = (previous.reduction.dimensions[0] if previous.reduction is not None
+                            else previous.centroids.shape[1])
+            incremental = (
+                drift <= drift_threshold
+                and num_clusters in (None, previous.k)
+                and previous_dim == embeddings_array.shape[1]
+                and previous.embedding == self.embedding_id
+                and previous.reduction_key == self.reduction_key
+                and previous.seeding == self.seeding_key
+            )
 
-        # Calculate silhouette score
-        if len(set(labels)) > 1:
-            sil_score = silhouette_score(embeddings_array, labels)
+        # Reduce before clustering; incremental runs keep the projection the centroids were fitted in
+        start_time = time.perf_counter()
+        raw_embeddings = embeddings_array
+        self._reduction = previous.reduction if incremental else self.fit_reduction(raw_embeddings)
+        embeddings_array = self._project(raw_embeddings)
+
+        k_selection = None
+        iterations = None
+        if incremental:
+            num_clusters = previous.k
+            centroids = previous.centroids
+            fitted_terms = previous.fitted_terms
+            labels = self._assign(previous, terms_with_embeddings, embeddings_array)
+            if drift == 0 and previous.term_set_hash == term_set_hash(terms_with_embeddings):
+                sil_score = previous.silhouette_score
+            else:
+                sil_score = self._score(embeddings_array, labels) or 0.0
         else:
-            sil_score = 0.0
+            # Determine optimal k if not specified
+            if num_clusters is None:
+                k_selection = self.select_k(embeddings_array)
+                num_clusters = k_selection.k
+
+            # Run k-means
+            if self.anchor_seeding:
+                seeds = self._anchor_seeds(embeddings_array, num_clusters)
+                kmeans = KMeans(n_clusters=num_clusters, random_state=42, init=seeds, n_init=1)
+            else:
+                kmeans = KMeans(n_clusters=num_clusters, random_state=42, n_init=10)
+            labels = kmeans.fit_predict(embeddings_array)
+            centroids = kmeans.cluster_centers_
+            fitted_terms = terms_with_embeddings
+            iterations = int(kmeans.n_iter_)
+
+            # Calculate silhouette score
+            if len(set(labels)) > 1:
+                sil_score = silhouette_score(embeddings_array, labels)
+            else:
+                sil_score = 0.0
+
+        unreduced_score = None
+        if self._reduction is not None:
+            unreduced_score = self._score(raw_embeddings, labels)
+        elapsed = time.perf_counter() - start_time
 
         # Group terms by cluster
         cluster_terms: dict[int, list[tuple[str, np.ndarray]]] = {}
-        for term, embedding, label in zip(terms_with_embeddings, embeddings, labels):
+        for term, embedding, label in zip(terms_with_embeddings, embeddings_array, labels):
             if label not in cluster_terms:
                 cluster_terms[label] = []
             cluster_terms[label].append((term, embedding))
 
         # Build cluster objects
+        labels_by_anchor = self.anchor_labels(centroids) if self.anchor_seeding else None
         clusters = []
         for cluster_id in sorted(cluster_terms.keys()):
             terms_and_embeddings = cluster_terms[cluster_id]
@@ -197,7 +842,7 @@ class TermClusterer:
             embs = np.array([e for _, e in terms_and_embeddings])
 
             # Find term closest to centroid
-            centroid = kmeans.cluster_centers_[cluster_id]
+            centroid = centroids[cluster_id]
             distances = np.linalg.norm(embs - centroid, axis=1)
             closest_idx = np.argmin(distances)
             centroid_nearest = terms[closest_idx]
@@ -205,17 +850,46 @@ class TermClusterer:
             # Sort terms alphabetically for readability
             terms_sorted = sorted(terms, key=str.lower)
 
+            # Anchor mode labels by centroid similarity; clusters no category is
+            # close enough to fall back to the literal anchor-term label
+            suggested_label = None
+            if labels_by_anchor is not None:
+                suggested_label = labels_by_anchor[cluster_id]
+            if suggested_label is None:
+                suggested_label = self.suggest_cluster_label(terms)
+
             cluster = Cluster(
                 cluster_id=int(cluster_id),  # Convert numpy int to Python int
                 terms=terms_sorted,
-                suggested_label=self.suggest_cluster_label(terms),
+                suggested_label=suggested_label,
                 centroid_nearest=centroid_nearest
             )
             clusters.append(cluster)
 
+        model = ClusterModel(
+            terms=terms_with_embeddings,
+            labels=np.asarray(labels, dtype=np.int64),
+            centroids=centroids,
+            fitted_terms=list(fitted_terms),
+            silhouette_score=float(sil_score),
+            embedding=self.embedding_id,
+            reduction_key=self.reduction_key,
+            seeding=self.seeding_key,
+            reduction=self._reduction
+        )
+
         return ClusteringResult(
             clusters=clusters,
             unclusterable=unclusterable,
             num_clusters=num_clusters,
-            silhouette_score=round(sil_score, 4)
+            silhouette_score=round(sil_score, 4),
+            k_selection=k_selection,
+            model=model,
+            drift=drift,
+            incremental=incremental,
+            iterations=iterations,
+            reduction=self._reduction,
+            unreduced_silhouette_score=None if unreduced_score is None else round(unreduced_score, 4),
+            seconds=elapsed,
+            algorithm="k-means (anchor-seeded)" if self.anchor_seeding else "k-means"
         )
@@ -0,0 +1,140 @@
+"""
+Columnar Export Module
+Handles writing and reading candidate tables as Arrow IPC or Parquet files.
+
+Requires pyarrow (optional dependency).
+"""
+
+from pathlib import Path
+from typing import Mapping, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow is only needed for columnar export
+    pa = None
+    pq = None
+
+from .extractor import CandidateTerm
+from .output_manifest import manifest_for
+
+
+# File extension of each export format
+EXPORT_FORMATS = {"arrow": ".arrow", "parquet": ".parquet"}
+
+
+def require_pyarrow() -> None:
+    """Raise a helpful error if pyarrow isn't installed."""
+    if pa is None:
+        raise ImportError("Columnar export needs pyarrow: pip install pyarrow")
+
+
+def candidate_table(
+    candidates: Mapping[str, CandidateTerm],
+    sorted_candidates: Optional[Sequence[CandidateTerm]] = None
+) -> "pa.Table":
+    """
+    Build a columnar table of candidates, in the same order as the JSON outputs.
+
+    Columns: term (string), count (int64), num_sources (int32),
+    signals (list of dictionary-encoded strings) and sources (list of strings).
+
+    Args:
+        candidates: Candidate terms
+        sorted_candidates: Candidates already in output order (CandidateAggregates.sorted_candidates)
+
+    Returns:
+        pyarrow Table with one row per candidate
+    """
+    require_pyarrow()
+    rows = sorted_candidates
+    if rows is None:
+        rows = sorted(candidates.values(), key=lambda c: (len(c.sources), c.count), reverse=True)
+
+    signal_names = sorted({signal for c in rows for signal in c.signals})
+    signal_ids = {name: i for i, name in enumerate(signal_names)}
+    signal_offsets = [0]
+    signal_values: list[int] = []
+    source_offsets = [0]
+    source_values: list[str] = []
+    for c in rows:
+        signal_values.extend(signal_ids[signal] for signal in sorted(c.signals))
+        signal_offsets.append(len(signal_values))
+        source_values.extend(sorted(c.sources))
+        source_offsets.append(len(source_values))
+
+    signals = pa.ListArray.from_arrays(
+        pa.array(signal_offsets, type=pa.int32()),
+        pa.DictionaryArray.from_arrays(
+            pa.array(signal_values, type=pa.int8()),
+            pa.array(signal_names, type=pa.string())
+        )
+    )
+    sources = pa.ListArray.from_arrays(
+        pa.array(source_offsets, type=pa.int32()),
+        pa.array(source_values, type=pa.string())
+    )
+
+    return pa.table({
+        "term": pa.array([c.term for c in rows], type=pa.string()),
+        "count": pa.array([c.count for c in rows], type=pa.int64()),
+        "num_sources": pa.array([len(c.sources) for c in rows], type=pa.int32()),
+        "signals": signals,
+        "sources": sources,
+    })
+
+
+def write_candidate_table(
+    candidates: Mapping[str, CandidateTerm],
+    path: str | Path,
+    export_format: str = "arrow",
+    sorted_candidates: Optional[Sequence[CandidateTerm]] = None
+) -> Path:
+    """
+    Write candidates as a columnar file.
+
+    Arrow files are uncompressed IPC files, so they can be memory-mapped
+    and read without copying; Parquet files are smaller but decoded on read.
+    The file is serialized in memory and written through the output
+    directory's manifest, so it's replaced atomically and skipped when unchanged.
+
+    Args:
+        candidates: Candidate terms
+        path: Target path without extension
+        export_format: "arrow" or "parquet"
+        sorted_candidates: Candidates already in output order (see candidate_table)
+
+    Returns:
+        The path written (with the format's extension)
+    """
+    table = candidate_table(candidates, sorted_candidates)
+    path = Path(path).with_suffix(EXPORT_FORMATS[export_format])
+    sink = pa.BufferOutputStream()
+    if export_format == "parquet":
+        pq.write_table(table, sink)
+    else:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    manifest_for(path.parent).write_bytes(path, sink.getvalue())
+    return path
+
+
+def read_candidate_table(path: str | Path, columns: Optional[Sequence[str]] = None) -> "pa.Table":
+    """
+    Read a table written by write_candidate_table, memory-mapping the file.
+
+    Args:
+        path: .arrow or .parquet file
+        columns: Columns to read (None = all)
+
+    Returns:
+        pyarrow Table
+    """
+    require_pyarrow()
+    path = Path(path)
+    if path.suffix == EXPORT_FORMATS["parquet"]:
+        return pq.read_table(path, columns=columns, memory_map=True)
+
+    table = pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+    return table.select(list(columns)) if columns is not None else table
@@ -0,0 +1,270 @@
+"""
+Corpus Embeddings Module
+Handles term embeddings learned from the job-description corpus (PPMI + truncated SVD).
+"""
+
+import hashlib
+import zipfile
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+from scipy import sparse
+from sklearn.utils.extmath import randomized_svd
+
+from .term_matrix import TermMatrix
+from .output_manifest import atomic_path
+
+
+# Embedding size (capped at the number of terms - 1)
+DEFAULT_DIMENSIONS = 100
+
+# Co-occurrence is counted against at most this many of the most frequent terms
+DEFAULT_MAX_CONTEXTS = 10000
+
+# Context distribution smoothing for PMI (Levy et al. 2015); 1.0 = plain PMI
+CONTEXT_SMOOTHING = 0.75
+
+
+def context_probabilities(cooccurrence: sparse.spmatrix) -> np.ndarray:
+    """Smoothed probability of each context column of a non-empty (terms, contexts) count matrix."""
+    context_weights = np.asarray(cooccurrence.sum(axis=0)).ravel() ** CONTEXT_SMOOTHING
+    return context_weights / context_weights.sum()
+
+
+def ppmi(
+    cooccurrence: sparse.spmatrix,
+    total: Optional[float] = None,
+    context_probs: Optional[np.ndarray] = None
+) -> sparse.csr_matrix:
+    """
+    Positive pointwise mutual information of a (terms, contexts) count matrix.
+
+    Only the stored (non-zero) counts are transformed, so the result stays
+    as sparse as the input.
+
+    Args:
+        cooccurrence: (terms, contexts) counts
+        total: Total count to weight against (default: the matrix's own)
+        context_probs: Context probabilities to weight against (default: the
+            matrix's own); passing a fit's statistics weights new rows like
+            the rows it was fitted on
+    """
+    counts = sparse.csr_matrix(cooccurrence, dtype=np.float64)
+    total = counts.sum() if total is None else total
+    if total == 0 or counts.nnz == 0:
+        return counts
+
+    term_totals = np.asarray(counts.sum(axis=1)).ravel()
+    context_probs = context_probabilities(counts) if context_probs is None else context_probs
+
+    coo = counts.tocoo()
+    with np.errstate(divide="ignore"):
+        pmi = np.log(coo.data / total) - np.log(term_totals[coo.row] / total) - np.log(context_probs[coo.col])
+    # Contexts the fit never saw co-occur give infinite PMI; they carry no information about the space
+    keep = (pmi > 0) & np.isfinite(pmi)
+    return sparse.csr_matrix(
+        (pmi[keep], (coo.row[keep], coo.col[keep])),
+        shape=counts.shape
+    )
+
+
+class CorpusEmbedder:
+    """
+    Term vectors computed from document co-occurrence in the corpus itself.
+
+    Two terms co-occur when they appear in the same job description. The
+    term x context co-occurrence counts are PPMI-weighted and reduced with
+    randomized truncated SVD; a term's vector is its row of U * sqrt(S).
+    Every term that shares a document with a context term gets a vector,
+    so no spaCy model or pretrained vectors are needed.
+
+    Vectors are specific to the corpus they were fitted on - refitting on
+    a different corpus gives an unrelated space. So a fit is saved and
+    reused while the vocabulary hasn't drifted far: terms it wasn't fitted
+    on are folded into the same space by projecting their PPMI rows (against
+    the fit's statistics) onto the fitted SVD basis.
+    """
+
+    def __init__(
+        self,
+        dimensions: int = DEFAULT_DIMENSIONS,
+        max_contexts: int = DEFAULT_MAX_CONTEXTS,
+        random_state: int = 42
+    ):
+        """
+        Args:
+            dimensions: Embedding size
+            max_contexts: Number of most frequent terms used as co-occurrence contexts
+            random_state: Seed for the randomized SVD
+        """
+        self.dimensions = dimensions
+        self.max_contexts = max_contexts
+        self.random_state = random_state
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+        self.index: dict[str, int] = {}
+        # Fitted state: the first len(terms) rows of vectors are the fit, folded-in rows follow
+        self.terms: list[str] = []
+        self.contexts: list[str] = []  # Context term of each co-occurrence column
+        self.basis = np.zeros((0, 0), dtype=np.float32)  # (contexts, dimensions): PPMI row -> vector
+        self.total = 0.0
+        self.context_probs = np.zeros(0)
+        self.folded_terms: list[str] = []
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of the fitted vectors; equal only for identical embedding spaces."""
+        return hashlib.sha256(self.vectors[:len(self.terms)].tobytes()).hexdigest()[:16]
+
+    def same_settings(self, other: "CorpusEmbedder") -> bool:
+        """True if other was configured the same way, so its fit can stand in for this one's."""
+        return (self.dimensions, self.max_contexts, self.random_state) == (
+            other.dimensions, other.max_contexts, other.random_state
+        )
+
+    def drift(self, terms: Iterable[str]) -> float:
+        """Terms added or removed since the fit, as a fraction of the fitted vocabulary."""
+        fitted = set(self.terms)
+        return len(fitted.symmetric_difference(terms)) / max(len(fitted), 1)
+
+    def fit(self, matrix: TermMatrix, terms: Optional[list[str]] = None) -> "CorpusEmbedder":
+        """
+        Learn vectors for the rows of a term x document matrix.
+
+        Args:
+            matrix: Term x document counts
+            terms: Term of each matrix row (default: the row keys)
+
+        Returns:
+            self
+        """
+        terms = list(matrix.term_keys) if terms is None else terms
+        incidence = matrix.counts.tocsr().astype(bool).astype(np.float32)
+
+        document_frequency = np.diff(incidence.indptr)
+        contexts = np.argsort(-document_frequency, kind="stable")[:self.max_contexts]
+        cooccurrence = (incidence @ incidence[contexts].T).tocoo()
+        # A term doesn't co-occur with itself
+        other = contexts[cooccurrence.col] != cooccurrence.row
+        cooccurrence = sparse.csr_matrix(
+            (cooccurrence.data[other], (cooccurrence.row[other], cooccurrence.col[other])),
+            shape=cooccurrence.shape
+        )
+
+        self.total = float(cooccurrence.sum())
+        self.context_probs = context_probabilities(cooccurrence) if self.total else np.zeros(len(contexts))
+        weighted = ppmi(cooccurrence, self.total, self.context_probs)
+        dimensions = min(self.dimensions, min(weighted.shape) - 1)
+        if dimensions < 1 or weighted.nnz == 0:
+            self.vectors = np.zeros((len(terms), max(dimensions, 0)), dtype=np.float32)
+            self.basis = np.zeros((len(contexts), max(dimensions, 0)), dtype=np.float32)
+        else:
+            u, s, vt = randomized_svd(weighted, n_components=dimensions, random_state=self.random_state)
+            self.vectors = (u * np.sqrt(s)).astype(np.float32)
+            # weighted @ V = U * S, so a PPMI row times V / sqrt(S) lands where its U * sqrt(S) row would
+            root_s = np.sqrt(s)
+            self.basis = np.divide(vt.T, root_s, out=np.zeros_like(vt.T), where=root_s > 0).astype(np.float32)
+
+        self.terms = list(terms)
+        self.contexts = [terms[row] for row in contexts]
+        self.folded_terms = []
+        self._build_index()
+        return self
+
+    def fold_in(self, matrix: TermMatrix, terms: Optional[list[str]] = None) -> int:
+        """
+        Embed the terms of a term x document matrix that the fit hasn't seen, without refitting.
+
+        Args:
+            matrix: Term x document counts of the current corpus
+            terms: Term of each matrix row (default: the row keys)
+
+        Returns:
+            Number of terms folded in
+        """
+        terms = list(matrix.term_keys) if terms is None else terms
+        new_rows = [row for row, term in enumerate(terms) if self._row(term) is None]
+        self.vectors = self.vectors[:len(self.terms)]
+        self.folded_terms = [terms[row] for row in new_rows]
+        if new_rows:
+            incidence = matrix.counts.tocsr().astype(bool).astype(np.float32)
+            rows: dict[str, int] = {}
+            for row, term in enumerate(terms):
+                rows.setdefault(term, row)
+            # Contexts that have left the corpus simply stay empty columns
+            present = [(column, rows[context]) for column, context in enumerate(self.contexts) if context in rows]
+            columns = np.array([column for column, _ in present], dtype=np.int64)
+            cooccurrence = (incidence[new_rows] @ incidence[[row for _, row in present]].T).tocoo()
+            cooccurrence = sparse.csr_matrix(
+                (cooccurrence.data, (cooccurrence.row, columns[cooccurrence.col])),
+                shape=(len(new_rows), len(self.contexts))
+            )
+            folded = (ppmi(cooccurrence, self.total, self.context_probs) @ self.basis).astype(np.float32)
+            self.vectors = np.vstack([self.vectors, folded])
+        self._build_index()
+        return len(new_rows)
+
+    def _build_index(self) -> None:
+        terms = self.terms + self.folded_terms
+        self.index = {}
+        for row, term in enumerate(terms):
+            self.index.setdefault(term, row)
+        for row, term in enumerate(terms):
+            self.index.setdefault(term.lower(), row)
+
+    def _row(self, term: str) -> Optional[int]:
+        row = self.index.get(term)
+        return self.index.get(term.lower()) if row is None else row
+
+    def save(self, path: str | Path) -> None:
+        """Write the fit (not folded-in terms) to an .npz file, via a temp file."""
+        with atomic_path(Path(path)) as temp_path, open(temp_path, "wb") as f:
+            np.savez(
+                f,
+                vectors=self.vectors[:len(self.terms)],
+                terms=np.array(self.terms, dtype=str),
+                contexts=np.array(self.contexts, dtype=str),
+                basis=self.basis,
+                total=np.float64(self.total),
+                context_probs=self.context_probs,
+                settings=np.array([self.dimensions, self.max_contexts, self.random_state], dtype=np.int64)
+            )
+
+    @classmethod
+    def load(cls, path: str | Path) -> Optional["CorpusEmbedder"]:
+        """Read a fit written by save() (None, with a warning, if it's missing or unreadable)."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                dimensions, max_contexts, random_state = data["settings"].tolist()
+                embedder = cls(dimensions, max_contexts, random_state)
+                embedder.vectors = data["vectors"]
+                embedder.terms = data["terms"].tolist()
+                embedder.contexts = data["contexts"].tolist()
+                embedder.basis = data["basis"]
+                embedder.total = float(data["total"])
+                embedder.context_probs = data["context_probs"]
+        except (OSError, ValueError, zipfile.BadZipFile, KeyError) as e:
+            print(f"Warning: Ignoring unreadable corpus embeddings {path} ({e}); refitting")
+            return None
+        if len(embedder.vectors) != len(embedder.terms) or len(embedder.basis) != len(embedder.contexts):
+            print(f"Warning: Ignoring inconsistent corpus embeddings {path}; refitting")
+            return None
+        embedder._build_index()
+        return embedder
+
+    def embed(self, terms: list[str]) -> np.ndarray:
+        """
+        Vectors of terms, matched exactly or case-insensitively.
+
+        Args:
+            terms: Terms to look up
+
+        Returns:
+            (len(terms), dimensions) float32 matrix; unknown terms get zero rows
+        """
+        result = np.zeros((len(terms), self.vectors.shape[1]), dtype=np.float32)
+        for i, term in enumerate(terms):
+            row = self._row(term)
+            if row is not None:
+                result[i] = self.vectors[row]
+        return result
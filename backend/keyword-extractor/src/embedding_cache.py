@@ -0,0 +1,130 @@
+"""
+Embedding Cache Module
+Handles the persistent, memory-mapped term -> vector cache used by the clusterer.
+"""
+
+import json
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+from spacy.util import get_package_version
+
+from .nlp_models import DEFAULT_MODEL
+
+
+class EmbeddingCache:
+    """
+    Append-only term -> float32 vector store for one model.
+
+    Vectors live in a raw float32 file that's memory-mapped read-only, so
+    loading costs nothing until rows are touched; the term index is a
+    JSON-lines file in the same row order. Each model name and version
+    gets its own directory, so upgrading the model starts a fresh cache.
+    All-zero vectors (terms without an embedding) are cached too.
+
+    A cache directory should only be written by one process at a time.
+    """
+
+    def __init__(self, cache_dir: str | Path, model_name: str = DEFAULT_MODEL):
+        version = get_package_version(model_name) or "unversioned"
+        self.path = Path(cache_dir) / f"{model_name}-{version}"
+        self.vectors_path = self.path / "vectors.f32"
+        self.index_path = self.path / "terms.jsonl"
+        self.meta_path = self.path / "meta.json"
+
+        self.index: dict[str, int] = {}
+        self.dim: Optional[int] = None
+        self.vectors: np.ndarray = np.zeros((0, 0), dtype=np.float32)
+        self.hits = 0
+        self.misses = 0
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, term: str) -> bool:
+        return term in self.index
+
+    def _load(self) -> None:
+        """Map the existing cache, trimming any rows left half-written by an interrupted run."""
+        if not self.meta_path.exists():
+            return
+
+        with open(self.meta_path, "r", encoding="utf-8") as f:
+            self.dim = json.load(f)["dim"]
+
+        terms = []
+        if self.index_path.exists():
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        terms.append(json.loads(line))
+                    except ValueError:
+                        break
+        row_bytes = self.dim * np.dtype(np.float32).itemsize
+        vector_bytes = self.vectors_path.stat().st_size if self.vectors_path.exists() else 0
+        rows = min(len(terms), vector_bytes // row_bytes) if row_bytes else len(terms)
+        if rows != len(terms) or rows * row_bytes != vector_bytes:
+            self._truncate(terms[:rows], rows * row_bytes)
+
+        self.index = {term: row for row, term in enumerate(terms[:rows])}
+        self._map()
+
+    def _truncate(self, terms: list[str], vector_bytes: int) -> None:
+        print(f"Warning: Repairing embedding cache at {self.path} ({len(terms)} complete rows)")
+        with open(self.index_path, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(term, ensure_ascii=False) + "\n" for term in terms)
+        with open(self.vectors_path, "r+b" if self.vectors_path.exists() else "wb") as f:
+            f.truncate(vector_bytes)
+
+    def _map(self) -> None:
+        rows = len(self.index)
+        if rows and self.dim:
+            self.vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r", shape=(rows, self.dim))
+        else:
+            # Nothing to map (mmap can't map an empty file)
+            self.vectors = np.zeros((rows, self.dim or 0), dtype=np.float32)
+
+    def _append(self, terms: list[str], vectors: np.ndarray) -> None:
+        """Append rows: vectors first, then the index, so a crash never indexes a missing vector."""
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+            self.path.mkdir(parents=True, exist_ok=True)
+            with open(self.meta_path, "w", encoding="utf-8") as f:
+                json.dump({"dim": self.dim}, f)
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(
+                f"Embedding cache at {self.path} holds {self.dim}-d vectors, got {vectors.shape[1]}-d"
+            )
+
+        with open(self.vectors_path, "ab") as f:
+            f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+        with open(self.index_path, "a", encoding="utf-8") as f:
+            f.writelines(json.dumps(term, ensure_ascii=False) + "\n" for term in terms)
+
+        for term in terms:
+            self.index[term] = len(self.index)
+        self._map()
+
+    def get_matrix(self, terms: list[str], embed: Callable[[list[str]], np.ndarray]) -> np.ndarray:
+        """
+        Get the vectors of terms, embedding and caching only unseen ones.
+
+        Args:
+            terms: Terms to look up
+            embed: Function computing the vectors of a list of uncached terms
+
+        Returns:
+            (len(terms), dim) float32 matrix, rows in terms order
+        """
+        cached = [term in self.index for term in terms]
+        missing = list(dict.fromkeys(term for term, hit in zip(terms, cached) if not hit))
+        self.hits = sum(cached)
+        self.misses = len(terms) - self.hits
+
+        if missing:
+            self._append(missing, embed(missing))
+
+        rows = np.fromiter((self.index[term] for term in terms), dtype=np.int64, count=len(terms))
+        return np.asarray(self.vectors[rows])
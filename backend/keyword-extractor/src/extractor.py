@@ -6,9 +6,103 @@ Handles candidate keyword extraction using multiple signals.
 import re
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Set
+from typing import Iterable, Iterator, Optional, Set
+
+from spacy.tokens import Doc
+
+from .nlp_models import get_model
+
+
+# Bump whenever extraction or preprocessing output changes, so cached
+# per-document results (see candidate_cache) are invalidated
+EXTRACTOR_VERSION = "1"
+
+# Pipeline components noun_chunks depends on (POS tags + dependency parse).
+# Everything else (ner, lemmatizer, ...) is skipped on the batched path.
+NOUN_CHUNK_COMPONENTS = ("tok2vec", "tagger", "attribute_ruler", "parser")
+
+# Common non-tech ALL_CAPS words dropped by the allcaps signal
+ALLCAPS_STOPWORDS = {"THE", "AND", "FOR", "WITH", "THIS", "THAT", "FROM", "WILL",
+                     "ARE", "WAS", "WERE", "BEEN", "HAVE", "HAS", "HAD", "NOT",
+                     "BUT", "CAN", "ALL", "THEIR", "WHAT", "WHEN", "WHO", "HOW",
+                     "USD", "USA", "INC"}
+
+# The regex-based signals, as (signal, pattern) pairs. These are the same
+# patterns the extract_camelcase / extract_allcaps / extract_special_patterns /
+# extract_single_tech_words methods apply one re.findall/re.search at a time.
+# C++/C# and the "Go"/"R"/"C" checks are merged into one pattern each (their
+# matches never overlap), and for the latter only the leading word matters.
+SIGNAL_PATTERNS: list[tuple[str, str]] = [
+    ("camelcase", r"\b[A-Z][a-z]+(?:[A-Z][a-z]*)+\b"),
+    ("camelcase", r"\b[a-z]+[A-Z][a-zA-Z]*\b"),
+    ("allcaps", r"\b[A-Z][A-Z0-9_]{1,}\b"),
+    ("special_pattern", r"\bC(?:\+\+|#)\b"),
+    ("special_pattern", r"(?i:\.NET(?:\s*(?:Core|Framework|Standard))?)"),
+    ("special_pattern", r"(?i:\b[A-Za-z]+\.js\b)"),
+    ("special_pattern", r"\b[A-Za-z]+[0-9]+[A-Za-z]*\b"),
+    ("special_pattern", r"\b[0-9]+[A-Za-z]+\b"),
+    ("special_pattern", r"\b[A-Za-z]+-[A-Za-z]+(?:-[A-Za-z]+)?\b"),
+    ("single_word", r"(?<=[a-z,.;:!?]\s)[A-Z][a-z]+\b"),
+    ("single_word", r"\b(?:Go|R|C)\b"),
+]
+
+# Every pattern above can only match at a word start or (for .NET) at a dot
+# followed by "n", and the first character narrows down which patterns can
+# start there. The scanner stops only at those positions (skipping all-lowercase
+# words that can't start any match) and tries the possible patterns in
+# capturing lookaheads, so one walk over the text finds every pattern's
+# matches, including overlapping ones. Branches are (start condition, indices
+# into SIGNAL_PATTERNS).
+_SCANNER_BRANCHES: list[tuple[str, list[int]]] = [
+    (r"(?=[A-Z])", [0, 2, 3, 5, 6, 8, 9, 10]),
+    (r"(?=[a-z])(?![a-z]+(?![\w.\-]))", [1, 5, 6, 8]),
+    (r"(?=[0-9])", [7]),
+    (r"(?=\.)", [4]),
+    # Non-ASCII letters and "_" can only start the case-insensitive .js pattern
+    (r"(?=[^A-Za-z0-9.])", [5]),
+]
+
+_SIGNAL_SCANNER = re.compile(
+    r"(?:(?<!\w)(?=\w)|(?=\.[Nn]))(?:"
+    + "|".join(
+        start + "".join(f"(?:(?=({SIGNAL_PATTERNS[i][1]}))|)" for i in indices)
+        for start, indices in _SCANNER_BRANCHES
+    )
+    + ")"
+)
+
+# Maps each scanner group (in order) to its index in SIGNAL_PATTERNS
+_SCANNER_GROUP_PATTERNS = [i for _, indices in _SCANNER_BRANCHES for i in indices]
+
+
+def scan_signals(text: str) -> dict[str, Set[str]]:
+    """
+    Find all regex-signal terms in one pass over the text.
+
+    Returns exactly the sets extract_camelcase, extract_allcaps,
+    extract_special_patterns and extract_single_tech_words would.
+
+    Returns:
+        Dictionary mapping signal name to the terms it matched
+    """
+    results: dict[str, Set[str]] = {signal: set() for signal, _ in SIGNAL_PATTERNS}
+    signal_sets = [results[signal] for signal, _ in SIGNAL_PATTERNS]
+
+    # re.findall never returns overlapping matches of the same pattern, so a
+    # pattern's match only counts if it starts after that pattern's last match
+    next_start = [0] * len(SIGNAL_PATTERNS)
 
-import spacy
+    for match in _SIGNAL_SCANNER.finditer(text):
+        start = match.start()
+        for group, value in enumerate(match.groups(), 1):
+            if value is not None:
+                i = _SCANNER_GROUP_PATTERNS[group - 1]
+                if start >= next_start[i]:
+                    next_start[i] = match.end(group)
+                    signal_sets[i].add(value)
+
+    results["allcaps"] = {m for m in results["allcaps"] if m not in ALLCAPS_STOPWORDS}
+    return results
 
 
 @dataclass
@@ -25,13 +119,10 @@ class KeywordExtractor:
     """Extracts candidate tech keywords using multiple signals."""
 
     def __init__(self):
-        # Load spaCy model with word vectors
-        try:
-            self.nlp = spacy.load("en_core_web_md")
-        except OSError:
-            print("Downloading spaCy model en_core_web_md...")
-            spacy.cli.download("en_core_web_md")
-            self.nlp = spacy.load("en_core_web_md")
+        # Shared spaCy model (loaded on first use), plus a view that only
+        # runs what noun chunks need for the batched path
+        self.nlp = get_model()
+        self.noun_chunk_nlp = get_model(components=NOUN_CHUNK_COMPONENTS)
 
         # Contextual phrases that often precede tech terms
         self.context_phrases = [
@@ -83,11 +174,7 @@ class KeywordExtractor:
         matches = re.findall(pattern, text)
 
         # Filter out common non-tech all-caps words
-        common_words = {"THE", "AND", "FOR", "WITH", "THIS", "THAT", "FROM", "WILL",
-                        "ARE", "WAS", "WERE", "BEEN", "HAVE", "HAS", "HAD", "NOT",
-                        "BUT", "CAN", "ALL", "THEIR", "WHAT", "WHEN", "WHO", "HOW",
-                        "USD", "USA", "INC"}
-        return {m for m in matches if m not in common_words and len(m) >= 2}
+        return {m for m in matches if m not in ALLCAPS_STOPWORDS and len(m) >= 2}
 
     def extract_special_patterns(self, text: str) -> Set[str]:
         """
@@ -129,7 +216,10 @@ class KeywordExtractor:
         Extract noun phrases using spaCy.
         Examples: distributed systems, machine learning, version control
         """
-        doc = self.nlp(text)
+        return self.noun_phrases_from_doc(self.nlp(text))
+
+    def noun_phrases_from_doc(self, doc: Doc) -> Set[str]:
+        """Extract noun phrases from an already-parsed spaCy Doc."""
         phrases = set()
 
         for chunk in doc.noun_chunks:
@@ -195,13 +285,19 @@ class KeywordExtractor:
 
         return results
 
-    def extract_candidates(self, text: str, company: str) -> dict[str, CandidateTerm]:
+    def extract_candidates(
+        self,
+        text: str,
+        company: str,
+        doc: Optional[Doc] = None
+    ) -> dict[str, CandidateTerm]:
         """
         Extract all candidate terms from text using all signals.
 
         Args:
             text: Preprocessed text from job description
             company: Company name for source tracking
+            doc: Optional pre-parsed spaCy Doc for text (parsed here if None)
 
         Returns:
             Dictionary mapping normalized term to CandidateTerm
@@ -225,34 +321,93 @@ class KeywordExtractor:
             candidates[key].count += 1
             candidates[key].signals.add(signal)
 
-        # Apply all extraction signals
-        for term in self.extract_camelcase(text):
+        # Apply all extraction signals. Each signal's terms are added in sorted
+        # order so the result doesn't depend on set iteration order (which
+        # differs between processes).
+        regex_signals = scan_signals(text)
+
+        for term in sorted(regex_signals["camelcase"]):
             add_candidate(term, "camelcase")
 
-        for term in self.extract_allcaps(text):
+        for term in sorted(regex_signals["allcaps"]):
             add_candidate(term, "allcaps")
 
-        for term in self.extract_special_patterns(text):
+        for term in sorted(regex_signals["special_pattern"]):
             add_candidate(term, "special_pattern")
 
-        for term in self.extract_noun_phrases(text):
+        noun_phrases = self.extract_noun_phrases(text) if doc is None else self.noun_phrases_from_doc(doc)
+        for term in sorted(noun_phrases):
             add_candidate(term, "noun_phrase")
 
-        for term in self.extract_from_context(text):
+        for term in sorted(self.extract_from_context(text)):
             add_candidate(term, "context")
 
-        for term in self.extract_single_tech_words(text):
+        for term in sorted(regex_signals["single_word"]):
             add_candidate(term, "single_word")
 
         return candidates
 
+    def extract_candidates_batch(
+        self,
+        docs: Iterable[tuple[str, str]],
+        batch_size: int = 64
+    ) -> Iterator[dict[str, CandidateTerm]]:
+        """
+        Extract candidates from many documents, parsing them in batches.
+
+        Texts are streamed through nlp.pipe with only the components noun
+        chunks need, which is much faster than one nlp() call per document.
 
-def merge_candidates(all_candidates: list[dict[str, CandidateTerm]]) -> dict[str, CandidateTerm]:
+        Args:
+            docs: Iterable of (preprocessed text, company) pairs
+            batch_size: Number of texts spaCy parses per batch
+
+        Yields:
+            Candidate dictionaries, one per input document, in input order
+        """
+        parsed = self.noun_chunk_nlp.pipe(
+            ((text, (text, company)) for text, company in docs),
+            as_tuples=True,
+            batch_size=batch_size
+        )
+
+        for doc, (text, company) in parsed:
+            yield self.extract_candidates(text, company, doc=doc)
+
+
+def merge_into(merged: dict[str, CandidateTerm], candidates: dict[str, CandidateTerm]) -> None:
+    """
+    Fold one document's candidates into a running merge.
+
+    Args:
+        merged: Merged dictionary, updated in place
+        candidates: Candidate dictionary from a single document
+    """
+    for key, candidate in candidates.items():
+        if key not in merged:
+            merged[key] = CandidateTerm(
+                term=candidate.term,
+                original_forms=set(candidate.original_forms),
+                sources=set(candidate.sources),
+                count=candidate.count,
+                signals=set(candidate.signals)
+            )
+        else:
+            merged[key].original_forms.update(candidate.original_forms)
+            merged[key].sources.update(candidate.sources)
+            merged[key].count += candidate.count
+            merged[key].signals.update(candidate.signals)
+
+
+def merge_candidates(all_candidates: Iterable[dict[str, CandidateTerm]]) -> dict[str, CandidateTerm]:
     """
     Merge candidate dictionaries from multiple documents.
 
+    Documents are folded in one at a time, so all_candidates can be a
+    generator.
+
     Args:
-        all_candidates: List of candidate dictionaries from each document
+        all_candidates: Candidate dictionaries from each document
 
     Returns:
         Merged dictionary with aggregated counts and sources
@@ -260,19 +415,6 @@ def merge_candidates(all_candidates: list[dict[str, CandidateTerm]]) -> dict[str
     merged: dict[str, CandidateTerm] = {}
 
     for candidates in all_candidates:
-        for key, candidate in candidates.items():
-            if key not in merged:
-                merged[key] = CandidateTerm(
-                    term=candidate.term,
-                    original_forms=set(candidate.original_forms),
-                    sources=set(candidate.sources),
-                    count=candidate.count,
-                    signals=set(candidate.signals)
-                )
-            else:
-                merged[key].original_forms.update(candidate.original_forms)
-                merged[key].sources.update(candidate.sources)
-                merged[key].count += candidate.count
-                merged[key].signals.update(candidate.signals)
+        merge_into(merged, candidates)
 
     return merged
@@ -4,9 +4,12 @@ Handles noise filtering for candidate terms.
 """
 
 import re
-from typing import Set
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, Set
 
 from .extractor import CandidateTerm
+from .term_matcher import TermMatcher
 
 
 # Common English words to filter out (top frequent words + job posting jargon)
@@ -291,258 +294,310 @@ PROTECTED_TERMS: Set[str] = {
 }
 
 
-def is_noise_pattern(term: str) -> bool:
-    """Check if term matches common noise patterns from web scraping."""
-    term_stripped = term.strip()
-    term_lower = term_stripped.lower()
-
-    # Contains "linkedin" anywhere
-    if "linkedin" in term_lower:
+@dataclass
+class NoiseRule:
+    """One check in the noise rule table, with optional hit/timing counters."""
+    name: str
+    test: Callable[[str], object]  # Truthy result = noise
+    lower: bool = False  # Test the lowercased term instead of the stripped one
+    hits: int = 0
+    evaluations: int = 0
+    seconds: float = 0.0
+
+
+def _search(pattern: str, flags: int = 0) -> Callable[[str], object]:
+    """Rule test: compiled re.search."""
+    return re.compile(pattern, flags).search
+
+
+def _match(pattern: str, flags: int = 0) -> Callable[[str], object]:
+    """Rule test: compiled re.match."""
+    return re.compile(pattern, flags).match
+
+
+def _alternation(patterns: list[str]) -> str:
+    """Combine patterns into a single alternation."""
+    return "|".join(f"(?:{pattern})" for pattern in patterns)
+
+
+JOB_TITLE_WORDS = frozenset({"software", "engineer", "developer", "devops", "ios", "machine", "learning", "data"})
+
+# Lowercase prefixes of scraping concatenations like integratingAI, orJira, likeAndroid
+CONCATENATION_PREFIXES = ["integrating", "or", "like", "year", "processing", "source", "trust", "selling",
+                          "leverage", "schools", "build", "about", "why", "either"]
+
+JOB_METADATA_PATTERNS = [
+    r"job\s*(#|openings?|post)",
+    r"easy\s*apply",
+    r"phd\s*(student|level|expertise)",
+    r"dod\s*clearance",
+    r"github\s*profile",
+    r"why\s*join",
+    r"is\s*valuable",
+    r"co-?ops?",
+    r"portfolio",
+    r"worldwide",
+    r"pride",
+    r"comptia",
+    r"benefits?\s*bonus",
+    r"graduation",
+    r"govcon",
+]
+
+# Location fragments (SoHo, SoCal, FiDi, SoMa, etc.)
+LOCATION_FRAGMENTS = frozenset({"soho", "socal", "fidi", "soma", "antonio", "ontario", "san antonio"})
+
+# LinkedIn-specific UI patterns
+LINKEDIN_NOISE_PATTERNS = [
+    r"select language",
+    r"show\s+\w+\s+details",
+    r"be notified",
+    r"cover letter",
+    r"linkedin data",
+    r"verified job",
+    r"candidate seniority",
+    r"recommended content",
+]
+
+# Typical endings of CamelCase company names (SmartHub, NetJets, ...)
+COMPANY_SUFFIXES = ["Hub", "Lab", "Labs", "Point", "Solve", "Link", "Finder", "Tech", "Ware",
+                    "Wise", "Soft", "Sure", "Wave", "View", "Meter", "Health", "Brain", "Heart",
+                    "Works", "Stack", "Base", "Amp", "Curve", "Tier", "Lock", "Smith", "Flair",
+                    "Bridge", "Cast", "Flow", "Fort", "Adapt", "Sort", "Spect", "Gear", "Well",
+                    "Fire", "Pool", "Cube", "Grid", "Lens", "Box", "Book", "Hive", "Rise", "Track",
+                    "Vest", "Quest", "Dash", "Craft", "Gum", "Hill", "Ray", "Hawk", "Fox", "Jet",
+                    "Pallet", "Mail", "Pass", "Brik", "Data", "Gate", "Force", "Match", "Sight",
+                    "Pro", "Ops", "Ai", "AI", "IQ", "AQ", "Me", "ABA", "Rx", "Med", "Dox"]
+
+_camel_words = re.compile(r"[A-Z][a-z]+(?:[A-Z][a-z]+)+").search
+_developer_words = re.compile(r"(?:developer|engineer)\s+[a-z]+\s+[a-z]+").search
+_level_code = re.compile(r"^[A-Z]{1,2}\d{1,2}$|^[SFWQH]\d{1,2}$").match
+_concatenation = re.compile(r"^(?:" + "|".join(CONCATENATION_PREFIXES) + r")[A-Z][a-z]").match
+_letters_only = re.compile(r"^[A-Za-z]{8,}$").match
+_camel_start = re.compile(r"^[A-Z][a-z]+[A-Z]").match
+# Suffix with at least 3 characters in front of it
+_company_suffix = re.compile(r".{3,}(?:" + "|".join(COMPANY_SUFFIXES) + r")", re.DOTALL).fullmatch
+
+
+def _is_job_title_with_company(term: str) -> bool:
+    # Job title + company name patterns (Software Engineer RemoteHunter, iOS Developer crtd labs)
+    term_lower = term.lower()
+    words = term_lower.split()
+    if JOB_TITLE_WORDS.isdisjoint(words):
+        return False
+    if len(words) >= 3 and _camel_words(term):
         return True
+    return _developer_words(term_lower) is not None
 
-    # Contains "+X years" or "+X employees" or "+X benefit" or similar patterns
-    if re.search(r"\+\s*\d*\s*(years?|employees?|benefits?|more|stock|bonus|developers?|engineers?|people|partners?)", term_lower):
-        return True
 
-    # Contains statistics patterns (100+ companies, 65M+ customers, etc.)
-    if re.search(r"\d+\+?\s*(companies|customers|users|countries|firms|exchanges|outlets|subjects|lines|languages|days|weeks|months|insurers|minds|providers|litigations|events)", term_lower):
-        return True
+def _is_level_or_batch_code(term: str) -> bool:
+    # Level/IC codes (IC1, L2, NC2, ...) and batch/quarter codes (S25, Q1, H1, ...)
+    return _level_code(term) is not None and term.lower() not in PROTECTED_TERMS
 
-    # Contains "sec.gov" or hiring patterns
-    if "sec.gov" in term_lower or "hiring" in term_lower:
-        return True
-
-    # Job title + company name patterns (Software Engineer RemoteHunter, etc.)
-    job_title_words = ["software", "engineer", "developer", "devops", "ios", "machine", "learning", "data"]
-    words_in_term = term_lower.split()
-    if any(w in words_in_term for w in job_title_words):
-        if len(words_in_term) >= 3 and re.search(r"[A-Z][a-z]+(?:[A-Z][a-z]+)+", term_stripped):
-            return True
-        # Also catch "iOS Developer crtd labs" style
-        if re.search(r"(?:developer|engineer)\s+[a-z]+\s+[a-z]+", term_lower):
-            return True
 
-    # YC batch codes (YC S25, YC F25, YC W24, YC X25)
-    if re.match(r"^YC\s+[SFWX]\d{2}$", term_stripped, re.IGNORECASE):
-        return True
+def _is_concatenation(term: str) -> bool:
+    # Malformed concatenations (integratingAI, orJira, likeAndroid, yearYour)
+    return len(term) > 6 and _concatenation(term) is not None
 
-    # Job reference IDs (letter + numbers like R277297, A3061877, J0825, etc.)
-    if re.match(r"^[A-Z]{1,3}\d{3,}$", term_stripped):
-        return True
 
-    # Level/IC codes (IC1, IC2, L2, L3, L4, NC2, VS2, etc.)
-    if re.match(r"^[A-Z]{1,2}\d{1,2}$", term_stripped) and term_lower not in PROTECTED_TERMS:
-        return True
+def _has_no_vowels(term: str) -> bool:
+    # Long letter-only string with no vowels - likely garbage
+    return _letters_only(term) is not None and not any(c in term.lower() for c in "aeiou")
 
-    # Batch/quarter codes (S25, F25, W24, Q1, Q4, H1, etc.) - but not tech terms
-    if re.match(r"^[SFWQH]\d{1,2}$", term_stripped) and term_lower not in PROTECTED_TERMS:
-        return True
 
+def _is_mostly_non_ascii(term: str) -> bool:
+    # Foreign language text from language selectors (more than 30% non-ASCII)
+    if term.isascii():
+        return False
+    non_ascii_count = sum(1 for c in term if ord(c) > 127)
+    return non_ascii_count > len(term) * 0.3
+
+
+def _is_company_name(term: str) -> bool:
+    # CamelCase names ending in a typical company suffix, unless a known tech term
+    return (
+        _camel_start(term) is not None
+        and _company_suffix(term) is not None
+        and term.lower() not in PROTECTED_TERMS
+    )
+
+
+# Noise rules, evaluated in order; a term is noise if any rule matches.
+NOISE_RULES: list[NoiseRule] = [
+    NoiseRule("linkedin", lambda t: "linkedin" in t, lower=True),
+    # "+X years", "+X employees", "+X benefit" and similar
+    NoiseRule("plus_quantity", _search(
+        r"\+\s*\d*\s*(years?|employees?|benefits?|more|stock|bonus|developers?|engineers?|people|partners?)"),
+        lower=True),
+    # Statistics (100+ companies, 65M+ customers, etc.)
+    NoiseRule("statistics", _search(
+        r"\d+\+?\s*(companies|customers|users|countries|firms|exchanges|outlets|subjects|lines|languages"
+        r"|days|weeks|months|insurers|minds|providers|litigations|events)"), lower=True),
+    NoiseRule("hiring", _search(r"sec\.gov|hiring"), lower=True),
+    NoiseRule("job_title_company", _is_job_title_with_company),
+    # YC batch codes (YC S25, YC F25, YC W24, YC X25)
+    NoiseRule("yc_batch", _match(r"^YC\s+[SFWX]\d{2}$", re.IGNORECASE)),
+    # Job reference IDs (R277297, A3061877, J0825, etc.)
+    NoiseRule("job_reference_id", _match(r"^[A-Z]{1,3}\d{3,}$")),
+    NoiseRule("level_or_batch_code", _is_level_or_batch_code),
     # Malformed text with 'n' joining words (scraping artifacts)
-    if re.search(r"[a-z]n[A-Z]|nn[A-Z]|n[A-Z][a-z]+$", term_stripped):
-        return True
-
-    # Malformed concatenations (integratingAI, orJira, likeAndroid, yearYour)
-    # These are lowercase word + uppercase continuation without proper separation
-    if re.match(r"^[a-z]+[A-Z][a-z]+", term_stripped) and len(term_stripped) > 6:
-        # Check if first part is a common English word fragment
-        first_part_match = re.match(r"^([a-z]+)[A-Z]", term_stripped)
-        if first_part_match:
-            first_part = first_part_match.group(1).lower()
-            common_prefixes = ["integrating", "or", "like", "year", "processing", "source", "trust", "selling", "leverage", "schools", "build", "about", "why", "either"]
-            if first_part in common_prefixes:
-                return True
-
-    # Unicode escape sequences
-    if re.search(r"u003[e>]", term_lower):
-        return True
-
+    NoiseRule("n_joined", _search(r"[a-z]n[A-Z]|nn[A-Z]|n[A-Z][a-z]+$")),
+    NoiseRule("concatenation", _is_concatenation),
+    NoiseRule("unicode_escape", _search(r"u003[e>]"), lower=True),
     # Timestamps (10:23 PM, 12:00 AM, etc.)
-    if re.match(r"^\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?$", term_stripped):
-        return True
-
-    # Salary patterns with K notation (100K, 150K-200K, K/yr, etc.)
-    if re.search(r"\d+K(?:/yr|/hr)?|\$?\d+K\s*-\s*\$?\d+K|K/yr\s*-\s*K", term_stripped, re.IGNORECASE):
-        return True
-
-    # Salary patterns with yr/bonus
-    if re.search(r"yr\s*\+\s*(stock|bonus)", term_lower):
-        return True
-
-    # Price patterns (.00 - .00)
-    if re.search(r"\.00\s*-\s*\.00", term_stripped):
-        return True
-
-    # Employee count patterns (1001-5000 employees, 51-200, etc.)
-    if re.search(r"\d+\s*-\s*\d+\s*employees", term_stripped, re.IGNORECASE):
-        return True
-    if re.match(r"^\d+-\d+\s*employees?$", term_stripped, re.IGNORECASE):
-        return True
-
+    NoiseRule("timestamp", _match(r"^\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)?$")),
+    # Salary patterns (100K, 150K-200K, K/yr, yr + bonus, .00 - .00)
+    NoiseRule("salary_k", _search(r"\d+K(?:/yr|/hr)?|\$?\d+K\s*-\s*\$?\d+K|K/yr\s*-\s*K", re.IGNORECASE)),
+    NoiseRule("salary_bonus", _search(r"yr\s*\+\s*(stock|bonus)"), lower=True),
+    NoiseRule("price", _search(r"\.00\s*-\s*\.00")),
+    # Employee counts (1001-5000 employees, 51-200 employees)
+    NoiseRule("employee_count", _search(r"\d+\s*-\s*\d+\s*employees|^\d+-\d+\s*employees?$", re.IGNORECASE)),
     # Pure numeric with units or ranges
-    if re.match(r"^[\d,.\-\s]+(?:K|M|B|k|m|b|hr|yr|%|GB|MB|TB)?$", term_stripped):
-        return True
-
-    # Date/time patterns
-    if re.match(r"^\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}$", term_stripped):
-        return True
-    if re.match(r"^\d{4}[-–]\d{4}$", term_stripped):
-        return True
-
-    # Year + word patterns (2026 Questions, etc.)
-    if re.match(r"^\d{4}\s+\w+", term_stripped):
-        return True
-
+    NoiseRule("numeric_units", _match(r"^[\d,.\-\s]+(?:K|M|B|k|m|b|hr|yr|%|GB|MB|TB)?$")),
+    NoiseRule("date", _match(r"^\d{1,2}[/\-]\d{1,2}[/\-]\d{2,4}$|^\d{4}[-–]\d{4}$")),
+    # Year + word (2026 Questions, etc.)
+    NoiseRule("year_word", _match(r"^\d{4}\s+\w+")),
     # Starts with special characters or numbers followed by noise
-    if re.match(r"^[#\-\(\)\"\'·]+\s*\d", term_stripped):
-        return True
-
+    NoiseRule("punctuation_number", _match(r"^[#\-\(\)\"\'·]+\s*\d")),
     # Starts with · (bullet point from scraping)
-    if term_stripped.startswith("·"):
-        return True
-
-    # Parenthetical fragments
-    if re.match(r"^\([^)]*$", term_stripped) or re.match(r"^[^(]*\)$", term_stripped):
-        return True
-
-    # Just punctuation and spaces
-    if re.match(r"^[\s\-\.\,\;\:\!\?\(\)\[\]\{\}\"\'\/\\]+$", term_stripped):
-        return True
-
+    NoiseRule("bullet", lambda t: t.startswith("·")),
+    NoiseRule("parenthetical_fragment", _match(r"^\([^)]*$|^[^(]*\)$")),
+    NoiseRule("punctuation_only", _match(r"^[\s\-\.\,\;\:\!\?\(\)\[\]\{\}\"\'\/\\]+$")),
     # Very long terms (likely sentence fragments)
-    if len(term_stripped.split()) > 4:
-        return True
-
-    # Contains currency symbols with numbers
-    if re.search(r"[\$€£¥]\s*[\d,]+", term_stripped):
-        return True
-
-    # URL-like fragments
-    if re.search(r"\.com|\.org|\.net|\.io|\.ai|\.co|www\.|http", term_stripped, re.IGNORECASE):
-        return True
-
-    # Contains "USD" (salary info)
-    if "usd" in term_lower:
-        return True
-
-    # Contains "ARR" or financial metrics
-    if re.search(r"\d+[MBK]?\+?\s*ARR", term_stripped):
-        return True
-
-    # Random hex/alphanumeric strings (ff82, VpDDQfyzOf, etc.)
-    if re.match(r"^[a-f0-9]{4,}$", term_lower):  # Hex strings
-        return True
-    if re.match(r"^[A-Za-z]{8,}$", term_stripped) and not any(c in term_lower for c in "aeiou"):
-        # Long string with no vowels - likely garbage
-        return True
-
-    # Job metadata phrases
-    job_metadata_patterns = [
-        r"job\s*(#|openings?|post)",
-        r"easy\s*apply",
-        r"phd\s*(student|level|expertise)",
-        r"dod\s*clearance",
-        r"github\s*profile",
-        r"why\s*join",
-        r"is\s*valuable",
-        r"co-?ops?",
-        r"portfolio",
-        r"worldwide",
-        r"pride",
-        r"comptia",
-        r"benefits?\s*bonus",
-        r"graduation",
-        r"govcon",
-    ]
-    for pattern in job_metadata_patterns:
-        if re.search(pattern, term_lower):
-            return True
-
-    # Location fragments (SoHo, SoCal, FiDi, SoMa, etc.)
-    location_fragments = ["soho", "socal", "fidi", "soma", "antonio", "ontario", "san antonio"]
-    if term_lower in location_fragments:
-        return True
-
-    # Company/product name + City patterns (NetJets Columbus, GumGum Santa Monica, etc.)
-    if re.search(r"[A-Z][a-z]+(?:[A-Z][a-z]+)*\s+(?:Columbus|Pittsburgh|Minneapolis|Seattle|Monica|Webster|Ogden|Norwalk)", term_stripped):
-        return True
-
-    # State abbreviation + Company name patterns (IL BlackRock, etc.)
-    if re.match(r"^[A-Z]{2}\s+[A-Z][a-z]+", term_stripped):
-        return True
-
-    # Language codes and locale patterns (common in LinkedIn scraped data)
-    # (Arabic) বাংলা, (Finnish) Français, Japanese) 한국어, etc.
-    if re.match(r"^\([A-Za-z]+\)\s+", term_stripped):
-        return True
-    if re.search(r"\)\s+[^\x00-\x7F]", term_stripped):  # ) followed by non-ASCII
-        return True
-    if re.match(r"^[A-Za-z]+\)\s+", term_stripped):  # Missing opening paren
-        return True
-
-    # Non-ASCII characters (foreign language text from language selectors)
-    # Keep only if it's a known tech term or mostly ASCII
-    non_ascii_count = sum(1 for c in term_stripped if ord(c) > 127)
-    if non_ascii_count > len(term_stripped) * 0.3:  # More than 30% non-ASCII
-        return True
-
+    NoiseRule("too_many_words", lambda t: len(t.split()) > 4),
+    NoiseRule("currency", _search(r"[\$€£¥]\s*[\d,]+")),
+    NoiseRule("url_fragment", _search(r"\.com|\.org|\.net|\.io|\.ai|\.co|www\.|http", re.IGNORECASE)),
+    NoiseRule("usd", lambda t: "usd" in t, lower=True),
+    NoiseRule("arr", _search(r"\d+[MBK]?\+?\s*ARR")),
+    # Random hex strings (ff82, etc.)
+    NoiseRule("hex_string", _match(r"^[a-f0-9]{4,}$"), lower=True),
+    NoiseRule("no_vowels", _has_no_vowels),
+    NoiseRule("job_metadata", _search(_alternation(JOB_METADATA_PATTERNS)), lower=True),
+    NoiseRule("location_fragment", LOCATION_FRAGMENTS.__contains__, lower=True),
+    # Company/product name + City (NetJets Columbus, GumGum Santa Monica, etc.)
+    NoiseRule("company_city", _search(
+        r"[A-Z][a-z]+(?:[A-Z][a-z]+)*\s+(?:Columbus|Pittsburgh|Minneapolis|Seattle|Monica|Webster|Ogden|Norwalk)")),
+    # State abbreviation + Company name (IL BlackRock, etc.)
+    NoiseRule("state_company", _match(r"^[A-Z]{2}\s+[A-Z][a-z]+")),
+    # Language selector entries: (Arabic) বাংলা, (Finnish) Français, Japanese) 한국어
+    NoiseRule("language_selector", _search(r"^\([A-Za-z]+\)\s+|\)\s+[^\x00-\x7F]|^[A-Za-z]+\)\s+")),
+    NoiseRule("non_ascii", _is_mostly_non_ascii),
     # Random scraped UI elements
-    if re.search(r"/yr\s*-\s*/yr|/hr\s*-\s*/hr|\d+\.\d+K", term_stripped):
-        return True
-
-    # LinkedIn-specific UI patterns
-    linkedin_noise_patterns = [
-        r"select language",
-        r"show\s+\w+\s+details",
-        r"be notified",
-        r"cover letter",
-        r"linkedin data",
-        r"verified job",
-        r"candidate seniority",
-        r"recommended content",
-    ]
-    for pattern in linkedin_noise_patterns:
-        if re.search(pattern, term_lower):
-            return True
+    NoiseRule("scraped_ui", _search(r"/yr\s*-\s*/yr|/hr\s*-\s*/hr|\d+\.\d+K")),
+    NoiseRule("linkedin_ui", _search(_alternation(LINKEDIN_NOISE_PATTERNS)), lower=True),
+    NoiseRule("company_suffix", _is_company_name),
+    # Company/product names with ® or TM symbols
+    NoiseRule("trademark", _search(r"[®™]")),
+    # "About X", "Why X", "X's mission/values/purpose/focus"
+    NoiseRule("about_prefix", _match(r"^(About|Why|Join|Us)\s+[A-Z]")),
+    NoiseRule("possessive_phrase", _search(
+        r"'s\s+(mission|values|purpose|focus|efforts|strategy|cloud|products|customers|earliest)"), lower=True),
+    # "X customers", "X employees", "X reserves", "X instances" patterns
+    NoiseRule("company_plural", _search(
+        r"[A-Z][a-z]+\s+(customers|employees|reserves|instances|products|applications|teams)")),
+    # Random alphanumeric IDs (TCP_01, VpDDQfyzOf)
+    NoiseRule("random_id", _match(r"^[A-Za-z]{2,}_\d{2}$|^[A-Z][a-z][A-Z]{2,}[a-z]{2,}[A-Z][a-z]+$")),
+]
 
-    # Company name patterns - CamelCase names that end with typical company suffixes
-    company_suffixes = ["Hub", "Lab", "Labs", "Point", "Solve", "Link", "Finder", "Tech", "Ware",
-                        "Wise", "Soft", "Sure", "Wave", "View", "Meter", "Health", "Brain", "Heart",
-                        "Works", "Stack", "Base", "Amp", "Curve", "Tier", "Lock", "Smith", "Flair",
-                        "Bridge", "Cast", "Flow", "Fort", "Adapt", "Sort", "Spect", "Gear", "Well",
-                        "Fire", "Pool", "Cube", "Grid", "Lens", "Box", "Book", "Hive", "Rise", "Track",
-                        "Vest", "Quest", "Dash", "Craft", "Gum", "Hill", "Ray", "Hawk", "Fox", "Jet",
-                        "Pallet", "Mail", "Pass", "Brik", "Data", "Gate", "Force", "Match", "Sight",
-                        "Pro", "Ops", "Ai", "AI", "IQ", "AQ", "Me", "ABA", "Rx", "Med", "Dox"]
-    for suffix in company_suffixes:
-        if term_stripped.endswith(suffix) and len(term_stripped) > len(suffix) + 2:
-            # Check if it looks like a company name (CamelCase)
-            if re.match(r"^[A-Z][a-z]+[A-Z]", term_stripped):
-                # But not if it's a known tech pattern
-                if term_lower not in PROTECTED_TERMS:
-                    return True
 
-    # Company/product names with ® or TM symbols
-    if re.search(r"[®™]", term_stripped):
-        return True
+class NoiseRuleEngine:
+    """
+    Evaluates a noise rule table in order.
 
-    # Patterns like "About X", "Why X", "X's mission/values/purpose/focus"
-    if re.match(r"^(About|Why|Join|Us)\s+[A-Z]", term_stripped):
-        return True
-    if re.search(r"'s\s+(mission|values|purpose|focus|efforts|strategy|cloud|products|customers|earliest)", term_lower):
-        return True
+    With collect_stats on, each rule records how often it was evaluated,
+    how often it matched and the time spent in it, so rules can be
+    reordered by cost and hit rate.
+    """
 
-    # "X customers", "X employees", "X reserves", "X instances" patterns
-    if re.search(r"[A-Z][a-z]+\s+(customers|employees|reserves|instances|products|applications|teams)", term_stripped):
-        return True
+    def __init__(self, rules: list[NoiseRule]):
+        self.rules = rules
+        self.collect_stats = False
+
+    def first_match(self, term: str) -> Optional[str]:
+        """Name of the first rule that flags term as noise, or None."""
+        term_stripped = term.strip()
+        term_lower = term_stripped.lower()
+
+        if not self.collect_stats:
+            for rule in self.rules:
+                if rule.test(term_lower if rule.lower else term_stripped):
+                    return rule.name
+            return None
+
+        for rule in self.rules:
+            start = time.perf_counter()
+            hit = rule.test(term_lower if rule.lower else term_stripped)
+            rule.seconds += time.perf_counter() - start
+            rule.evaluations += 1
+            if hit:
+                rule.hits += 1
+                return rule.name
+        return None
+
+    def reset_stats(self) -> None:
+        for rule in self.rules:
+            rule.hits = 0
+            rule.evaluations = 0
+            rule.seconds = 0.0
+
+    def stats_report(self) -> list[str]:
+        """Per-rule hits and cumulative time, in evaluation order."""
+        lines = [f"{'rule':<24} {'hits':>7} {'evals':>8} {'total ms':>9} {'us/eval':>8}"]
+        for rule in self.rules:
+            per_eval = rule.seconds / rule.evaluations * 1e6 if rule.evaluations else 0.0
+            lines.append(
+                f"{rule.name:<24} {rule.hits:>7} {rule.evaluations:>8} "
+                f"{rule.seconds * 1000:>9.2f} {per_eval:>8.2f}"
+            )
+        return lines
+
+
+noise_rules = NoiseRuleEngine(NOISE_RULES)
 
-    # Random alphanumeric IDs (like VpDDQfyzOf, TCP_01)
-    if re.match(r"^[A-Za-z]{2,}_\d{2}$", term_stripped):
-        return True
-    if re.match(r"^[A-Z][a-z][A-Z]{2,}[a-z]{2,}[A-Z][a-z]+$", term_stripped):  # VpDDQfyzOf pattern
-        return True
 
-    return False
+def is_noise_pattern(term: str) -> bool:
+    """Check if term matches common noise patterns from web scraping."""
+    return noise_rules.first_match(term) is not None
+
+
+# Words that make a multi-word phrase "common" (see is_common_word)
+COMMON_OR_LOCATION_WORDS = frozenset(COMMON_ENGLISH_STOPWORDS | LOCATION_WORDS)
+
+TECH_SUFFIXES = TermMatcher([
+    "js", "db", "sql", "api", "sdk", "cli", "gui", "ide", "ops",
+    "ql", "ml", "ai", "io", "ui", "ux",
+])
+
+TECH_PREFIXES = TermMatcher([
+    "apache", "google", "amazon", "microsoft", "aws", "azure",
+    "react", "angular", "vue", "node", "spring", "django", "flask",
+    "docker", "kube", "terraform", "ansible",
+    "mongo", "postgres", "mysql", "redis", "elastic",
+    "kafka", "spark", "hadoop", "airflow",
+    "tensor", "torch", "keras",
+])
+
+# Multi-word tech phrases, matched anywhere in a term after whitespace is collapsed
+TECH_PHRASES = TermMatcher([
+    "machine learning",
+    "deep learning",
+    "neural network",
+    "data structure",
+    "distributed system",
+    "version control",
+    "object-oriented", "object oriented",
+    "functional programming",
+    "microservice", "micro service",
+    "event-driven", "event driven",
+    "test-driven", "test driven",
+    "continuous integration", "continuous delivery", "continuous deployment",
+    "cicd", "ci/cd", "ci cd", "ci / cd", "ci/ cd", "ci /cd",
+    "restapi", "rest api",
+    "web service",
+    "cloud native", "cloud computing",
+    "containerization", "container ization",
+    "code review",
+])
 
 
 def is_numeric_or_date(term: str) -> bool:
@@ -582,10 +637,7 @@ def is_common_word(term: str) -> bool:
     # For multi-word phrases, check if ALL words are common/locations
     words = term_lower.split()
     if len(words) > 1:
-        all_common = all(
-            w in COMMON_ENGLISH_STOPWORDS or w in LOCATION_WORDS
-            for w in words
-        )
+        all_common = all(w in COMMON_OR_LOCATION_WORDS for w in words)
         if all_common:
             return True
 
@@ -629,52 +681,16 @@ def is_likely_tech_term(term: str) -> bool:
         return True
 
     # Known tech-related suffixes/prefixes
-    tech_suffixes = [
-        "js", "db", "sql", "api", "sdk", "cli", "gui", "ide", "ops",
-        "ql", "ml", "ai", "io", "ui", "ux",
-    ]
-    tech_prefixes = [
-        "apache", "google", "amazon", "microsoft", "aws", "azure",
-        "react", "angular", "vue", "node", "spring", "django", "flask",
-        "docker", "kube", "terraform", "ansible",
-        "mongo", "postgres", "mysql", "redis", "elastic",
-        "kafka", "spark", "hadoop", "airflow",
-        "tensor", "torch", "keras",
-    ]
-
-    for suffix in tech_suffixes:
-        if term_lower.endswith(suffix) and len(term) > len(suffix):
+    for suffix in TECH_SUFFIXES.suffixes_of(term_lower):
+        if len(term) > len(suffix):
             return True
 
-    for prefix in tech_prefixes:
-        if term_lower.startswith(prefix):
-            return True
+    if TECH_PREFIXES.starts_with_any(term_lower):
+        return True
 
     # Multi-word tech phrases
-    tech_phrase_patterns = [
-        r"machine\s+learning",
-        r"deep\s+learning",
-        r"neural\s+network",
-        r"data\s+structure",
-        r"distributed\s+system",
-        r"version\s+control",
-        r"object[- ]oriented",
-        r"functional\s+programming",
-        r"micro\s*service",
-        r"event[- ]driven",
-        r"test[- ]driven",
-        r"continuous\s+(integration|delivery|deployment)",
-        r"ci[/\s]*cd",
-        r"rest\s*api",
-        r"web\s+service",
-        r"cloud\s+(native|computing)",
-        r"container\s*ization",
-        r"code\s+review",
-    ]
-
-    for pattern in tech_phrase_patterns:
-        if re.search(pattern, term_lower):
-            return True
+    if TECH_PHRASES.contains_any(" ".join(term_lower.split())):
+        return True
 
     # Check for ALL_CAPS acronyms that are 2-5 chars (likely tech acronyms)
     if re.match(r"^[A-Z]{2,5}$", term) and term_lower in PROTECTED_TERMS:
@@ -717,14 +733,15 @@ def filter_candidates(
         # Determine the best original form to use
         best_form = term
         if candidate.original_forms:
-            # Prefer forms with tech patterns
-            for form in candidate.original_forms:
+            # Prefer forms with tech patterns (sorted so ties resolve the same way every run)
+            forms = sorted(candidate.original_forms)
+            for form in forms:
                 if has_tech_pattern(form):
                     best_form = form
                     break
             else:
                 # Use the form with most uppercase letters as likely proper name
-                best_form = max(candidate.original_forms,
+                best_form = max(forms,
                                key=lambda x: sum(1 for c in x if c.isupper()))
 
         candidate.term = best_form
@@ -3,8 +3,15 @@ Main Entry Point
 Orchestrates the keyword extraction pipeline.
 """
 
+import argparse
+import os
+import sqlite3
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Sequence
 
 if __name__ == "__main__" and __package__ is None:
     # Add the parent directory to sys.path to allow relative imports
@@ -12,12 +19,34 @@ if __name__ == "__main__" and __package__ is None:
     sys.path.append(str(file_path.parent.parent))
     __package__ = file_path.parent.name
 
-from .file_reader import get_all_job_descriptions
+from .file_reader import JobDescription, get_all_job_descriptions, read_job_descriptions
 from .preprocessor import preprocess_text
-from .extractor import KeywordExtractor, merge_candidates
-from .filters import filter_candidates
-from .clusterer import TermClusterer
+from .extractor import CandidateTerm, KeywordExtractor
+from .filters import filter_candidates, noise_rules
+from .clusterer import (
+    DEFAULT_DRIFT_THRESHOLD,
+    DEFAULT_REDUCED_DIMENSIONS,
+    EMBEDDING_SOURCES,
+    K_SELECTION_MODES,
+    REDUCTION_METHODS,
+    ClusterModel,
+    TermClusterer,
+)
+from .parallel import ExtractionPool
+from .candidate_cache import CandidateCache
+from .embedding_cache import EmbeddingCache
+from .corpus_embeddings import CorpusEmbedder
+from .similarity_index import SimilarityIndex
+from .term_store import TermStore
+from .output_manifest import MANIFEST_FILE, manifest_for
+from .clean_keywords import clean_candidates
+from .refine_engine import DEFAULT_RULES, MASTER_SKILLS_FILE, load_rules, run_refine_chain
+from .sqlite_sink import SQLITE_FILE, companies_mentioning, write_sqlite
+from .columnar_export import EXPORT_FORMATS, require_pyarrow, write_candidate_table
 from .output_writer import (
+    JSON_FORMATS,
+    aggregate_candidates,
+    json_output_path,
     write_raw_candidates,
     write_filtered_candidates,
     write_clustered_keywords,
@@ -27,7 +56,145 @@ from .output_writer import (
 )
 
 
-def run_extraction(input_dir: str | Path, output_dir: str | Path, min_occurrences: int = 2) -> None:
+# Fitted clustering state, saved next to 3_clustered_keywords.json for incremental runs
+CLUSTER_MODEL_FILE = "3_cluster_model.npz"
+
+# Fitted corpus embeddings (--embeddings corpus), reused by later runs until the vocabulary drifts
+CORPUS_EMBEDDINGS_FILE = "3_corpus_embeddings.npz"
+
+# Where the similar-terms index is saved, relative to the output directory
+SIMILARITY_INDEX_DIR = ".similarity_index"
+
+# What each output is, for the closing summary (keyed by file name without extension)
+OUTPUT_DESCRIPTIONS = {
+    "1_raw_candidates": "All extracted terms",
+    "2_filtered_candidates": "After noise removal",
+    "3_cluster_model": "Fitted clusters for incremental runs",
+    "3_clustered_keywords": "Auto-clustered terms",
+    "3_corpus_embeddings": "Fitted corpus embeddings",
+    "4_manual_review_template": "For your categorization",
+    "5_by_company": "Terms by company",
+    "6_summary_stats": "Summary statistics",
+    SIMILARITY_INDEX_DIR: "Index for --similar queries",
+    "candidates": "SQLite database for ad-hoc queries",
+    "manifest": "Content hashes and stage timings",
+    "master_skills": "Refined skills dictionary",
+}
+
+# Listing order of one output's files: the JSON first, then its .txt report, then exports
+SUFFIX_ORDER = {".json": 0, ".ndjson": 0, ".txt": 1}
+
+# Output writers that don't depend on each other run on this many threads
+WRITER_THREADS = 4
+
+# Documents are looked up in the cache, and parallel chunks sized, this many at a time
+DOCUMENT_WINDOW = 256
+
+
+def extract_documents(
+    job_descriptions: Iterable[JobDescription],
+    batch_size: int = 0,
+    pool: Optional[ExtractionPool] = None
+) -> Iterator[dict[str, CandidateTerm]]:
+    """
+    Preprocess and extract candidates from each job description.
+
+    Args:
+        job_descriptions: Documents to process (consumed lazily)
+        batch_size: Parse documents in spaCy batches of this size (0 = one at a time)
+        pool: Worker pool to extract with (None = extract in this process)
+
+    Yields:
+        Per-document candidate dictionaries, in input order
+    """
+    if pool is not None:
+        yield from pool.extract(job_descriptions)
+        return
+
+    extractor = KeywordExtractor()
+    if batch_size > 0:
+        yield from extractor.extract_candidates_batch(
+            ((preprocess_text(jd.content), jd.company) for jd in job_descriptions),
+            batch_size=batch_size
+        )
+    else:
+        for jd in job_descriptions:
+            yield extractor.extract_candidates(preprocess_text(jd.content), jd.company)
+
+
+def output_files(name: str, json_format: str = "json", txt: bool = True) -> str:
+    """File names written for one output, for progress messages (e.g. "1_raw_candidates.json/.txt")."""
+    json_name = json_output_path(Path(f"{name}.json"), json_format).name
+    return f"{json_name}/.txt" if txt else json_name
+
+
+def generated_files(names: Iterable[str]) -> list[tuple[str, str]]:
+    """
+    Group output file names by stem (e.g. "1_raw_candidates.json/.txt/.arrow"), for the closing summary.
+
+    Returns:
+        (files, description) pairs, numbered outputs first
+    """
+    suffixes: dict[str, list[str]] = {}
+    for name in names:
+        path = Path(name)
+        suffixes.setdefault(path.stem, [])
+        if path.suffix not in suffixes[path.stem]:
+            suffixes[path.stem].append(path.suffix)
+    groups = []
+    for stem in sorted(suffixes, key=lambda stem: (not stem[0].isdigit(), stem)):
+        ordered = sorted(suffixes[stem], key=lambda suffix: (SUFFIX_ORDER.get(suffix, len(SUFFIX_ORDER)), suffix))
+        files = stem + "/".join(ordered) if ordered != [""] else f"{stem}/"
+        groups.append((files, OUTPUT_DESCRIPTIONS.get(stem, "")))
+    return groups
+
+
+def run_writers(writers: list[tuple[Callable[[], object], Callable[[object], str]]]) -> None:
+    """
+    Run independent output writers concurrently, printing their messages in order.
+
+    Args:
+        writers: (write, message) pairs; message formats write's return value
+    """
+    with ThreadPoolExecutor(max_workers=min(WRITER_THREADS, len(writers))) as pool:
+        futures = [(pool.submit(write), message) for write, message in writers]
+        for future, message in futures:
+            print(f"      {message(future.result())}")
+
+
+def track_companies(
+    job_descriptions: Iterable[JobDescription],
+    company_names: set[str]
+) -> Iterator[JobDescription]:
+    """Pass documents through, recording each one's company."""
+    for jd in job_descriptions:
+        company_names.add(jd.company)
+        yield jd
+
+
+def run_extraction(
+    input_dir: str | Path,
+    output_dir: str | Path,
+    min_occurrences: int = 2,
+    workers: int = 1,
+    batch_size: int = 0,
+    cache_dir: str | Path | None = None,
+    rule_stats: bool = False,
+    stream: bool = False,
+    embedding_cache_dir: str | Path | None = None,
+    k_selection: str = "exhaustive",
+    refit: bool = False,
+    drift_threshold: float = DEFAULT_DRIFT_THRESHOLD,
+    anchor_seeding: bool = False,
+    embedding_source: str = "spacy",
+    reduction: Optional[str] = None,
+    reduced_dimensions: int = DEFAULT_REDUCED_DIMENSIONS,
+    json_format: str = "json",
+    txt: bool = True,
+    export_format: Optional[str] = None,
+    sqlite: bool = False,
+    refine_rules: Optional[Sequence[str]] = None
+) -> None:
     """
     Run the full keyword extraction pipeline.
 
@@ -35,6 +202,25 @@ def run_extraction(input_dir: str | Path, output_dir: str | Path, min_occurrence
         input_dir: Directory containing job description .txt files
         output_dir: Directory to write output files
         min_occurrences: Minimum sources for a term to be kept (default 2)
+        workers: Number of extraction processes (1 = serial, 0 = one per CPU)
+        batch_size: Parse documents in spaCy batches of this size (0 = one at a time)
+        cache_dir: Directory for cached per-document results (None = no caching)
+        rule_stats: Print per-rule hit counts and timings for the noise filter
+        stream: Read documents lazily instead of loading the whole corpus first
+        embedding_cache_dir: Directory for cached term vectors (None = no caching)
+        k_selection: How to choose the number of clusters (see clusterer.K_SELECTION_MODES)
+        refit: Refit the clusters (and corpus embeddings) even if the previous run's could be reused
+        drift_threshold: Refit once this fraction of the clustered (or embedded) vocabulary has changed
+        anchor_seeding: Seed k-means from the anchor categories and label clusters by similarity to them
+        embedding_source: Term vectors to cluster on ("spacy" word vectors or "corpus" PPMI + SVD)
+        reduction: Reduce embeddings with "pca" or "random-projection" before clustering (None = don't)
+        reduced_dimensions: Target dimension of the reduction
+        json_format: Format of the candidate lists ("json", "compact" or "ndjson")
+        txt: Also write the human-readable .txt reports
+        export_format: Also export the raw/filtered candidate tables as "arrow" or "parquet" (needs pyarrow)
+        sqlite: Also load the filtered terms, companies and signals into an indexed SQLite database
+        refine_rules: Also clean the filtered terms and refine them with these rules versions,
+            in memory; the last version builds master_skills.json (None = don't)
     """
     input_path = Path(input_dir)
     output_path = Path(output_dir)
@@ -44,79 +230,237 @@ def run_extraction(input_dir: str | Path, output_dir: str | Path, min_occurrence
     print("=" * 60)
     print()
 
+    # Records output hashes (to skip unchanged writes) and stage timings
+    manifest = manifest_for(output_path)
+    manifest.begin_run()
+
     # Step 1: Read job descriptions
     print("[1/6] Reading job descriptions...")
-    job_descriptions = get_all_job_descriptions(input_path)
-    print(f"      Loaded {len(job_descriptions)} files")
+    if stream:
+        # Companies are collected as documents stream through extraction
+        company_names: set[str] = set()
+        job_descriptions = track_companies(read_job_descriptions(input_path), company_names)
+        total = None
+        print("      Streaming files from the input directory")
+    else:
+        job_descriptions = get_all_job_descriptions(input_path)
+        total = len(job_descriptions)
+        print(f"      Loaded {total} files")
 
-    # Collect company names for filtering
-    company_names = {jd.company for jd in job_descriptions}
-    print(f"      Found {len(company_names)} unique companies")
+        # Collect company names for filtering
+        company_names = {jd.company for jd in job_descriptions}
+        print(f"      Found {len(company_names)} unique companies")
+    manifest.mark_stage("read")
     print()
 
     # Step 2: Extract candidates from each document
     print("[2/6] Extracting candidate terms...")
-    extractor = KeywordExtractor()
-    all_candidates = []
+    if workers == 0:
+        workers = os.cpu_count() or 1
+
+    if workers > 1:
+        print(f"      Using {workers} worker processes")
 
-    for i, jd in enumerate(job_descriptions, 1):
-        if i % 20 == 0 or i == len(job_descriptions):
-            print(f"      Processing {i}/{len(job_descriptions)}...")
+    # A few tasks per worker keeps the pool busy without much IPC overhead
+    chunksize = max(1, min(total or DOCUMENT_WINDOW, DOCUMENT_WINDOW) // (workers * 4))
+    pool_context = ExtractionPool(workers, chunksize, batch_size) if workers > 1 else nullcontext()
 
-        # Preprocess text
-        cleaned_text = preprocess_text(jd.content)
+    # Each document's candidates are folded into the store as soon as they're
+    # extracted; the store keeps term x company counts, so memory grows with the
+    # vocabulary and company count, not the number of documents. Corpus embeddings
+    # need term x document counts, so only they keep every document's entries.
+    start_time = time.perf_counter()
+    merged_candidates = TermStore(keep_documents=embedding_source == "corpus")
+    num_documents = 0
+    cache = CandidateCache(cache_dir) if cache_dir is not None else None
+    with pool_context as pool:
+        def extract(jobs: Iterable[JobDescription]) -> Iterator[dict[str, CandidateTerm]]:
+            return extract_documents(jobs, batch_size, pool)
 
-        # Extract candidates
-        candidates = extractor.extract_candidates(cleaned_text, jd.company)
-        all_candidates.append(candidates)
+        if cache is not None:
+            document_candidates = cache.extract_with_cache(job_descriptions, extract, DOCUMENT_WINDOW)
+        else:
+            document_candidates = extract(job_descriptions)
+
+        for num_documents, candidates in enumerate(document_candidates, 1):
+            if num_documents % 20 == 0 or num_documents == total:
+                print(f"      Processing {num_documents}{f'/{total}' if total else ''}...")
+            merged_candidates.add(candidates)
+
+    elapsed = time.perf_counter() - start_time
+    if stream:
+        print(f"      Read {num_documents} files from {len(company_names)} unique companies")
+    if cache is not None:
+        print(f"      Cache: {cache.hits} hits, {cache.misses} misses")
+    parsed_count = cache.misses if cache is not None else num_documents
+    mode = f"batched nlp.pipe, batch size {batch_size}" if batch_size > 0 else "one nlp() call per document"
+    print(f"      Parsed {parsed_count} docs in {elapsed:.1f}s "
+          f"({parsed_count / elapsed:.1f} docs/sec, {mode})")
 
-    # Merge all candidates
-    merged_candidates = merge_candidates(all_candidates)
     print(f"      Extracted {len(merged_candidates)} unique candidate terms")
+    manifest.mark_stage("extract")
     print()
 
     # Step 3: Write raw candidates
     print("[3/6] Writing raw candidates...")
-    write_raw_candidates(merged_candidates, output_path, len(job_descriptions))
-    print("      Wrote 1_raw_candidates.json/.txt")
+    raw_aggregates = aggregate_candidates(merged_candidates, by_company=False)
+    writers = [(
+        lambda: write_raw_candidates(
+            merged_candidates, output_path, num_documents, json_format, txt, raw_aggregates
+        ),
+        lambda _: f"Wrote {output_files('1_raw_candidates', json_format, txt)}"
+    )]
+    if export_format is not None:
+        writers.append((
+            lambda: write_candidate_table(
+                merged_candidates, output_path / "1_raw_candidates", export_format,
+                raw_aggregates.sorted_candidates
+            ),
+            lambda exported: f"Exported {exported.name}"
+        ))
+    run_writers(writers)
+    manifest.mark_stage("write_raw")
     print()
 
     # Step 4: Filter candidates
     print("[4/6] Filtering candidates...")
+    noise_rules.collect_stats = rule_stats
     filtered, removed = filter_candidates(
         merged_candidates,
         company_names,
         min_occurrences=min_occurrences
     )
     print(f"      Kept {len(filtered)} terms, removed {len(removed)} terms")
+    if rule_stats:
+        for line in noise_rules.stats_report():
+            print(f"      {line}")
+
+    # Term x document matrix rows for the kept terms, for corpus embeddings and the per-company aggregates
+    filtered_matrix = merged_candidates.matrix().rows(list(filtered))
+    # Sort order, top terms, frequency buckets and company maps shared by every later writer
+    aggregates = aggregate_candidates(filtered, filtered_matrix)
 
-    write_filtered_candidates(filtered, removed, output_path, min_occurrences)
-    print("      Wrote 2_filtered_candidates.json/.txt")
+    writers = [(
+        lambda: write_filtered_candidates(
+            filtered, removed, output_path, min_occurrences, json_format, txt, aggregates
+        ),
+        lambda _: f"Wrote {output_files('2_filtered_candidates', json_format, txt)}"
+    )]
+    if export_format is not None:
+        writers.append((
+            lambda: write_candidate_table(
+                filtered, output_path / "2_filtered_candidates", export_format, aggregates.sorted_candidates
+            ),
+            lambda exported: f"Exported {exported.name}"
+        ))
+    run_writers(writers)
+    manifest.mark_stage("filter")
     print()
 
     # Step 5: Cluster terms
     print("[5/6] Clustering terms...")
-    clusterer = TermClusterer()
-    clustering_result = clusterer.cluster_terms(filtered)
+
+    # Corpus embeddings are saved as a whole (CORPUS_EMBEDDINGS_FILE), so only spaCy vectors are cached
+    use_cache = embedding_cache_dir is not None and embedding_source == "spacy"
+    embedding_cache = EmbeddingCache(embedding_cache_dir) if use_cache else None
+    clusterer = TermClusterer(
+        embedding_cache, k_selection, anchor_seeding, embedding_source, reduction, reduced_dimensions
+    )
+    if embedding_source == "corpus":
+        start_time = time.perf_counter()
+        embeddings_path = output_path / CORPUS_EMBEDDINGS_FILE
+        previous_embedder = CorpusEmbedder.load(embeddings_path) if embeddings_path.exists() and not refit else None
+        terms = [candidate.term for candidate in filtered.values()]
+        embedder_drift = previous_embedder.drift(terms) if previous_embedder is not None else None
+        if clusterer.fit_corpus_embeddings(filtered_matrix, terms, previous_embedder, drift_threshold):
+            print(f"      Reused corpus embeddings (drift {embedder_drift:.3f} <= {drift_threshold}), folded in "
+                  f"{len(clusterer.corpus_embedder.folded_terms)} new terms "
+                  f"in {time.perf_counter() - start_time:.2f}s")
+        else:
+            if embedder_drift is not None:
+                print(f"      Refitting corpus embeddings (drift {embedder_drift:.3f}, threshold {drift_threshold})")
+            clusterer.corpus_embedder.save(embeddings_path)
+            print(f"      Fitted {clusterer.corpus_embedder.vectors.shape[1]}-d corpus embeddings "
+                  f"in {time.perf_counter() - start_time:.2f}s")
+    model_path = output_path / CLUSTER_MODEL_FILE
+    previous = ClusterModel.load(model_path) if model_path.exists() and not refit else None
+    clustering_result = clusterer.cluster_terms(filtered, previous=previous, drift_threshold=drift_threshold)
+    if clustering_result.incremental:
+        print(f"      Assigned terms to the previous {clustering_result.num_clusters} clusters "
+              f"(drift {clustering_result.drift:.3f} <= {drift_threshold})")
+    elif clustering_result.drift is not None:
+        print(f"      Refitting clusters (drift {clustering_result.drift:.3f}, threshold {drift_threshold})")
+    if embedding_cache is not None:
+        print(f"      Embedding cache: {embedding_cache.hits} hits, {embedding_cache.misses} misses")
+    reduced = clustering_result.reduction
+    if reduced is not None:
+        original_dim, reduced_dim = reduced.dimensions
+        variance = "n/a" if reduced.explained_variance is None else f"{reduced.explained_variance:.3f}"
+        print(f"      Reduced {original_dim}-d -> {reduced_dim}-d with {reduced.method} "
+              f"in {reduced.seconds:.2f}s (explained variance {variance})")
+    selection = clustering_result.k_selection
+    if selection is not None:
+        print(f"      k selection ({selection.mode}): k={selection.k}, "
+              f"score {selection.score:.4f}, {selection.seconds:.2f}s")
+        for point in selection.points:
+            score = "n/a" if point.score is None else f"{point.score:.4f}"
+            print(f"        k={point.k:<3} score {score:<7} {point.seconds:.2f}s")
+    if clustering_result.iterations is not None:
+        print(f"      {clustering_result.algorithm} converged in {clustering_result.iterations} iterations")
     print(f"      Created {clustering_result.num_clusters} clusters")
     print(f"      Silhouette score: {clustering_result.silhouette_score}")
+    if clustering_result.unreduced_silhouette_score is not None:
+        print(f"      Silhouette score on unreduced embeddings: {clustering_result.unreduced_silhouette_score}")
+    print(f"      Clustering took {clustering_result.seconds:.2f}s")
     print(f"      Unclusterable terms: {len(clustering_result.unclusterable)}")
 
-    write_clustered_keywords(clustering_result, output_path)
-    print("      Wrote 3_clustered_keywords.json/.txt")
+    write_clustered_keywords(clustering_result, output_path, txt)
+    print(f"      Wrote {output_files('3_clustered_keywords', txt=txt)}")
+    if clustering_result.model is not None:
+        clustering_result.model.save(model_path)
+
+    index_written = clusterer.similarity_index.save(output_path / SIMILARITY_INDEX_DIR)
+    print(f"      Indexed {len(clusterer.similarity_index)} terms for --similar queries"
+          f"{'' if index_written else ' (unchanged)'}")
+    manifest.mark_stage("cluster")
     print()
 
     # Step 6: Write remaining outputs
     print("[6/6] Writing final outputs...")
 
-    write_manual_review_template(filtered, output_path)
-    print("      Wrote 4_manual_review_template.json/.txt")
+    writers = [
+        (
+            lambda: write_manual_review_template(filtered, output_path, txt, aggregates),
+            lambda _: f"Wrote {output_files('4_manual_review_template', txt=txt)}"
+        ),
+        (
+            lambda: write_by_company(filtered, output_path, filtered_matrix, txt, aggregates),
+            lambda _: f"Wrote {output_files('5_by_company', txt=txt)}"
+        ),
+        (
+            lambda: write_summary_stats(filtered, num_documents, output_path, filtered_matrix, txt, aggregates),
+            lambda _: f"Wrote {output_files('6_summary_stats', txt=txt)}"
+        ),
+    ]
+    if sqlite:
+        writers.append((
+            lambda: write_sqlite(filtered, output_path / SQLITE_FILE, filtered_matrix),
+            lambda built: f"Loaded {len(filtered)} terms into {SQLITE_FILE}{'' if built else ' (unchanged)'}"
+        ))
+    run_writers(writers)
+    manifest.mark_stage("write_outputs")
 
-    write_by_company(filtered, output_path)
-    print("      Wrote 5_by_company.json/.txt")
+    if refine_rules is not None:
+        # Cleaned and refined straight from the filtered dict, no intermediate files
+        print(f"      Refining into {MASTER_SKILLS_FILE} (rules {', '.join(refine_rules)})...")
+        cleaned = clean_candidates(filtered, aggregates.sorted_candidates)
+        print(f"      Kept {len(cleaned)} keywords after cleaning and de-duplication")
+        run_refine_chain(cleaned, output_path, refine_rules)
+        manifest.mark_stage("refine")
 
-    write_summary_stats(filtered, len(job_descriptions), output_path)
-    print("      Wrote 6_summary_stats.json/.txt")
+    manifest.save()
+    print(f"      {len(manifest.written)} files written, {len(manifest.unchanged)} unchanged "
+          f"(hashes and stage timings in {MANIFEST_FILE})")
 
     print()
     print("=" * 60)
@@ -125,12 +469,92 @@ def run_extraction(input_dir: str | Path, output_dir: str | Path, min_occurrence
     print(f"Output directory: {output_path.absolute()}")
     print()
     print("Files generated:")
-    print("  1. 1_raw_candidates.json/.txt     - All extracted terms")
-    print("  2. 2_filtered_candidates.json/.txt - After noise removal")
-    print("  3. 3_clustered_keywords.json/.txt  - Auto-clustered terms")
-    print("  4. 4_manual_review_template.json/.txt - For your categorization")
-    print("  5. 5_by_company.json/.txt          - Terms by company")
-    print("  6. 6_summary_stats.json/.txt       - Summary statistics")
+    generated = [*manifest.written, *manifest.unchanged, MANIFEST_FILE, SIMILARITY_INDEX_DIR]
+    if clustering_result.model is not None:
+        generated.append(CLUSTER_MODEL_FILE)
+    if embedding_source == "corpus":
+        generated.append(CORPUS_EMBEDDINGS_FILE)
+    groups = generated_files(generated)
+    digits = len(str(len(groups)))
+    width = max(len(files) for files, _ in groups)
+    for i, (files, description) in enumerate(groups, 1):
+        print(f"  {i:>{digits}}. {files:<{width}} - {description}" if description else f"  {i:>{digits}}. {files}")
+
+
+def print_similar_terms(
+    term: str,
+    output_dir: str | Path,
+    k: int = 10,
+    embedding_cache_dir: str | Path | None = None
+) -> None:
+    """
+    Print the terms most similar to a term, using the index saved by the last run.
+
+    Args:
+        term: Query term
+        output_dir: Output directory of the run that built the index
+        k: Number of results
+        embedding_cache_dir: Embedding cache for terms that aren't indexed (None = no caching)
+    """
+    index_dir = Path(output_dir) / SIMILARITY_INDEX_DIR
+    try:
+        index = SimilarityIndex.load(index_dir)
+    except FileNotFoundError:
+        print(f"Error: No similarity index in {index_dir} - run the pipeline first")
+        sys.exit(1)
+    except ValueError as e:
+        print(f"Error: Damaged similarity index in {index_dir} ({e}) - rerun the pipeline")
+        sys.exit(1)
+
+    start_time = time.perf_counter()
+    if term in index:
+        results = index.most_similar(term, k)
+    else:
+        # Only load the model when the term has to be embedded
+        embedding_cache = EmbeddingCache(embedding_cache_dir) if embedding_cache_dir is not None else None
+        clusterer = TermClusterer(embedding_cache)
+        if index.embedding and index.embedding != clusterer.embedding_id:
+            print(f"Error: '{term}' isn't indexed, and the index was built from {index.embedding.split(':')[0]} "
+                  f"embeddings, which can't embed new terms")
+            sys.exit(1)
+        clusterer.similarity_index = index
+        results = clusterer.similar_terms(term, k)
+    elapsed = time.perf_counter() - start_time
+
+    if not results:
+        print(f"No embedding for '{term}'")
+        return
+    print(f"Terms most similar to '{term}' ({len(index)} indexed, {elapsed * 1000:.1f} ms):")
+    for similar, score in results:
+        print(f"  {score:.4f}  {similar}")
+
+
+def print_companies_mentioning(terms: list[str], output_dir: str | Path) -> None:
+    """
+    Print the companies that mention every one of the given terms, using the last run's database.
+
+    Args:
+        terms: Terms that must all be mentioned
+        output_dir: Output directory of a run made with --sqlite
+    """
+    database = Path(output_dir) / SQLITE_FILE
+    if not database.exists():
+        print(f"Error: No database at {database} - run the pipeline with --sqlite first")
+        sys.exit(1)
+
+    start_time = time.perf_counter()
+    connection = sqlite3.connect(f"file:{database}?mode=ro", uri=True)
+    try:
+        companies = companies_mentioning(connection, terms)
+    finally:
+        connection.close()
+    elapsed = time.perf_counter() - start_time
+
+    print(f"Companies mentioning {' and '.join(repr(term) for term in terms)} ({elapsed * 1000:.1f} ms):")
+    for company in companies:
+        print(f"  {company}")
+    if not companies:
+        print("  (none)")
 
 
 def main():
@@ -141,17 +565,152 @@ def main():
     default_output = base_dir / "output"
 
     # Allow command line overrides
-    if len(sys.argv) >= 2:
-        input_dir = Path(sys.argv[1])
-    else:
-        input_dir = default_input
+    parser = argparse.ArgumentParser(description="Extract tech keywords from job descriptions.")
+    parser.add_argument("input_dir", nargs="?", type=Path, default=default_input)
+    parser.add_argument("output_dir", nargs="?", type=Path, default=default_output)
+    parser.add_argument(
+        "--workers", type=int, default=1, metavar="N",
+        help="Extraction processes to use (default 1, 0 = one per CPU)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=0, metavar="N",
+        help="Parse documents with nlp.pipe in batches of N (default 0 = one nlp() call per document)"
+    )
+    parser.add_argument(
+        "--cache-dir", type=Path, default=None, metavar="DIR",
+        help="Where to cache per-document results (default: <output_dir>/.candidate_cache)"
+    )
+    parser.add_argument(
+        "--embedding-cache-dir", type=Path, default=None, metavar="DIR",
+        help="Where to cache term vectors (default: <output_dir>/.embedding_cache)"
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Re-parse every document and re-embed every term instead of reusing cached results"
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="Stream documents from disk instead of loading them all first (for very large corpora)"
+    )
+    parser.add_argument(
+        "--k-selection", choices=list(K_SELECTION_MODES), default="exhaustive",
+        help="How to choose the number of clusters (default: exhaustive KMeans + exact silhouette sweep)"
+    )
+    parser.add_argument(
+        "--refit", action="store_true",
+        help="Refit the clusters (and corpus embeddings) from scratch instead of reusing the previous run's"
+    )
+    parser.add_argument(
+        "--drift-threshold", type=float, default=DEFAULT_DRIFT_THRESHOLD, metavar="F",
+        help=f"Refit clusters and corpus embeddings once this fraction of the vocabulary has changed "
+             f"(default {DEFAULT_DRIFT_THRESHOLD})"
+    )
+    parser.add_argument(
+        "--embeddings", choices=EMBEDDING_SOURCES, default="spacy",
+        help="Term vectors to cluster on: spaCy word vectors, or PPMI + SVD over the corpus (default spacy)"
+    )
+    parser.add_argument(
+        "--reduce", choices=REDUCTION_METHODS, default=None,
+        help="Reduce embeddings with PCA or sparse random projection before clustering (default: don't)"
+    )
+    parser.add_argument(
+        "--reduce-to", type=int, default=DEFAULT_REDUCED_DIMENSIONS, metavar="N",
+        help=f"Target dimension for --reduce (default {DEFAULT_REDUCED_DIMENSIONS})"
+    )
+    parser.add_argument(
+        "--anchor-seeding", action="store_true",
+        help="Seed k-means from the anchor term categories and label clusters by embedding similarity"
+    )
+    parser.add_argument(
+        "--similar", metavar="TERM", default=None,
+        help="Print the terms most similar to TERM from the last run's index, instead of running the pipeline"
+    )
+    parser.add_argument(
+        "--top-k", type=int, default=10, metavar="N",
+        help="Number of results for --similar (default 10)"
+    )
+    parser.add_argument(
+        "--json-format", choices=JSON_FORMATS, default="json",
+        help="Format of the raw/filtered candidate lists: indented json, compact json or ndjson (default json)"
+    )
+    parser.add_argument(
+        "--txt", action=argparse.BooleanOptionalAction, default=True,
+        help="Write the human-readable .txt reports alongside the JSON (default: yes)"
+    )
+    parser.add_argument(
+        "--export", choices=list(EXPORT_FORMATS), default=None,
+        help="Also export the raw/filtered candidate tables as Arrow IPC or Parquet files (needs pyarrow)"
+    )
+    parser.add_argument(
+        "--sqlite", action="store_true",
+        help=f"Also load the filtered terms, companies and signals into an indexed SQLite database ({SQLITE_FILE})"
+    )
+    parser.add_argument(
+        "--companies-with", nargs="+", metavar="TERM", default=None,
+        help="Print the companies mentioning all of the TERMs from the last --sqlite run, instead of running the pipeline"
+    )
+    parser.add_argument(
+        "--refine", action="store_true",
+        help=f"Also clean and refine the filtered terms into {MASTER_SKILLS_FILE}, in memory"
+    )
+    parser.add_argument(
+        "--refine-rules", nargs="+", default=list(DEFAULT_RULES), metavar="VERSION",
+        help=f"Refine rules versions for --refine, each applied to the cleaned keywords; the last one "
+             f"builds {MASTER_SKILLS_FILE} (default {' '.join(DEFAULT_RULES)})"
+    )
+    parser.add_argument(
+        "--rule-stats", action="store_true",
+        help="Report per-rule hit counts and timings for the noise filter"
+    )
+    args = parser.parse_args()
 
-    if len(sys.argv) >= 3:
-        output_dir = Path(sys.argv[2])
-    else:
-        output_dir = default_output
+    if args.export is not None:
+        try:
+            require_pyarrow()
+        except ImportError as e:
+            parser.error(str(e))
 
-    run_extraction(input_dir, output_dir)
+    if args.refine:
+        try:
+            for version in args.refine_rules:
+                load_rules(version)
+        except ValueError as e:
+            parser.error(str(e))
+
+    cache_dir = None if args.no_cache else (args.cache_dir or args.output_dir / ".candidate_cache")
+    embedding_cache_dir = None if args.no_cache else (
+        args.embedding_cache_dir or args.output_dir / ".embedding_cache"
+    )
+
+    if args.similar is not None:
+        print_similar_terms(args.similar, args.output_dir, args.top_k, embedding_cache_dir)
+        return
+    if args.companies_with is not None:
+        print_companies_mentioning(args.companies_with, args.output_dir)
+        return
+
+    run_extraction(
+        args.input_dir,
+        args.output_dir,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        cache_dir=cache_dir,
+        rule_stats=args.rule_stats,
+        stream=args.stream,
+        embedding_cache_dir=embedding_cache_dir,
+        k_selection=args.k_selection,
+        refit=args.refit,
+        drift_threshold=args.drift_threshold,
+        anchor_seeding=args.anchor_seeding,
+        embedding_source=args.embeddings,
+        reduction=args.reduce,
+        reduced_dimensions=args.reduce_to,
+        json_format=args.json_format,
+        txt=args.txt,
+        export_format=args.export,
+        sqlite=args.sqlite,
+        refine_rules=args.refine_rules if args.refine else None
+    )
 
 
 if __name__ == "__main__":
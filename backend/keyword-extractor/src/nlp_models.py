@@ -0,0 +1,93 @@
+"""
+NLP Models Module
+Process-wide registry of spaCy models shared by the extractor and clusterer.
+"""
+
+from typing import Iterable, Iterator, Optional
+
+import spacy
+from spacy.language import Language
+from spacy.tokens import Doc
+
+
+DEFAULT_MODEL = "en_core_web_md"
+
+# Loaded models, keyed by package name. One copy per process.
+_loaded_models: dict[str, Language] = {}
+
+
+def load_model(name: str = DEFAULT_MODEL) -> Language:
+    """
+    Load a spaCy model, or return the copy already loaded in this process.
+
+    Downloads the model first if it isn't installed.
+    """
+    if name not in _loaded_models:
+        try:
+            _loaded_models[name] = spacy.load(name)
+        except OSError:
+            print(f"Downloading spaCy model {name}...")
+            spacy.cli.download(name)
+            _loaded_models[name] = spacy.load(name)
+    return _loaded_models[name]
+
+
+class ModelView:
+    """
+    A component-restricted view onto a shared spaCy model.
+
+    The underlying model is loaded on first use. Calls only run the
+    components the view was created with; components=() gives a
+    tokenizer-only view, which is all that's needed to read word vectors.
+    """
+
+    def __init__(self, name: str = DEFAULT_MODEL, components: Optional[Iterable[str]] = None):
+        self.name = name
+        self.components = None if components is None else tuple(components)
+
+    @property
+    def nlp(self) -> Language:
+        """The shared underlying model (loaded lazily)."""
+        return load_model(self.name)
+
+    @property
+    def vocab(self):
+        return self.nlp.vocab
+
+    @property
+    def pipe_names(self) -> list[str]:
+        """Names of the components this view runs."""
+        return [name for name in self.nlp.pipe_names if name not in self.disabled]
+
+    @property
+    def disabled(self) -> list[str]:
+        """Names of the model's components this view skips."""
+        if self.components is None:
+            return []
+        return [name for name in self.nlp.pipe_names if name not in self.components]
+
+    def __call__(self, text: str) -> Doc:
+        if self.components == ():
+            return self.nlp.make_doc(text)
+        return self.nlp(text, disable=self.disabled)
+
+    def pipe(self, texts: Iterable, disable: Iterable[str] = (), **kwargs) -> Iterator:
+        """Stream texts through nlp.pipe, skipping components outside this view."""
+        return self.nlp.pipe(texts, disable=[*self.disabled, *disable], **kwargs)
+
+
+def get_model(
+    components: Optional[Iterable[str]] = None,
+    name: str = DEFAULT_MODEL
+) -> ModelView:
+    """
+    Get a view onto the shared model.
+
+    Args:
+        components: Pipeline components to run (None = the model's full pipeline)
+        name: spaCy model package name
+
+    Returns:
+        ModelView backed by the process-wide copy of the model
+    """
+    return ModelView(name, components)
@@ -0,0 +1,215 @@
+"""
+Output Manifest Module
+Handles atomic, skip-if-unchanged output writes and the run manifest (manifest.json).
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+MANIFEST_FILE = "manifest.json"
+
+
+@contextmanager
+def atomic_path(filepath: Path) -> Iterator[Path]:
+    """
+    Temp path next to filepath to write to; renamed over filepath when the
+    block exits normally, deleted if it raises.
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = filepath.with_name(f".{filepath.name}.{os.getpid()}.tmp")
+    try:
+        yield temp_path
+        os.replace(temp_path, filepath)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_atomic(filepath: Path, chunks: Iterable[str]) -> None:
+    """Write text to a temp file next to filepath, then rename it into place."""
+    with atomic_path(filepath) as temp_path:
+        with open(temp_path, "w", encoding="utf-8", newline="") as f:
+            f.writelines(chunks)
+
+
+class OutputManifest:
+    """
+    Content hashes of the files in one output directory, plus stage timings.
+
+    write() hashes new content before touching the disk and skips the write
+    when the file still matches its recorded hash, size and mtime, so an
+    unchanged rerun costs a stat() per file. Changed files are written to
+    a temp file in the same directory and renamed over the old one, so a
+    crash never leaves a truncated output.
+
+    Files edited outside the pipeline are rewritten as long as their size
+    or mtime changed. Writes to different files may run concurrently.
+
+    Binary outputs go through write_bytes() when they can be serialized in
+    memory, or write_built() when they're built in place (a database); the
+    latter skips on a caller-supplied key for the content instead of a hash.
+    """
+
+    def __init__(self, output_dir: str | Path):
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / MANIFEST_FILE
+        self.files: dict[str, dict] = {}
+        self.stages: dict[str, float] = {}
+        self.written: list[str] = []
+        self.unchanged: list[str] = []
+        self._stage_start = time.perf_counter()
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self.files = json.load(f).get("files", {})
+            except ValueError:
+                print(f"Warning: Ignoring unreadable manifest {self.path}")
+
+    def begin_run(self) -> None:
+        """Reset this run's stage timings and written/unchanged lists."""
+        self.stages = {}
+        self.written = []
+        self.unchanged = []
+        self._stage_start = time.perf_counter()
+
+    def _matches(self, name: str, digest: str, size: int) -> bool:
+        record = self.files.get(name)
+        if record is None or record["sha256"] != digest or record["bytes"] != size:
+            return False
+        try:
+            stat = (self.output_dir / name).stat()
+        except FileNotFoundError:
+            return False
+        return stat.st_size == size and stat.st_mtime_ns == record["mtime_ns"]
+
+    def write(self, filepath: Path, make_chunks: Callable[[], Iterable[str]]) -> bool:
+        """
+        Write text to a file in this directory, unless it already holds it.
+
+        Args:
+            filepath: Target file
+            make_chunks: Returns the content as an iterable of strings; called
+                once to hash the content and once more to write it if it changed
+
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        name = filepath.name
+        digest = hashlib.sha256()
+        size = 0
+        for chunk in make_chunks():
+            data = chunk.encode("utf-8")
+            digest.update(data)
+            size += len(data)
+        digest = digest.hexdigest()
+
+        if self._unchanged(name, digest, size):
+            return False
+        write_atomic(filepath, make_chunks())
+        self._record(filepath, {"sha256": digest, "bytes": size})
+        return True
+
+    def write_bytes(self, filepath: Path, data: bytes | memoryview) -> bool:
+        """
+        Binary counterpart of write(), for content already serialized in memory.
+
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        view = memoryview(data)
+        digest = hashlib.sha256(view).hexdigest()
+        if self._unchanged(filepath.name, digest, view.nbytes):
+            return False
+        with atomic_path(filepath) as temp_path, open(temp_path, "wb") as f:
+            f.write(view)
+        self._record(filepath, {"sha256": digest, "bytes": view.nbytes})
+        return True
+
+    def write_built(self, filepath: Path, key: str, build: Callable[[Path], None]) -> bool:
+        """
+        Build a file in place, unless it was already built from the same content.
+
+        Args:
+            filepath: Target file
+            key: Identifies the content going in (e.g. a hash of the rows); the
+                build is skipped if the recorded key matches and the file is untouched
+            build: Creates the file at the temp path it's given, which is then
+                renamed over filepath
+
+        Returns:
+            True if the file was built, False if it was already up to date
+        """
+        name = filepath.name
+        with self._lock:
+            record = self.files.get(name)
+            matches = (
+                record is not None
+                and record.get("key") == key
+                and self._matches(name, record["sha256"], record["bytes"])
+            )
+            if matches:
+                self.unchanged.append(name)
+        if matches:
+            return False
+
+        with atomic_path(filepath) as temp_path:
+            build(temp_path)
+        digest = hashlib.sha256()
+        with open(filepath, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        self._record(filepath, {"sha256": digest.hexdigest(), "bytes": filepath.stat().st_size, "key": key})
+        return True
+
+    def _unchanged(self, name: str, digest: str, size: int) -> bool:
+        """True (and noted as unchanged) if the file already holds this content."""
+        with self._lock:
+            matches = self._matches(name, digest, size)
+            if matches:
+                self.unchanged.append(name)
+        return matches
+
+    def _record(self, filepath: Path, record: dict) -> None:
+        record["mtime_ns"] = filepath.stat().st_mtime_ns
+        with self._lock:
+            self.files[filepath.name] = record
+            self.written.append(filepath.name)
+
+    def mark_stage(self, stage: str) -> float:
+        """Record the time since the previous mark (or since the manifest was opened) as a stage."""
+        now = time.perf_counter()
+        self.stages[stage] = round(now - self._stage_start, 4)
+        self._stage_start = now
+        return self.stages[stage]
+
+    def save(self) -> None:
+        """Write manifest.json (atomically) with this run's file records and stage timings."""
+        data = {
+            "files": self.files,
+            "stages": self.stages,
+            "written": self.written,
+            "unchanged": self.unchanged,
+        }
+        write_atomic(self.path, [json.dumps(data, indent=2)])
+
+
+# One manifest per output directory, shared by every writer in the process
+_manifests: dict[Path, OutputManifest] = {}
+_manifests_lock = threading.Lock()
+
+
+def manifest_for(output_dir: str | Path) -> OutputManifest:
+    """The manifest of an output directory (loaded on first use)."""
+    key = Path(output_dir).resolve()
+    with _manifests_lock:
+        if key not in _manifests:
+            _manifests[key] = OutputManifest(output_dir)
+        return _manifests[key]
@@ -4,12 +4,108 @@ Handles writing results to JSON and TXT files.
 """
 
 import json
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+import numpy as np
 
 from .extractor import CandidateTerm
 from .clusterer import ClusteringResult
+from .term_matrix import TermMatrix, first_rows_per_column
+from .output_manifest import manifest_for
+
+# Source-count bucket edges for the summary stats, and the labels of the ranges between them
+FREQUENCY_BUCKET_EDGES = [2, 5, 10, 20, 50]
+FREQUENCY_BUCKET_LABELS = ["1", "2-4", "5-9", "10-19", "20-49", "50+"]
+
+# Number of top terms and companies listed in the summary stats
+SUMMARY_TOP_TERMS = 20
+SUMMARY_TOP_COMPANIES = 10
+
+# Formats the candidate lists can be written in: indented JSON, single-line JSON, or JSON lines
+JSON_FORMATS = ("json", "compact", "ndjson")
+
+
+@dataclass
+class CandidateAggregates:
+    """Sort order and per-company aggregates of a candidate set, shared by the output writers."""
+    sorted_candidates: list[CandidateTerm]  # By (sources, count) descending; ties keep input order
+    frequency_buckets: dict[str, int]  # Source-count bucket label (highest first) -> number of terms
+    # Companies by number of distinct terms (ties in first-seen order), each with its terms sorted
+    company_terms: Optional[list[tuple[str, list[str]]]] = None
+    # Companies with the most terms (ties in the order first seen walking the sorted terms)
+    top_companies: Optional[list[tuple[str, int]]] = None
+
+    @property
+    def top_terms(self) -> list[CandidateTerm]:
+        return self.sorted_candidates[:SUMMARY_TOP_TERMS]
+
+
+def aggregate_candidates(
+    candidates: dict[str, CandidateTerm],
+    matrix: Optional[TermMatrix] = None,
+    by_company: bool = True
+) -> CandidateAggregates:
+    """
+    Compute everything the writers derive from a candidate set in one pass.
+
+    Args:
+        candidates: Candidate terms
+        matrix: Term matrix with rows in candidates' order (built from sources if not given)
+        by_company: Also compute the company aggregates (needs the company incidence matrix)
+
+    Returns:
+        CandidateAggregates
+    """
+    views = list(candidates.values())
+    counts = np.fromiter((c.count for c in views), dtype=np.int64, count=len(views))
+    if by_company:
+        matrix = matrix if matrix is not None else TermMatrix.from_candidates(candidates)
+        incidence = matrix.company_incidence()
+        source_counts = np.diff(incidence.indptr)
+    else:
+        source_counts = np.fromiter((len(c.sources) for c in views), dtype=np.int64, count=len(views))
+
+    # Sort by sources, then count (descending; lexsort is stable like sorted())
+    order = np.lexsort((-counts, -source_counts))
+
+    # Frequency buckets
+    bucket_sizes = np.bincount(
+        np.searchsorted(FREQUENCY_BUCKET_EDGES, source_counts, side="right"),
+        minlength=len(FREQUENCY_BUCKET_LABELS)
+    )
+    buckets = {label: int(bucket_sizes[i]) for i, label in reversed(list(enumerate(FREQUENCY_BUCKET_LABELS)))}
+
+    aggregates = CandidateAggregates(
+        sorted_candidates=[views[i] for i in order],
+        frequency_buckets=buckets
+    )
+    if not by_company:
+        return aggregates
+
+    incidence = incidence.tocsc()
+    name_ranks = matrix.company_name_ranks()
+    terms = [c.term for c in views]
+
+    # Company -> terms, in the order companies are first seen walking terms in input order (then by name)
+    columns, first_rows = first_rows_per_column(incidence, np.arange(len(views)))
+    company_terms: list[tuple[str, set[str]]] = []
+    for column in columns[np.lexsort((name_ranks[columns], first_rows))]:
+        rows = incidence.indices[incidence.indptr[column]:incidence.indptr[column + 1]]
+        company_terms.append((matrix.companies[column], {terms[row] for row in rows}))
+    company_terms.sort(key=lambda x: len(x[1]), reverse=True)
+    aggregates.company_terms = [(company, sorted(company_set)) for company, company_set in company_terms]
+
+    # Companies with most terms, ties in the order they're first seen walking the sorted terms
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    columns, first_ranks = first_rows_per_column(incidence, rank)
+    terms_per_company = np.diff(incidence.indptr)[columns]
+    top = np.lexsort((name_ranks[columns], first_ranks, -terms_per_company))[:SUMMARY_TOP_COMPANIES]
+    aggregates.top_companies = [(matrix.companies[columns[i]], int(terms_per_company[i])) for i in top]
+    return aggregates
 
 
 def ensure_output_dir(output_dir: Path) -> None:
@@ -17,62 +113,181 @@ def ensure_output_dir(output_dir: Path) -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
 
 
+# Every write goes through the output directory's manifest, which skips
+# unchanged files and replaces changed ones atomically (see output_manifest)
+
 def write_json(data: Any, filepath: Path) -> None:
     """Write data to JSON file with pretty formatting."""
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    content = json.dumps(data, indent=2, ensure_ascii=False)
+    manifest_for(filepath.parent).write(filepath, lambda: (content,))
 
 
 def write_txt(content: str, filepath: Path) -> None:
     """Write content to text file."""
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(content)
+    manifest_for(filepath.parent).write(filepath, lambda: (content,))
+
+
+def _joined_lines(lines: Iterable[str]) -> Iterator[str]:
+    for i, line in enumerate(lines):
+        yield "\n" + line if i else line
+
+
+def write_txt_lines(make_lines: Callable[[], Iterable[str]], filepath: Path) -> None:
+    """
+    Write lines to a text file as they're generated (same bytes as joining them with newlines).
+
+    make_lines is called once to hash the content and again only if it has to be written.
+    """
+    manifest_for(filepath.parent).write(filepath, lambda: _joined_lines(make_lines()))
+
+
+def _json_chunks(data: dict[str, Any], compact: bool) -> Iterator[str]:
+    """
+    Serialize a dict piece by piece, as json.dump(indent=2) would (or
+    without whitespace if compact). Iterator values are written as lists,
+    one item at a time, so they never have to be held in memory.
+    """
+    def dumps(value: Any, depth: int) -> str:
+        if compact:
+            return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        return json.dumps(value, ensure_ascii=False, indent=2).replace("\n", "\n" + "  " * depth)
+
+    yield "{"
+    for i, (key, value) in enumerate(data.items()):
+        prefix = "," if i else ""
+        if compact:
+            prefix += json.dumps(key, ensure_ascii=False) + ":"
+        else:
+            prefix += "\n  " + json.dumps(key, ensure_ascii=False) + ": "
+
+        if isinstance(value, Iterator):
+            yield prefix + "["
+            empty = True
+            for j, item in enumerate(value):
+                yield ("," if j else "") + ("" if compact else "\n    ") + dumps(item, 2)
+                empty = False
+            yield "]" if compact or empty else "\n  ]"
+        else:
+            yield prefix + dumps(value, 1)
+    yield "}" if compact or not data else "\n}"
+
+
+def _ndjson_lines(data: dict[str, Any]) -> Iterator[str]:
+    """One line holding the dict's plain values, then one line per item of its iterator values."""
+    header = {key: value for key, value in data.items() if not isinstance(value, Iterator)}
+    yield json.dumps(header, ensure_ascii=False, separators=(",", ":")) + "\n"
+    for value in data.values():
+        if isinstance(value, Iterator):
+            for item in value:
+                yield json.dumps(item, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def json_output_path(filepath: Path, json_format: str = "json") -> Path:
+    """Where write_json_stream writes filepath in the given format (.ndjson for JSON lines)."""
+    return filepath.with_suffix(".ndjson") if json_format == "ndjson" else filepath
+
+
+def write_json_stream(
+    make_data: Callable[[], dict[str, Any]],
+    filepath: Path,
+    json_format: str = "json"
+) -> Path:
+    """
+    Write a dict to a JSON file without building the whole document first.
+
+    Values that are iterators (e.g. generator expressions of records) are
+    streamed as lists. "json" output is byte-identical to write_json.
+
+    Args:
+        make_data: Returns the top-level object; its iterator values are consumed
+            as they're serialized. Called once to hash the content and again only
+            if the file has to be written.
+        filepath: Target .json path
+        json_format: "json" (indented), "compact" (no whitespace) or "ndjson"
+            (a header line with the plain values, then one line per list item)
+
+    Returns:
+        The path written
+    """
+    if json_format not in JSON_FORMATS:
+        raise ValueError(f"Unknown JSON format: {json_format}")
+    filepath = json_output_path(filepath, json_format)
+
+    def chunks() -> Iterator[str]:
+        data = make_data()
+        return _ndjson_lines(data) if json_format == "ndjson" else _json_chunks(data, json_format == "compact")
+
+    manifest_for(filepath.parent).write(filepath, chunks)
+    return filepath
 
 
 def write_raw_candidates(
     candidates: dict[str, CandidateTerm],
     output_dir: Path,
-    num_source_files: int
+    num_source_files: int,
+    json_format: str = "json",
+    txt: bool = True,
+    aggregates: Optional[CandidateAggregates] = None
 ) -> None:
     """
     Write raw candidates to output files (1_raw_candidates.json/.txt).
+
+    Records are streamed to disk rather than built up in memory first.
+
+    Args:
+        candidates: Merged candidate terms
+        output_dir: Directory to write to
+        num_source_files: Number of documents the candidates came from
+        json_format: "json", "compact" or "ndjson" (see write_json_stream)
+        txt: Also write the .txt report
+        aggregates: Precomputed aggregates of candidates (computed here if not given)
     """
     ensure_output_dir(output_dir)
 
-    # Sort by count descending
-    sorted_candidates = sorted(
-        candidates.values(),
-        key=lambda x: (len(x.sources), x.count),
-        reverse=True
-    )
+    # Sorted by sources, then count, descending
+    aggregates = aggregates or aggregate_candidates(candidates, by_company=False)
+    sorted_candidates = aggregates.sorted_candidates
+
+    # JSON records are generated as they're streamed
+    def json_data() -> dict[str, Any]:
+        return {
+            "metadata": {
+                "total_extracted": len(candidates),
+                "extraction_date": datetime.now().strftime("%Y-%m-%d"),
+                "source_files": num_source_files
+            },
+            "candidates": (
+                {
+                    "term": c.term,
+                    "count": c.count,
+                    "num_sources": len(c.sources),
+                    "sources": sorted(c.sources),
+                    "signals": sorted(c.signals),
+                    "original_forms": sorted(c.original_forms)
+                }
+                for c in sorted_candidates
+            )
+        }
 
-    # Build JSON data
-    json_data = {
-        "metadata": {
-            "total_extracted": len(candidates),
-            "extraction_date": datetime.now().strftime("%Y-%m-%d"),
-            "source_files": num_source_files
-        },
-        "candidates": [
-            {
-                "term": c.term,
-                "count": c.count,
-                "num_sources": len(c.sources),
-                "sources": sorted(c.sources),
-                "signals": sorted(c.signals),
-                "original_forms": sorted(c.original_forms)
-            }
-            for c in sorted_candidates
-        ]
-    }
+    write_json_stream(json_data, output_dir / "1_raw_candidates.json", json_format)
 
-    write_json(json_data, output_dir / "1_raw_candidates.json")
+    if txt:
+        write_txt_lines(
+            lambda: _raw_candidates_txt(sorted_candidates, len(candidates), num_source_files),
+            output_dir / "1_raw_candidates.txt"
+        )
 
-    # Build TXT content
-    txt_lines = [
+
+def _raw_candidates_txt(
+    sorted_candidates: list[CandidateTerm],
+    total: int,
+    num_source_files: int
+) -> Iterator[str]:
+    """Lines of 1_raw_candidates.txt."""
+    yield from [
         "RAW CANDIDATES EXTRACTED",
         "=" * 50,
-        f"Total candidates extracted: {len(candidates)}",
+        f"Total candidates extracted: {total}",
         f"Source files processed: {num_source_files}",
         f"Extraction date: {datetime.now().strftime('%Y-%m-%d')}",
         "",
@@ -83,62 +298,85 @@ def write_raw_candidates(
 
     for c in sorted_candidates:
         signals_str = ", ".join(sorted(c.signals))
-        txt_lines.append(f"{c.term} ({c.count} occurrences, {len(c.sources)} sources)")
-        txt_lines.append(f"  Signals: {signals_str}")
-        txt_lines.append("")
-
-    write_txt("\n".join(txt_lines), output_dir / "1_raw_candidates.txt")
+        yield f"{c.term} ({c.count} occurrences, {len(c.sources)} sources)"
+        yield f"  Signals: {signals_str}"
+        yield ""
 
 
 def write_filtered_candidates(
     filtered: dict[str, CandidateTerm],
     removed: dict[str, CandidateTerm],
     output_dir: Path,
-    min_occurrences: int
+    min_occurrences: int,
+    json_format: str = "json",
+    txt: bool = True,
+    aggregates: Optional[CandidateAggregates] = None
 ) -> None:
     """
     Write filtered candidates to output files (2_filtered_candidates.json/.txt).
+
+    Records are streamed to disk rather than built up in memory first.
+
+    Args:
+        filtered: Candidates that passed filtering
+        removed: Candidates that were filtered out
+        output_dir: Directory to write to
+        min_occurrences: Source threshold used for filtering
+        json_format: "json", "compact" or "ndjson" (see write_json_stream)
+        txt: Also write the .txt report
+        aggregates: Precomputed aggregates of filtered (computed here if not given)
     """
     ensure_output_dir(output_dir)
 
-    # Sort by count descending
-    sorted_filtered = sorted(
-        filtered.values(),
-        key=lambda x: (len(x.sources), x.count),
-        reverse=True
-    )
+    # Sorted by sources, then count, descending
+    aggregates = aggregates or aggregate_candidates(filtered, by_company=False)
+    sorted_filtered = aggregates.sorted_candidates
+
+    # JSON records are generated as they're streamed
+    def json_data() -> dict[str, Any]:
+        return {
+            "metadata": {
+                "total_after_filtering": len(filtered),
+                "total_removed": len(removed),
+                "filtering_criteria": {
+                    "min_occurrences": min_occurrences,
+                    "removed_common_english": True,
+                    "removed_company_names": True,
+                    "removed_locations": True
+                }
+            },
+            "candidates": (
+                {
+                    "term": c.term,
+                    "count": c.count,
+                    "num_sources": len(c.sources),
+                    "sources": sorted(c.sources)
+                }
+                for c in sorted_filtered
+            )
+        }
 
-    # Build JSON data
-    json_data = {
-        "metadata": {
-            "total_after_filtering": len(filtered),
-            "total_removed": len(removed),
-            "filtering_criteria": {
-                "min_occurrences": min_occurrences,
-                "removed_common_english": True,
-                "removed_company_names": True,
-                "removed_locations": True
-            }
-        },
-        "candidates": [
-            {
-                "term": c.term,
-                "count": c.count,
-                "num_sources": len(c.sources),
-                "sources": sorted(c.sources)
-            }
-            for c in sorted_filtered
-        ]
-    }
+    write_json_stream(json_data, output_dir / "2_filtered_candidates.json", json_format)
 
-    write_json(json_data, output_dir / "2_filtered_candidates.json")
+    if txt:
+        write_txt_lines(
+            lambda: _filtered_candidates_txt(sorted_filtered, len(filtered), len(removed), min_occurrences),
+            output_dir / "2_filtered_candidates.txt"
+        )
 
-    # Build TXT content
-    txt_lines = [
+
+def _filtered_candidates_txt(
+    sorted_filtered: list[CandidateTerm],
+    total: int,
+    total_removed: int,
+    min_occurrences: int
+) -> Iterator[str]:
+    """Lines of 2_filtered_candidates.txt."""
+    yield from [
         "FILTERED CANDIDATES",
         "=" * 50,
-        f"Total after filtering: {len(filtered)}",
-        f"Total removed: {len(removed)}",
+        f"Total after filtering: {total}",
+        f"Total removed: {total_removed}",
         f"Min occurrences threshold: {min_occurrences}",
         "",
         "CANDIDATES (sorted by frequency)",
@@ -147,17 +385,18 @@ def write_filtered_candidates(
     ]
 
     for c in sorted_filtered:
-        txt_lines.append(f"{c.term} ({c.count} occurrences, {len(c.sources)} sources)")
-
-    write_txt("\n".join(txt_lines), output_dir / "2_filtered_candidates.txt")
+        yield f"{c.term} ({c.count} occurrences, {len(c.sources)} sources)"
 
 
 def write_clustered_keywords(
     clustering_result: ClusteringResult,
-    output_dir: Path
+    output_dir: Path,
+    txt: bool = True
 ) -> None:
     """
     Write clustering results to output files (3_clustered_keywords.json/.txt).
+
+    The .txt report is only built if txt is set.
     """
     ensure_output_dir(output_dir)
 
@@ -183,6 +422,8 @@ def write_clustered_keywords(
     }
 
     write_json(json_data, output_dir / "3_clustered_keywords.json")
+    if not txt:
+        return
 
     # Build TXT content
     txt_lines = [
@@ -218,19 +459,21 @@ def write_clustered_keywords(
 
 def write_manual_review_template(
     candidates: dict[str, CandidateTerm],
-    output_dir: Path
+    output_dir: Path,
+    txt: bool = True,
+    aggregates: Optional[CandidateAggregates] = None
 ) -> None:
     """
     Write manual review template (4_manual_review_template.json/.txt).
+
+    The .txt report is only built if txt is set. Pass the candidates'
+    aggregates to reuse their sort order.
     """
     ensure_output_dir(output_dir)
 
-    # Sort by count descending
-    sorted_candidates = sorted(
-        candidates.values(),
-        key=lambda x: (len(x.sources), x.count),
-        reverse=True
-    )
+    # Sorted by sources, then count, descending
+    aggregates = aggregates or aggregate_candidates(candidates, by_company=False)
+    sorted_candidates = aggregates.sorted_candidates
 
     # Predefined categories
     categories = [
@@ -260,6 +503,8 @@ def write_manual_review_template(
     }
 
     write_json(json_data, output_dir / "4_manual_review_template.json")
+    if not txt:
+        return
 
     # Build TXT content
     txt_lines = [
@@ -292,45 +537,46 @@ def write_manual_review_template(
 
 def write_by_company(
     candidates: dict[str, CandidateTerm],
-    output_dir: Path
+    output_dir: Path,
+    matrix: Optional[TermMatrix] = None,
+    txt: bool = True,
+    aggregates: Optional[CandidateAggregates] = None
 ) -> None:
     """
     Write terms grouped by company (5_by_company.json/.txt).
+
+    Args:
+        candidates: Terms to write
+        output_dir: Directory to write to
+        matrix: Term matrix with rows in candidates' order (built from sources if not given)
+        txt: Also write the .txt report
+        aggregates: Precomputed aggregates of candidates, including company aggregates
     """
     ensure_output_dir(output_dir)
 
-    # Build company -> terms mapping
-    company_terms: dict[str, set[str]] = {}
-
-    for candidate in candidates.values():
-        for company in candidate.sources:
-            if company not in company_terms:
-                company_terms[company] = set()
-            company_terms[company].add(candidate.term)
-
-    # Sort companies by term count
-    sorted_companies = sorted(
-        company_terms.items(),
-        key=lambda x: len(x[1]),
-        reverse=True
-    )
+    # Companies sorted by term count, each with its sorted terms
+    if aggregates is None or aggregates.company_terms is None:
+        aggregates = aggregate_candidates(candidates, matrix)
+    sorted_companies = aggregates.company_terms
 
     # Build JSON data
     json_data = {
         company: {
-            "all_terms": sorted(terms),
+            "all_terms": terms,
             "term_count": len(terms)
         }
         for company, terms in sorted_companies
     }
 
     write_json(json_data, output_dir / "5_by_company.json")
+    if not txt:
+        return
 
     # Build TXT content
     txt_lines = [
         "TERMS BY COMPANY",
         "=" * 50,
-        f"Total companies: {len(company_terms)}",
+        f"Total companies: {len(sorted_companies)}",
         "",
         "COMPANIES (sorted by term count)",
         "-" * 50,
@@ -339,7 +585,7 @@ def write_by_company(
 
     for company, terms in sorted_companies:
         txt_lines.append(f"{company} ({len(terms)} terms)")
-        for term in sorted(terms):
+        for term in terms:
             txt_lines.append(f"  - {term}")
         txt_lines.append("")
 
@@ -349,51 +595,29 @@ def write_by_company(
 def write_summary_stats(
     candidates: dict[str, CandidateTerm],
     num_source_files: int,
-    output_dir: Path
+    output_dir: Path,
+    matrix: Optional[TermMatrix] = None,
+    txt: bool = True,
+    aggregates: Optional[CandidateAggregates] = None
 ) -> None:
     """
     Write summary statistics (6_summary_stats.json/.txt).
+
+    Args:
+        candidates: Terms to summarize
+        num_source_files: Number of documents processed
+        output_dir: Directory to write to
+        matrix: Term matrix with rows in candidates' order (built from sources if not given)
+        txt: Also write the .txt report
+        aggregates: Precomputed aggregates of candidates, including company aggregates
     """
     ensure_output_dir(output_dir)
 
-    # Sort by count
-    sorted_candidates = sorted(
-        candidates.values(),
-        key=lambda x: (len(x.sources), x.count),
-        reverse=True
-    )
-
-    # Top 20 terms
-    top_20 = sorted_candidates[:20]
-
-    # Frequency buckets
-    buckets = {"50+": 0, "20-49": 0, "10-19": 0, "5-9": 0, "2-4": 0, "1": 0}
-    for c in sorted_candidates:
-        sources = len(c.sources)
-        if sources >= 50:
-            buckets["50+"] += 1
-        elif sources >= 20:
-            buckets["20-49"] += 1
-        elif sources >= 10:
-            buckets["10-19"] += 1
-        elif sources >= 5:
-            buckets["5-9"] += 1
-        elif sources >= 2:
-            buckets["2-4"] += 1
-        else:
-            buckets["1"] += 1
-
-    # Companies with most terms
-    company_term_counts: dict[str, int] = {}
-    for c in sorted_candidates:
-        for company in c.sources:
-            company_term_counts[company] = company_term_counts.get(company, 0) + 1
-
-    top_companies = sorted(
-        company_term_counts.items(),
-        key=lambda x: x[1],
-        reverse=True
-    )[:10]
+    if aggregates is None or aggregates.top_companies is None:
+        aggregates = aggregate_candidates(candidates, matrix)
+    top_20 = aggregates.top_terms
+    buckets = aggregates.frequency_buckets
+    top_companies = aggregates.top_companies
 
     # Build JSON data
     json_data = {
@@ -412,6 +636,8 @@ def write_summary_stats(
     }
 
     write_json(json_data, output_dir / "6_summary_stats.json")
+    if not txt:
+        return
 
     # Build TXT content
     txt_lines = [
@@ -0,0 +1,97 @@
+"""
+Parallel Module
+Handles fanning candidate extraction out to a pool of worker processes.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+from .file_reader import JobDescription
+from .preprocessor import preprocess_text
+from .extractor import KeywordExtractor, CandidateTerm
+
+
+# Each worker process holds its own extractor (and spaCy model)
+_worker_extractor: Optional[KeywordExtractor] = None
+
+
+def _init_worker() -> None:
+    """Load the extractor once per worker process."""
+    global _worker_extractor
+    _worker_extractor = KeywordExtractor()
+
+
+def _extract_chunk(
+    jobs: list[tuple[str, str]],
+    batch_size: int
+) -> list[dict[str, CandidateTerm]]:
+    """Preprocess and extract candidates for a chunk of (content, company) pairs."""
+    docs = [(preprocess_text(content), company) for content, company in jobs]
+    if batch_size > 0:
+        return list(_worker_extractor.extract_candidates_batch(docs, batch_size))
+    return [_worker_extractor.extract_candidates(text, company) for text, company in docs]
+
+
+def _chunked(job_descriptions: Iterable[JobDescription], size: int) -> Iterator[list[tuple[str, str]]]:
+    """Group job descriptions into lists of (content, company) pairs."""
+    jobs = ((jd.content, jd.company) for jd in job_descriptions)
+    while chunk := list(islice(jobs, size)):
+        yield chunk
+
+
+class ExtractionPool:
+    """
+    A pool of extraction worker processes that can be fed several streams.
+
+    Use as a context manager. Workers (and their spaCy models) start on the
+    first submitted chunk and are reused by every extract() call until the
+    pool is closed.
+    """
+
+    def __init__(self, workers: int, chunksize: int = 1, batch_size: int = 0):
+        """
+        Args:
+            workers: Number of worker processes
+            chunksize: Number of documents sent to a worker per task
+            batch_size: spaCy batch size inside each worker (0 = one nlp() call per document)
+        """
+        self.workers = workers
+        self.chunksize = chunksize
+        self.batch_size = batch_size
+        # Chunks submitted but not yet consumed; bounds how far reading runs ahead of extraction
+        self.max_pending = workers * 2
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ExtractionPool":
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._executor.shutdown(cancel_futures=True)
+        self._executor = None
+
+    def extract(self, job_descriptions: Iterable[JobDescription]) -> Iterator[dict[str, CandidateTerm]]:
+        """
+        Extract candidates from job descriptions using the pool.
+
+        Input is consumed lazily, at most max_pending chunks ahead of the
+        results handed back. Results are yielded in input order, so merging
+        them gives the same result as a serial run.
+
+        Args:
+            job_descriptions: Job descriptions to process (any iterable)
+
+        Yields:
+            Per-document candidate dictionaries, in input order
+        """
+        pending: deque[Future] = deque()
+        for chunk in _chunked(job_descriptions, self.chunksize):
+            pending.append(self._executor.submit(_extract_chunk, chunk, self.batch_size))
+            if len(pending) >= self.max_pending:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
+
@@ -0,0 +1,204 @@
+"""
+Refine Engine Module
+Handles the clean -> refine chain that turns the filtered candidates into master_skills.json.
+
+Usage:
+    python src/refine_engine.py [input_file] [output_dir] [--rules v3] [--dump-intermediates]
+
+The pipeline runs the same chain on the filtered candidates in memory (main.py --refine).
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional, Sequence
+
+if __name__ == "__main__" and __package__ is None:
+    # Add the parent directory to sys.path to allow relative imports
+    file_path = Path(__file__).resolve()
+    sys.path.append(str(file_path.parent.parent))
+    __package__ = file_path.parent.name
+
+from .clean_keywords import CLEANED_DESCRIPTION, clean_keyword_list, load_candidate_keywords
+from .output_writer import write_json
+
+
+# Versioned allowlist / normalization rule files (refine_rules/<version>.json)
+RULES_DIR = Path(__file__).parent / "refine_rules"
+
+# The rules master_skills.json is built with
+DEFAULT_RULES = ("v3",)
+
+MASTER_SKILLS_FILE = "master_skills.json"
+CLEANED_DUMP_FILE = "7_cleaned_tech_dictionary.json"
+
+# Stripped from both ends of a (lowercased) keyword before it's looked up
+STRIP_CHARS = " .,;:'\"()[]{}<>/-+="
+
+
+@dataclass(frozen=True)
+class RefineRules:
+    """One version of the refine rules, compiled into immutable lookups."""
+    version: str
+    description: str  # Description written into the refined dictionary
+    summary: str  # What the rules are, for progress messages
+    dump_file: str  # File name of this step's intermediate dump
+    allowlist: frozenset[str]  # Lowercased canonical keywords to keep
+    normalization: Mapping[str, str]  # Lowercased variant -> canonical keyword
+    merge_variants: bool  # Keep one spelling (the shortest) per canonical keyword
+
+    @classmethod
+    def from_file(cls, path: Path) -> "RefineRules":
+        """Compile a rules file (see refine_rules/)."""
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            version=data["version"],
+            description=data["description"],
+            summary=data["summary"],
+            dump_file=data["dump_file"],
+            allowlist=frozenset(term for terms in data["allowlist"].values() for term in terms),
+            normalization=MappingProxyType(dict(data["normalization"])),
+            merge_variants=data["merge_variants"]
+        )
+
+    def canonical(self, keyword: str) -> Optional[str]:
+        """The allowlisted keyword a keyword normalizes to (None if it isn't allowed)."""
+        clean_kw = keyword.lower().strip(STRIP_CHARS)
+        normalized_kw = self.normalization.get(clean_kw, clean_kw)
+        return normalized_kw if normalized_kw in self.allowlist else None
+
+    def refine(self, keywords: Iterable[str]) -> list[str]:
+        """
+        Keep the allowlisted keywords, in their original spelling.
+
+        Args:
+            keywords: Keywords to refine
+
+        Returns:
+            Kept keywords, sorted case-insensitively
+        """
+        if not self.merge_variants:
+            return sorted({kw for kw in keywords if self.canonical(kw) is not None}, key=str.lower)
+
+        # Prefer shorter spellings of each canonical keyword (ties keep the first seen)
+        original_forms: dict[str, str] = {}
+        for keyword in keywords:
+            normalized_kw = self.canonical(keyword)
+            if normalized_kw is None:
+                continue
+            if normalized_kw not in original_forms or len(keyword) < len(original_forms[normalized_kw]):
+                original_forms[normalized_kw] = keyword
+        return sorted(original_forms.values(), key=str.lower)
+
+    def dictionary(self, keywords: list[str]) -> dict:
+        """Refined keywords in the dictionary file format."""
+        return {"description": self.description, "count": len(keywords), "keywords": keywords}
+
+
+@lru_cache(maxsize=None)
+def load_rules(version: str) -> RefineRules:
+    """
+    Load and compile a rules version (cached, so each file is read once per process).
+
+    Raises:
+        ValueError: If there's no rules file for the version
+    """
+    path = RULES_DIR / f"{version}.json"
+    if not path.exists():
+        available = ", ".join(available_rules()) or "none"
+        raise ValueError(f"Unknown refine rules '{version}' (available: {available})")
+    return RefineRules.from_file(path)
+
+
+def available_rules() -> list[str]:
+    """Versions that have a rules file."""
+    return sorted(path.stem for path in RULES_DIR.glob("*.json"))
+
+
+def run_refine_chain(
+    cleaned: list[str],
+    output_dir: str | Path,
+    versions: Sequence[str] = DEFAULT_RULES,
+    dump_intermediates: bool = False
+) -> list[str]:
+    """
+    Refine cleaned keywords with each rules version, in memory.
+
+    Every version refines the cleaned keywords independently, as the old
+    per-version scripts each did from 7_cleaned_tech_dictionary.json; the
+    last version's dictionary becomes master_skills.json. Only that file
+    is written, plus each version's dictionary if dump_intermediates is set.
+
+    Args:
+        cleaned: Cleaned keywords (clean_keywords.clean_candidates or clean_keyword_list)
+        output_dir: Directory to write to
+        versions: Rules versions to apply; the last one builds master_skills.json
+        dump_intermediates: Also write the cleaned and per-version dictionaries
+
+    Returns:
+        The last version's keywords
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    chain = [load_rules(version) for version in versions]
+    if not chain:
+        raise ValueError("At least one refine rules version is needed")
+
+    if dump_intermediates:
+        write_json({"description": CLEANED_DESCRIPTION, "count": len(cleaned), "keywords": cleaned},
+                   output_dir / CLEANED_DUMP_FILE)
+
+    for rules in chain:
+        keywords = rules.refine(cleaned)
+        print(f"      Kept {len(keywords)} keywords after applying {rules.summary} ({rules.version})")
+        if dump_intermediates:
+            write_json(rules.dictionary(keywords), output_dir / rules.dump_file)
+
+    write_json(chain[-1].dictionary(keywords), output_dir / MASTER_SKILLS_FILE)
+    return keywords
+
+
+def main():
+    """CLI entry point."""
+    base_dir = Path(__file__).parent.parent
+    parser = argparse.ArgumentParser(description="Clean and refine the filtered candidates into master_skills.json.")
+    parser.add_argument(
+        "input_file", nargs="?", type=Path, default=base_dir / "output" / "2_filtered_candidates.json",
+        help="Filtered candidates (.json, .ndjson, or the legacy .txt report)"
+    )
+    parser.add_argument("output_dir", nargs="?", type=Path, default=base_dir / "output")
+    parser.add_argument(
+        "--rules", nargs="+", default=list(DEFAULT_RULES), metavar="VERSION",
+        help=f"Refine rules versions, each applied to the cleaned keywords; the last one builds "
+             f"{MASTER_SKILLS_FILE} (available: {', '.join(available_rules())}; default {' '.join(DEFAULT_RULES)})"
+    )
+    parser.add_argument(
+        "--dump-intermediates", action="store_true",
+        help="Also write the cleaned and per-version dictionaries"
+    )
+    args = parser.parse_args()
+
+    if not args.input_file.exists():
+        print(f"Error: Input file not found at {args.input_file}")
+        sys.exit(1)
+    try:
+        rules = [load_rules(version) for version in args.rules]
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(f"Reading candidates from: {args.input_file}")
+    raw_keywords = load_candidate_keywords(args.input_file)
+    print(f"      Extracted {len(raw_keywords)} raw keywords")
+    cleaned = clean_keyword_list(raw_keywords)
+    print(f"      Kept {len(cleaned)} keywords after cleaning and de-duplication")
+    keywords = run_refine_chain(cleaned, args.output_dir, [r.version for r in rules], args.dump_intermediates)
+    print(f"Wrote {len(keywords)} keywords to {args.output_dir / MASTER_SKILLS_FILE}")
+
+
+if __name__ == "__main__":
+    main()
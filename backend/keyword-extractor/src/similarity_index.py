@@ -0,0 +1,222 @@
+"""
+Similarity Index Module
+Handles nearest-neighbour lookups over normalized term embeddings.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+# Queries are scored against this many index rows at a time, bounding scratch memory
+QUERY_BLOCK_ROWS = 65536
+
+
+class SimilarityIndex:
+    """
+    Exact cosine-similarity index over term vectors.
+
+    Rows are unit-normalized float32, so a query is one matrix-vector
+    product per block plus a partial sort; at 50k terms x 300 dims that's a
+    few milliseconds, which is why there's no approximate index. Terms
+    without an embedding (all-zero vectors) are left out.
+
+    Saved as a raw float32 matrix plus a JSON-lines term list; load()
+    memory-maps the matrix read-only. save() builds the directory under a
+    temp name and swaps it into place, so readers never see a mix of old
+    and new files.
+    """
+
+    def __init__(self, terms: list[str], vectors: np.ndarray, embedding: str = ""):
+        """
+        Args:
+            terms: Term of each row
+            vectors: (len(terms), dim) unit-normalized float32 matrix
+            embedding: Which embedding space the vectors come from (TermClusterer.embedding_id)
+        """
+        self.terms = terms
+        self.vectors = vectors
+        self.embedding = embedding
+        # Lowercased lookup; the first spelling of a term wins
+        self.rows: dict[str, int] = {}
+        for row, term in enumerate(terms):
+            self.rows.setdefault(term.lower(), row)
+
+    @classmethod
+    def from_vectors(cls, terms: list[str], vectors: np.ndarray, embedding: str = "") -> "SimilarityIndex":
+        """
+        Build an index from raw (unnormalized) vectors.
+
+        Args:
+            terms: Term of each row
+            vectors: (len(terms), dim) embedding matrix
+            embedding: Which embedding space the vectors come from
+
+        Returns:
+            SimilarityIndex over the terms that have a non-zero vector
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1) if len(vectors) else np.zeros(0, dtype=np.float32)
+        keep = np.flatnonzero(norms > 0)
+        normalized = vectors[keep] / norms[keep, None]
+        return cls([terms[i] for i in keep], np.ascontiguousarray(normalized, dtype=np.float32), embedding)
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def __contains__(self, term: str) -> bool:
+        return term.lower() in self.rows
+
+    def vector(self, term: str) -> Optional[np.ndarray]:
+        """Normalized vector of an indexed term (None if it isn't indexed)."""
+        row = self.rows.get(term.lower())
+        return None if row is None else self.vectors[row]
+
+    def query(
+        self,
+        vector: np.ndarray,
+        k: int = 10,
+        exclude: Optional[int] = None
+    ) -> list[tuple[str, float]]:
+        """
+        Find the indexed terms closest to a vector.
+
+        Args:
+            vector: Query vector (needn't be normalized)
+            k: Number of results
+            exclude: Row to leave out of the results (e.g. the query term itself)
+
+        Returns:
+            Up to k (term, cosine similarity) pairs, most similar first
+        """
+        norm = np.linalg.norm(vector)
+        if norm == 0 or k <= 0 or not len(self.terms):
+            return []
+        query = (np.asarray(vector, dtype=np.float32) / norm).astype(np.float32)
+
+        scores = np.empty(len(self.terms), dtype=np.float32)
+        for start in range(0, len(self.terms), QUERY_BLOCK_ROWS):
+            block = self.vectors[start:start + QUERY_BLOCK_ROWS]
+            scores[start:start + len(block)] = block @ query
+        if exclude is not None:
+            scores[exclude] = -np.inf
+
+        k = min(k, len(scores) - (exclude is not None))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        # Ties broken by row so results are deterministic
+        top = top[np.lexsort((top, -scores[top]))]
+        return [(self.terms[row], float(scores[row])) for row in top]
+
+    def most_similar(self, term: str, k: int = 10) -> list[tuple[str, float]]:
+        """
+        Find the indexed terms closest to an indexed term, excluding itself.
+
+        Args:
+            term: Query term (case-insensitive)
+            k: Number of results
+
+        Returns:
+            Up to k (term, cosine similarity) pairs, most similar first
+
+        Raises:
+            KeyError: If the term isn't in the index
+        """
+        row = self.rows.get(term.lower())
+        if row is None:
+            raise KeyError(term)
+        return self.query(self.vectors[row], k, exclude=row)
+
+    @property
+    def content_hash(self) -> str:
+        """Hash of the terms, their vectors and the embedding id."""
+        digest = hashlib.sha256(self.embedding.encode("utf-8") + b"\0")
+        for term in self.terms:
+            digest.update(term.encode("utf-8") + b"\n")
+        digest.update(np.ascontiguousarray(self.vectors, dtype=np.float32).tobytes())
+        return digest.hexdigest()
+
+    def save(self, index_dir: str | Path) -> bool:
+        """
+        Write the index to a directory, replacing any index already there.
+
+        Returns:
+            True if the index was written, False if the saved index already held it
+        """
+        index_dir = Path(index_dir)
+        content_hash = self.content_hash
+        try:
+            if self._read_meta(index_dir).get("content_hash") == content_hash:
+                return False
+        except (OSError, ValueError):
+            pass
+
+        temp_dir = index_dir.with_name(f".{index_dir.name}.{os.getpid()}.tmp")
+        old_dir = index_dir.with_name(f".{index_dir.name}.{os.getpid()}.old")
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        try:
+            temp_dir.mkdir(parents=True)
+            with open(temp_dir / "vectors.f32", "wb") as f:
+                f.write(self.vectors.tobytes())
+            with open(temp_dir / "terms.jsonl", "w", encoding="utf-8") as f:
+                f.writelines(json.dumps(term, ensure_ascii=False) + "\n" for term in self.terms)
+            # Written last: an index without meta.json is incomplete
+            with open(temp_dir / "meta.json", "w", encoding="utf-8") as f:
+                json.dump({
+                    "dim": int(self.vectors.shape[1]),
+                    "rows": len(self.terms),
+                    "embedding": self.embedding,
+                    "content_hash": content_hash
+                }, f)
+
+            if index_dir.exists():
+                os.replace(index_dir, old_dir)
+            os.replace(temp_dir, index_dir)
+        except BaseException:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+        shutil.rmtree(old_dir, ignore_errors=True)
+        return True
+
+    @staticmethod
+    def _read_meta(index_dir: Path) -> dict:
+        """meta.json of a saved index, checked against the sizes of the other files."""
+        with open(index_dir / "meta.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if not isinstance(meta, dict) or not {"rows", "dim"} <= meta.keys():
+            raise ValueError(f"{index_dir / 'meta.json'} is incomplete")
+        expected_bytes = meta["rows"] * meta["dim"] * np.dtype(np.float32).itemsize
+        if (index_dir / "vectors.f32").stat().st_size != expected_bytes:
+            raise ValueError(f"{index_dir / 'vectors.f32'} doesn't match meta.json")
+        if not (index_dir / "terms.jsonl").exists():
+            raise FileNotFoundError(index_dir / "terms.jsonl")
+        return meta
+
+    @classmethod
+    def load(cls, index_dir: str | Path) -> "SimilarityIndex":
+        """
+        Load an index written by save(), memory-mapping its vectors.
+
+        Raises:
+            FileNotFoundError: If there's no index in the directory
+            ValueError: If the index files don't match each other
+        """
+        index_dir = Path(index_dir)
+        meta = cls._read_meta(index_dir)
+        with open(index_dir / "terms.jsonl", "r", encoding="utf-8") as f:
+            terms = [json.loads(line) for line in f]
+        if len(terms) != meta["rows"]:
+            raise ValueError(f"{index_dir / 'terms.jsonl'} doesn't match meta.json")
+
+        if meta["rows"] and meta["dim"]:
+            vectors = np.memmap(index_dir / "vectors.f32", dtype=np.float32, mode="r",
+                                shape=(meta["rows"], meta["dim"]))
+        else:
+            vectors = np.zeros((meta["rows"], meta["dim"]), dtype=np.float32)
+        return cls(terms, vectors, meta.get("embedding", ""))
@@ -0,0 +1,218 @@
+"""
+SQLite Sink Module
+Handles bulk-loading extraction results into an indexed SQLite database for ad-hoc queries.
+"""
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Iterable, Mapping, Optional
+
+import numpy as np
+from scipy import sparse
+
+from .extractor import CandidateTerm
+from .term_matrix import TermMatrix
+from .output_manifest import manifest_for
+
+
+# Default database file name, relative to the output directory
+SQLITE_FILE = "candidates.db"
+
+# Rows per executemany() call, bounding the memory of each batch
+INSERT_BATCH_ROWS = 50000
+
+SCHEMA = """
+CREATE TABLE terms (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL,
+    term TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    num_sources INTEGER NOT NULL
+);
+CREATE TABLE companies (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE signals (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL
+);
+CREATE TABLE term_companies (
+    term_id INTEGER NOT NULL REFERENCES terms(id),
+    company_id INTEGER NOT NULL REFERENCES companies(id),
+    occurrences INTEGER NOT NULL,
+    PRIMARY KEY (term_id, company_id)
+) WITHOUT ROWID;
+CREATE TABLE term_signals (
+    term_id INTEGER NOT NULL REFERENCES terms(id),
+    signal_id INTEGER NOT NULL REFERENCES signals(id),
+    PRIMARY KEY (term_id, signal_id)
+) WITHOUT ROWID;
+"""
+
+# Created after the bulk load, which is faster than maintaining them row by row
+INDEXES = """
+CREATE UNIQUE INDEX terms_key ON terms(key);
+CREATE INDEX terms_term ON terms(term COLLATE NOCASE);
+CREATE INDEX terms_count ON terms(count DESC);
+CREATE UNIQUE INDEX companies_name ON companies(name);
+CREATE UNIQUE INDEX signals_name ON signals(name);
+CREATE INDEX term_companies_company ON term_companies(company_id, term_id);
+CREATE INDEX term_signals_signal ON term_signals(signal_id, term_id);
+"""
+
+
+def _batched(rows: Iterable[tuple], size: int = INSERT_BATCH_ROWS) -> Iterable[list[tuple]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _content_key(
+    views: list[CandidateTerm],
+    matrix: TermMatrix,
+    company_counts: sparse.csr_matrix,
+    signal_names: list[str]
+) -> str:
+    """Hash of everything that goes into the database, including its schema."""
+    digest = hashlib.sha256()
+    for text in (SCHEMA, INDEXES, *matrix.companies, *signal_names):
+        digest.update(text.encode("utf-8") + b"\0")
+    for key, c in zip(matrix.term_keys, views):
+        digest.update(f"{key}\0{c.term}\0{c.count}\0{','.join(sorted(c.signals))}\0".encode("utf-8"))
+    for array in (company_counts.indptr, company_counts.indices, company_counts.data):
+        digest.update(np.ascontiguousarray(array, dtype=np.int64).tobytes())
+    return digest.hexdigest()
+
+
+def write_sqlite(
+    candidates: Mapping[str, CandidateTerm],
+    path: str | Path,
+    matrix: Optional[TermMatrix] = None
+) -> bool:
+    """
+    Write candidates to a fresh SQLite database, unless it already holds them.
+
+    Tables: terms, companies, signals, term_companies (occurrences of
+    each term in each company's documents) and term_signals. The load
+    runs in one transaction with journaling off, and the indexes are
+    built once at the end. The database is built through the output
+    directory's manifest: next to path and renamed into place, so readers
+    never see a half-written file, and not at all if the content (and
+    schema) are the same as the last build's.
+
+    Args:
+        candidates: Candidate terms
+        path: Database file to (re)create
+        matrix: Term matrix with rows in candidates' order (built from sources if not given;
+            occurrences are then 1 per company, since per-document counts aren't known)
+
+    Returns:
+        True if the database was built, False if it was already up to date
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    matrix = matrix if matrix is not None else TermMatrix.from_candidates(candidates)
+    views = list(candidates.values())
+
+    company_counts = matrix.company_counts()
+    company_counts.eliminate_zeros()
+    company_counts.sort_indices()
+    source_counts = np.diff(company_counts.indptr)
+    signal_names = sorted({signal for c in views for signal in c.signals})
+    signal_ids = {name: i + 1 for i, name in enumerate(signal_names)}
+
+    def build(temp_path: Path) -> None:
+        temp_path.unlink(missing_ok=True)
+        connection = sqlite3.connect(temp_path)
+        try:
+            _load(connection, views, matrix, company_counts, source_counts, signal_ids)
+        finally:
+            connection.close()
+
+    key = _content_key(views, matrix, company_counts, signal_names)
+    return manifest_for(path.parent).write_built(path, key, build)
+
+
+def _load(
+    connection: sqlite3.Connection,
+    views: list[CandidateTerm],
+    matrix: TermMatrix,
+    company_counts: sparse.csr_matrix,
+    source_counts: np.ndarray,
+    signal_ids: dict[str, int]
+) -> None:
+    """Create the schema and bulk-load the rows into an empty database."""
+    connection.executescript("PRAGMA journal_mode = OFF; PRAGMA synchronous = OFF;" + SCHEMA)
+    with connection:
+        connection.executemany(
+            "INSERT INTO companies (id, name) VALUES (?, ?)",
+            ((i + 1, name) for i, name in enumerate(matrix.companies))
+        )
+        connection.executemany(
+            "INSERT INTO signals (id, name) VALUES (?, ?)",
+            ((i, name) for name, i in signal_ids.items())
+        )
+        terms = (
+            (row + 1, key, c.term, c.count, int(source_counts[row]))
+            for row, (key, c) in enumerate(zip(matrix.term_keys, views))
+        )
+        for batch in _batched(terms):
+            connection.executemany(
+                "INSERT INTO terms (id, key, term, count, num_sources) VALUES (?, ?, ?, ?, ?)", batch
+            )
+
+        term_ids = np.repeat(np.arange(1, len(views) + 1), source_counts).tolist()
+        occurrences = zip(term_ids, (company_counts.indices + 1).tolist(), company_counts.data.tolist())
+        for batch in _batched(occurrences):
+            connection.executemany(
+                "INSERT INTO term_companies (term_id, company_id, occurrences) VALUES (?, ?, ?)", batch
+            )
+
+        term_signals = (
+            (row + 1, signal_ids[signal])
+            for row, c in enumerate(views)
+            for signal in c.signals
+        )
+        for batch in _batched(term_signals):
+            connection.executemany("INSERT INTO term_signals (term_id, signal_id) VALUES (?, ?)", batch)
+
+        connection.executescript(INDEXES)
+    connection.execute("ANALYZE")
+
+
+def companies_mentioning(connection: sqlite3.Connection, terms: Iterable[str]) -> list[str]:
+    """
+    Companies whose job descriptions mention every one of the given terms.
+
+    Args:
+        connection: Connection to a database written by write_sqlite
+        terms: Terms to look up (case-insensitive)
+
+    Returns:
+        Company names, sorted
+    """
+    terms = sorted({term.lower() for term in terms})
+    if not terms:
+        return []
+    placeholders = ", ".join("?" * len(terms))
+    rows = connection.execute(
+        f"""
+        SELECT companies.name
+        FROM terms
+        JOIN term_companies ON term_companies.term_id = terms.id
+        JOIN companies ON companies.id = term_companies.company_id
+        WHERE terms.key IN ({placeholders})
+        GROUP BY companies.id
+        HAVING COUNT(DISTINCT terms.id) = ?
+        ORDER BY companies.name
+        """,
+        [*terms, len(terms)]
+    )
+    return [name for (name,) in rows]
@@ -0,0 +1,135 @@
+"""
+Term Matcher Module
+Handles multi-pattern lookups (exact, prefix, suffix, contained phrase) against fixed vocabularies.
+"""
+
+from collections import deque
+from typing import Iterable, Iterator
+
+
+class TermMatcher:
+    """
+    Aho-Corasick automaton over a fixed set of patterns.
+
+    Built once per vocabulary. Prefix and suffix queries walk a trie from
+    the start or end of the term and stop at the first mismatch; contained
+    queries make one pass over the term. All are linear in the term length
+    regardless of how many patterns there are.
+
+    Matching is case-sensitive - lowercase both sides for case-insensitive
+    lookups.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = frozenset(pattern for pattern in patterns if pattern)
+        ordered = sorted(self.patterns)
+
+        self._prefix_trie, self._prefix_ends = self._build_trie(ordered)
+        self._suffix_trie, self._suffix_ends = self._build_trie([p[::-1] for p in ordered])
+        self._transitions, self._outputs = self._build_automaton(ordered)
+
+    @staticmethod
+    def _build_trie(patterns: list[str]) -> tuple[list[dict[str, int]], list[int]]:
+        """Trie of patterns; ends[state] is the pattern length ending there (0 = none)."""
+        trie: list[dict[str, int]] = [{}]
+        ends = [0]
+        for pattern in patterns:
+            state = 0
+            for char in pattern:
+                if char not in trie[state]:
+                    trie[state][char] = len(trie)
+                    trie.append({})
+                    ends.append(0)
+                state = trie[state][char]
+            ends[state] = len(pattern)
+        return trie, ends
+
+    def _build_automaton(self, patterns: list[str]) -> tuple[list[dict[str, int]], list[tuple[int, ...]]]:
+        """
+        Turn the prefix trie into a deterministic Aho-Corasick automaton.
+
+        Failure links are folded into each state's transition table, so a
+        scan is one dict lookup per character (characters outside the
+        patterns' alphabet go back to the root).
+        """
+        trie = self._prefix_trie
+        # outputs[state]: lengths of every pattern ending at this state, longest first
+        outputs = [(length,) if length else () for length in self._prefix_ends]
+        alphabet = {char for pattern in patterns for char in pattern}
+
+        # Breadth-first, so a state's failure target (always shallower) is complete before it
+        transitions: list[dict[str, int]] = [dict(trie[0])]
+        transitions.extend({} for _ in range(len(trie) - 1))
+        fail = [0] * len(trie)
+        queue = deque(trie[0].values())
+        while queue:
+            state = queue.popleft()
+            fallback = transitions[fail[state]]
+            edges = transitions[state]
+            for char in alphabet:
+                child = trie[state].get(char)
+                if child is not None:
+                    edges[char] = child
+                    fail[child] = fallback.get(char, 0)
+                    outputs[child] = outputs[child] + outputs[fail[child]]
+                    queue.append(child)
+                else:
+                    target = fallback.get(char, 0)
+                    if target:
+                        edges[char] = target
+        return transitions, outputs
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def __contains__(self, term: str) -> bool:
+        """Exact match."""
+        return term in self.patterns
+
+    def starts_with_any(self, term: str) -> bool:
+        """True if some pattern is a prefix of term."""
+        trie, ends = self._prefix_trie, self._prefix_ends
+        state = 0
+        for char in term:
+            state = trie[state].get(char)
+            if state is None:
+                return False
+            if ends[state]:
+                return True
+        return False
+
+    def suffixes_of(self, term: str) -> Iterator[str]:
+        """Patterns that term ends with, shortest first."""
+        trie, ends = self._suffix_trie, self._suffix_ends
+        state = 0
+        for char in reversed(term):
+            state = trie[state].get(char)
+            if state is None:
+                return
+            if ends[state]:
+                yield term[-ends[state]:]
+
+    def ends_with_any(self, term: str) -> bool:
+        """True if some pattern is a suffix of term."""
+        return next(self.suffixes_of(term), None) is not None
+
+    def contains_any(self, term: str) -> bool:
+        """True if some pattern occurs anywhere in term."""
+        transitions, outputs = self._transitions, self._outputs
+        state = 0
+        for char in term:
+            state = transitions[state].get(char, 0)
+            if outputs[state]:
+                return True
+        return False
+
+    def find_all(self, term: str) -> list[tuple[int, str]]:
+        """Every (start, pattern) occurrence in term, including overlapping ones."""
+        transitions, outputs = self._transitions, self._outputs
+        found = []
+        state = 0
+        for end, char in enumerate(term, 1):
+            state = transitions[state].get(char, 0)
+            for length in outputs[state]:
+                found.append((end - length, term[end - length:end]))
+        return found
@@ -0,0 +1,106 @@
+"""
+Term Matrix Module
+Handles the sparse term x document count matrix and the aggregates derived from it.
+"""
+
+from dataclasses import dataclass
+from typing import Mapping, Sequence
+
+import numpy as np
+from scipy import sparse
+
+from .extractor import CandidateTerm
+
+
+@dataclass
+class TermMatrix:
+    """Sparse term x document occurrence counts with their index tables."""
+    counts: sparse.csr_matrix  # (terms, documents) occurrence counts
+    term_keys: list[str]  # Row -> term key
+    document_companies: np.ndarray  # Column -> index into companies (-1 = unknown)
+    companies: list[str]  # Company index -> name
+
+    @classmethod
+    def from_candidates(cls, candidates: Mapping[str, CandidateTerm]) -> "TermMatrix":
+        """
+        Build a matrix from merged candidates alone.
+
+        Per-document counts aren't known at that point, so each company
+        becomes one column holding a 1 wherever the term was seen; only
+        presence is meaningful.
+        """
+        companies = sorted({company for c in candidates.values() for company in c.sources})
+        company_index = {company: i for i, company in enumerate(companies)}
+
+        indptr = [0]
+        indices: list[int] = []
+        for c in candidates.values():
+            indices.extend(sorted(company_index[company] for company in c.sources))
+            indptr.append(len(indices))
+
+        counts = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr),
+            shape=(len(candidates), len(companies))
+        )
+        return cls(counts, list(candidates), np.arange(len(companies)), companies)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.counts.shape
+
+    def rows(self, keys: Sequence[str]) -> "TermMatrix":
+        """Matrix restricted to (and reordered as) the given term keys."""
+        row_index = {key: i for i, key in enumerate(self.term_keys)}
+        selected = np.fromiter((row_index[key] for key in keys), dtype=np.int64, count=len(keys))
+        return TermMatrix(self.counts[selected], list(keys), self.document_companies, self.companies)
+
+    def company_name_ranks(self) -> np.ndarray:
+        """Position of each company in name order."""
+        ranks = np.empty(len(self.companies), dtype=np.int64)
+        ranks[sorted(range(len(self.companies)), key=self.companies.__getitem__)] = np.arange(len(self.companies))
+        return ranks
+
+    def term_counts(self) -> np.ndarray:
+        """Total occurrences of each term."""
+        return np.asarray(self.counts.sum(axis=1)).ravel()
+
+    def company_counts(self) -> sparse.csr_matrix:
+        """(terms, companies) occurrence counts summed over each company's documents."""
+        known = self.document_companies >= 0
+        documents = np.flatnonzero(known)
+        to_company = sparse.csr_matrix(
+            (np.ones(len(documents), dtype=np.int32), (documents, self.document_companies[known])),
+            shape=(self.counts.shape[1], len(self.companies))
+        )
+        return (self.counts @ to_company).tocsr()
+
+    def company_incidence(self) -> sparse.csr_matrix:
+        """(terms, companies) 0/1 matrix: 1 where a term appears in any of the company's documents."""
+        incidence = self.company_counts()
+        incidence.data = (incidence.data > 0).astype(np.int32)
+        incidence.eliminate_zeros()
+        incidence.sort_indices()
+        return incidence
+
+    def source_counts(self) -> np.ndarray:
+        """Number of companies each term appears in."""
+        return np.diff(self.company_incidence().indptr)
+
+
+def first_rows_per_column(incidence: sparse.spmatrix, row_rank: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    For each non-empty column, the lowest rank of any row it contains.
+
+    Args:
+        incidence: Sparse matrix
+        row_rank: Rank of each row
+
+    Returns:
+        (column indices, their lowest row rank) for columns with at least one entry
+    """
+    csc = incidence.tocsc()
+    columns = np.flatnonzero(np.diff(csc.indptr))
+    if len(columns) == 0:
+        return columns, columns
+    first = np.minimum.reduceat(row_rank[csc.indices], csc.indptr[columns])
+    return columns, first
@@ -0,0 +1,342 @@
+"""
+Term Store Module
+Handles compact in-memory storage of merged candidate terms.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator, Mapping, Set as AbstractSet
+from typing import Optional
+
+import numpy as np
+from scipy import sparse
+
+from .extractor import CandidateTerm
+from .term_matrix import TermMatrix
+
+
+# Buffered (term, company, count) entries are folded into the company matrix this many at a time
+COMPANY_BUFFER_ENTRIES = 1 << 20
+
+
+class Interner:
+    """Assigns stable integer IDs to strings, in first-seen order."""
+
+    __slots__ = ("ids", "names")
+
+    def __init__(self):
+        self.ids: dict[str, int] = {}
+        self.names: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def id_for(self, name: str) -> int:
+        """ID of name, assigning the next free one if it's new."""
+        id_ = self.ids.get(name)
+        if id_ is None:
+            id_ = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return id_
+
+    def mask_for(self, names: Iterable[str]) -> int:
+        """Bitmask with the bit of each name's ID set (for small vocabularies like signals)."""
+        mask = 0
+        for name in names:
+            mask |= 1 << self.id_for(name)
+        return mask
+
+    def ids_for(self, names: Iterable[str]) -> array:
+        """Sorted array of the names' IDs."""
+        return array("i", sorted({self.id_for(name) for name in names}))
+
+
+def merge_ids(ids: array, new_ids: array) -> None:
+    """Insert sorted new_ids into the sorted array ids, in place, skipping IDs already present."""
+    for id_ in new_ids:
+        if ids and id_ > ids[-1]:
+            ids.append(id_)
+            continue
+        i = bisect_left(ids, id_)
+        if i == len(ids) or ids[i] != id_:
+            ids.insert(i, id_)
+
+
+class InternedSet(AbstractSet):
+    """Read-only set of interned strings backed by an integer bitmask."""
+
+    __slots__ = ("mask", "interner")
+
+    def __init__(self, mask: int, interner: Interner):
+        self.mask = mask
+        self.interner = interner
+
+    def __len__(self) -> int:
+        return self.mask.bit_count()
+
+    def __iter__(self) -> Iterator[str]:
+        mask = self.mask
+        names = self.interner.names
+        while mask:
+            low_bit = mask & -mask
+            yield names[low_bit.bit_length() - 1]
+            mask ^= low_bit
+
+    def __contains__(self, name: object) -> bool:
+        id_ = self.interner.ids.get(name)
+        return id_ is not None and (self.mask >> id_) & 1 == 1
+
+    def __repr__(self) -> str:
+        return f"InternedSet({sorted(self)!r})"
+
+
+class InternedIdSet(AbstractSet):
+    """
+    Read-only set of interned strings backed by a sorted array of their IDs.
+
+    Unlike a bitmask, its size and the cost of iterating it depend only on
+    how many members it has, not on how large their IDs are - used for
+    company sources, where there can be many thousands of IDs.
+    """
+
+    __slots__ = ("ids", "interner")
+
+    def __init__(self, ids: array, interner: Interner):
+        self.ids = ids
+        self.interner = interner
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[str]:
+        names = self.interner.names
+        return (names[id_] for id_ in self.ids)
+
+    def __contains__(self, name: object) -> bool:
+        id_ = self.interner.ids.get(name)
+        if id_ is None:
+            return False
+        i = bisect_left(self.ids, id_)
+        return i < len(self.ids) and self.ids[i] == id_
+
+    def __repr__(self) -> str:
+        return f"InternedIdSet({sorted(self)!r})"
+
+
+class TermRecord:
+    """Merged counts for one term. Sources are a sorted array of company IDs; signals a bitmask."""
+
+    __slots__ = ("term", "forms", "count", "sources", "signals")
+
+    def __init__(self, term: str, forms: tuple[str, ...], count: int, sources: array, signals: int):
+        self.term = term
+        self.forms = forms
+        self.count = count
+        self.sources = sources
+        self.signals = signals
+
+
+class CandidateView:
+    """
+    CandidateTerm-compatible view of a TermRecord.
+
+    Sources and signals are exposed as read-only sets over interned IDs, so
+    len() is O(1) and nothing is decoded unless it's iterated. Setting term writes
+    through to the record.
+    """
+
+    __slots__ = ("_record", "_store")
+
+    def __init__(self, record: TermRecord, store: "TermStore"):
+        self._record = record
+        self._store = store
+
+    @property
+    def term(self) -> str:
+        return self._record.term
+
+    @term.setter
+    def term(self, value: str) -> None:
+        self._record.term = value
+
+    @property
+    def count(self) -> int:
+        return self._record.count
+
+    @property
+    def original_forms(self) -> frozenset[str]:
+        return frozenset(self._record.forms)
+
+    @property
+    def sources(self) -> InternedIdSet:
+        return InternedIdSet(self._record.sources, self._store.companies)
+
+    @property
+    def signals(self) -> InternedSet:
+        return InternedSet(self._record.signals, self._store.signals)
+
+    def __repr__(self) -> str:
+        return (f"CandidateView(term={self.term!r}, count={self.count}, "
+                f"sources={len(self.sources)}, signals={sorted(self.signals)!r})")
+
+
+class TermStore(Mapping):
+    """
+    Compact replacement for the merged dict[str, CandidateTerm].
+
+    Terms get integer IDs in first-seen order (the same order the merged
+    dict had); companies and signals are interned once and referenced by
+    ID (sorted ID arrays for companies, bitmasks for the few signals). Maps term keys to CandidateViews, so filters and output
+    writers work on it unchanged.
+
+    Each added document's counts are summed into a sparse term x company
+    matrix as it arrives, so memory grows with the distinct (term, company)
+    pairs rather than with every document's postings. Per-document columns
+    are only kept with keep_documents (corpus embeddings need them).
+    """
+
+    def __init__(self, keep_documents: bool = False):
+        """
+        Args:
+            keep_documents: Also keep every document's (term ID, count) entries, so matrix()
+                has one column per document instead of one per company
+        """
+        self.companies = Interner()
+        self.signals = Interner()
+        self.term_ids: dict[str, int] = {}
+        self.records: list[TermRecord] = []
+        self.keep_documents = keep_documents
+        self._num_documents = 0
+
+        # Term x company counts, plus entries not folded into it yet
+        self._company_counts = sparse.csr_matrix((0, 0), dtype=np.int64)
+        self._buffer_terms = array("i")
+        self._buffer_companies = array("i")
+        self._buffer_counts = array("q")
+
+        # Document columns (keep_documents only), CSC style: entries of document d are [offsets[d], offsets[d + 1])
+        self._entry_terms = array("i")
+        self._entry_counts = array("i")
+        self._document_offsets = array("q", [0])
+        self._document_companies = array("i")
+
+    @property
+    def num_documents(self) -> int:
+        return self._num_documents
+
+    def add(self, candidates: dict[str, CandidateTerm], company: Optional[str] = None) -> None:
+        """
+        Fold one document's candidates into the store.
+
+        Args:
+            candidates: Candidate dictionary from a single document
+            company: The document's company (default: taken from its candidates' sources)
+        """
+        if company is None and candidates:
+            company = min(next(iter(candidates.values())).sources, default=None)
+        company_id = -1 if company is None else self.companies.id_for(company)
+        self._num_documents += 1
+        if self.keep_documents:
+            self._document_companies.append(company_id)
+
+        for key, candidate in candidates.items():
+            sources = self.companies.ids_for(candidate.sources)
+            signals = self.signals.mask_for(candidate.signals)
+
+            term_id = self.term_ids.get(key)
+            if term_id is None:
+                term_id = self.term_ids[key] = len(self.records)
+                self.records.append(TermRecord(
+                    term=candidate.term,
+                    forms=tuple(sorted(candidate.original_forms)),
+                    count=candidate.count,
+                    sources=sources,
+                    signals=signals
+                ))
+            else:
+                record = self.records[term_id]
+                new_forms = candidate.original_forms.difference(record.forms)
+                if new_forms:
+                    record.forms += tuple(sorted(new_forms))
+                record.count += candidate.count
+                merge_ids(record.sources, sources)
+                record.signals |= signals
+
+            if company_id >= 0:
+                self._buffer_terms.append(term_id)
+                self._buffer_companies.append(company_id)
+                self._buffer_counts.append(candidate.count)
+            if self.keep_documents:
+                self._entry_terms.append(term_id)
+                self._entry_counts.append(candidate.count)
+
+        if self.keep_documents:
+            self._document_offsets.append(len(self._entry_terms))
+        if len(self._buffer_terms) >= COMPANY_BUFFER_ENTRIES:
+            self._fold_company_buffer()
+
+    def _fold_company_buffer(self) -> None:
+        """Sum the buffered entries into the term x company matrix."""
+        shape = (len(self.records), len(self.companies))
+        buffered = sparse.csr_matrix(
+            (
+                np.frombuffer(self._buffer_counts, dtype=np.int64),
+                (np.frombuffer(self._buffer_terms, dtype=np.int32), np.frombuffer(self._buffer_companies, dtype=np.int32))
+            ),
+            shape=shape
+        )
+        company_counts = self._company_counts
+        company_counts.resize(shape)
+        self._company_counts = (company_counts + buffered).tocsr()
+        self._buffer_terms = array("i")
+        self._buffer_companies = array("i")
+        self._buffer_counts = array("q")
+
+    def matrix(self) -> TermMatrix:
+        """
+        Sparse count matrix, rows in term ID order.
+
+        Columns are documents (in order) if the store keeps documents;
+        otherwise each company is one column holding the term's counts
+        summed over the company's documents.
+        """
+        if not self.keep_documents:
+            self._fold_company_buffer()
+            counts = self._company_counts.copy()
+            counts.sort_indices()
+            return TermMatrix(
+                counts=counts,
+                term_keys=list(self.term_ids),
+                document_companies=np.arange(len(self.companies), dtype=np.int64),
+                companies=list(self.companies.names)
+            )
+
+        counts = sparse.csc_matrix(
+            (
+                np.array(self._entry_counts, dtype=np.int32),
+                np.array(self._entry_terms, dtype=np.int32),
+                np.array(self._document_offsets, dtype=np.int64),
+            ),
+            shape=(len(self.records), self.num_documents)
+        )
+        return TermMatrix(
+            counts=counts.tocsr(),
+            term_keys=list(self.term_ids),
+            document_companies=np.array(self._document_companies, dtype=np.int64),
+            companies=list(self.companies.names)
+        )
+
+    def term_id(self, key: str) -> int:
+        return self.term_ids[key]
+
+    def __getitem__(self, key: str) -> CandidateView:
+        return CandidateView(self.records[self.term_ids[key]], self)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.term_ids)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.term_ids